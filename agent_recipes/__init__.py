@@ -5,27 +5,70 @@ This package provides ready-to-use templates for common AI agent workflows.
 """
 
 __version__ = "0.1.0"
-__all__ = ["get_template_path", "list_templates", "run_recipe", "call_recipe"]
+__all__ = [
+    "get_template_path",
+    "get_template_info",
+    "list_templates",
+    "run_recipe",
+    "call_recipe",
+    "call_recipes",
+    "call_recipe_async",
+    "reload_tools",
+]
 
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+# Attributes imported on first access, keeping `import agent_recipes` cheap
+_LAZY_ATTRS = {
+    "call_recipes": ".fanout",
+    "call_recipe_async": ".fanout",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def get_template_info(template_name: str):
+    """Get indexed metadata (path, tags, requirements, tools) for a template."""
+    from .template_index import get_index
+
+    info = get_index().get(template_name)
+    if info is None:
+        raise ValueError(f"Template not found: {template_name}")
+    return info
+
 
 def get_template_path(template_name: str) -> Path:
     """Get the path to a template directory."""
-    templates_dir = Path(__file__).parent / "templates"
-    template_path = templates_dir / template_name
-    if not template_path.exists():
-        raise ValueError(f"Template not found: {template_name}")
-    return template_path
+    return get_template_info(template_name).path
 
 
 def list_templates() -> list:
     """List all available templates."""
-    templates_dir = Path(__file__).parent / "templates"
-    if not templates_dir.exists():
-        return []
-    return [d.name for d in templates_dir.iterdir() if d.is_dir() and not d.name.startswith(".")]
+    from .template_index import get_index
+
+    return get_index().names()
+
+
+def reload_tools(recipe_name: Optional[str] = None) -> None:
+    """
+    Force recipe tools.py modules to be re-imported on their next use.
+
+    Args:
+        recipe_name: Recipe whose tools to reload (default: all recipes)
+    """
+    from .tools_cache import reload_tools as _reload
+
+    _reload(get_template_info(recipe_name).tools_py if recipe_name else None)
 
 
 def run_recipe(
@@ -38,7 +81,9 @@ def run_recipe(
     Run a recipe and return the result.
     
     This is the main entry point for programmatically executing recipes.
-    It finds the recipe, loads its tools, and executes the workflow.
+    It finds the recipe, loads its tools, and executes the workflow. When
+    AGENT_RECIPES_SOCKET names a running recipe server (see
+    ``agent_recipes.server``), the run is dispatched to it instead.
     
     Args:
         recipe_name: Name of the recipe template (e.g., "wordpress-publisher")
@@ -49,6 +94,10 @@ def run_recipe(
     Returns:
         Dict with 'output' key containing the workflow result
         
+    Raises:
+        RecipeRequirementsError: If ``variables`` are given and the recipe's
+            ``metadata.requires`` env vars or variables are missing
+        
     Example:
         from agent_recipes import run_recipe
         
@@ -58,46 +107,69 @@ def run_recipe(
         )
         print(result['output'])
     """
+    # Dispatch to a warm recipe server when one is configured
+    from .server import get_client
+    
+    client = get_client()
+    if client is not None:
+        try:
+            return client.run_recipe(recipe_name, input_data, variables, verbose)
+        except OSError as e:
+            import logging
+
+            logging.getLogger(__name__).warning(
+                f"Recipe server unavailable ({e}); running {recipe_name} in-process"
+            )
+    
+    return _run_recipe_local(recipe_name, input_data, variables, verbose)
+
+
+def _run_recipe_local(
+    recipe_name: str,
+    input_data: Optional[str] = None,
+    variables: Optional[Dict[str, Any]] = None,
+    verbose: bool = False,
+) -> Dict[str, Any]:
+    """
+    Run a recipe in this process.
+    
+    The recipe is built from the cached, pre-parsed agents.yaml. When
+    ``variables`` are given, the recipe's declared requirements (env vars
+    and variables) are checked first.
+    
+    Raises:
+        RecipeRequirementsError: If variables were given and a declared
+            requirement is missing
+    """
     # Lazy import to avoid circular dependencies
-    from praisonaiagents.workflows import WorkflowManager
-    import importlib.util
-    import sys
+    from .recipe_compiler import compile_recipe
+    from .tools_cache import load_tools
     
-    # Get recipe path
-    recipe_path = get_template_path(recipe_name)
-    agents_yaml = recipe_path / "agents.yaml"
+    # Resolve the recipe from the template index
+    info = get_template_info(recipe_name)
+    agents_yaml = info.agents_yaml
     
-    if not agents_yaml.exists():
+    if not info.has_agents_yaml:
         raise ValueError(f"Recipe {recipe_name} does not have agents.yaml")
     
-    # Load tools from recipe's tools.py if it exists
+    # Parsed once per content hash; nested call_recipe runs pass no
+    # variables and rely on input_data, so they are not validated
+    compiled = compile_recipe(agents_yaml)
+    if variables is not None:
+        compiled.validate(variables)
+    
+    # Load tools from recipe's tools.py if it exists (cached per process)
     tool_registry = {}
-    tools_py = recipe_path / "tools.py"
-    if tools_py.exists():
-        # Dynamically import the tools module
-        spec = importlib.util.spec_from_file_location(f"{recipe_name}_tools", tools_py)
-        tools_module = importlib.util.module_from_spec(spec)
-        sys.modules[f"{recipe_name}_tools"] = tools_module
-        spec.loader.exec_module(tools_module)
-        
-        # Get tools from the module's TOOLS dict or get_all_tools function
-        if hasattr(tools_module, 'TOOLS'):
-            tool_registry = tools_module.TOOLS
-        elif hasattr(tools_module, 'get_all_tools'):
-            for tool in tools_module.get_all_tools():
-                tool_registry[tool.__name__] = tool
+    if info.has_tools:
+        tool_registry = load_tools(info.tools_py, f"{recipe_name}_tools").registry
     
     # Execute the workflow
-    manager = WorkflowManager()
-    result = manager.execute_yaml(
-        agents_yaml,
-        input_data=input_data,
-        variables=variables or {},
-        tool_registry=tool_registry,
-        verbose=verbose
-    )
-    
-    return result
+    workflow = compiled.build_workflow(tool_registry)
+    if variables:
+        workflow.variables.update(variables)
+    if verbose:
+        workflow.verbose = verbose
+    return workflow.start(input_data or "")
 
 
 def call_recipe(recipe_name: str, input_data: str = "") -> str:
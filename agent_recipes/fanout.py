@@ -0,0 +1,120 @@
+"""
+Concurrent fan-out for nested recipe calls.
+
+``call_recipe`` runs one sub-recipe and blocks until it finishes. An
+orchestrator calling several independent sub-recipes can use
+``call_recipes`` (thread pool) or ``call_recipe_async`` (asyncio) to run
+them concurrently. Each call's output, error and duration is captured
+individually so one failing sub-recipe does not hide the others.
+"""
+
+import asyncio
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+RecipeCallSpec = Union[str, Tuple[str, str], Dict[str, Any]]
+
+
+def _normalize(call: RecipeCallSpec) -> Tuple[str, str]:
+    if isinstance(call, str):
+        return call, ""
+    if isinstance(call, dict):
+        return call["recipe_name"], call.get("input_data", "")
+    recipe_name, input_data = call
+    return recipe_name, input_data
+
+
+def _timed_call(recipe_name: str, input_data: str) -> Dict[str, Any]:
+    from . import run_recipe
+
+    start = time.monotonic()
+    record: Dict[str, Any] = {"recipe": recipe_name, "output": None, "error": None}
+    try:
+        result = run_recipe(recipe_name=recipe_name, input_data=input_data, verbose=False)
+        record["output"] = str(result.get("output", ""))
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["duration_sec"] = round(time.monotonic() - start, 3)
+    return record
+
+
+def call_recipes(
+    calls: Sequence[RecipeCallSpec],
+    max_workers: int = 4,
+    timeout: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Call several recipes concurrently.
+
+    Args:
+        calls: Recipe names, (recipe_name, input_data) pairs or dicts with
+            recipe_name and input_data keys
+        max_workers: Maximum number of recipes running at once
+        timeout: Seconds to wait for the whole fan-out; calls still pending
+            afterwards are reported with a timeout error
+
+    Returns:
+        One dict per call, in input order, with recipe, output, error and
+        duration_sec keys
+
+    Example:
+        from agent_recipes import call_recipes
+
+        results = call_recipes([
+            ("wordpress-publisher", "ARTICLE_TITLE: ..."),
+            ("ai-image-generator", "A lighthouse at dusk"),
+            "ai-seo-optimizer",
+        ])
+    """
+    specs = [_normalize(call) for call in calls]
+    if not specs:
+        return []
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(specs))),
+                              thread_name_prefix="call-recipe")
+    try:
+        futures = [pool.submit(_timed_call, name, data) for name, data in specs]
+        pending = set(futures)
+        while pending:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                break
+            _, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+    finally:
+        # Do not block on calls that overran the timeout
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    results = []
+    for (name, _), future in zip(specs, futures):
+        if future.done() and not future.cancelled():
+            results.append(future.result())
+        else:
+            results.append({
+                "recipe": name,
+                "output": None,
+                "error": f"TimeoutError: not finished within {timeout}s",
+                "duration_sec": timeout,
+            })
+    return results
+
+
+async def call_recipe_async(
+    recipe_name: str,
+    input_data: str = "",
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> Dict[str, Any]:
+    """
+    Call a recipe without blocking the event loop.
+
+    The recipe runs in a worker thread. Combine calls with
+    ``asyncio.gather`` and pass a shared semaphore to bound concurrency.
+
+    Returns:
+        Dict with recipe, output, error and duration_sec keys
+    """
+    if semaphore is None:
+        return await asyncio.to_thread(_timed_call, recipe_name, input_data)
+    async with semaphore:
+        return await asyncio.to_thread(_timed_call, recipe_name, input_data)
@@ -0,0 +1,246 @@
+"""
+Pluggable HTML extraction for Agent Recipes templates.
+
+Templates that scrape pages (GitHub trending in ai-news-crawler, the
+skill generator's fallback crawler) call the extractor returned by
+``get_extractor()`` instead of building a BeautifulSoup tree themselves.
+The fastest installed backend is used:
+
+- ``selectolax``: lexbor parser, fastest
+- ``lxml``: libxml2 HTML parser, queried with XPath
+- ``bs4``: BeautifulSoup with the stdlib ``html.parser`` (the original
+  code path, slowest)
+
+Set AGENT_RECIPES_HTML_BACKEND to force one. Parsers are only imported
+when a backend is first used.
+"""
+
+import importlib.util
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BACKEND_ENV = "AGENT_RECIPES_HTML_BACKEND"
+
+# Elements whose text is never page content
+NON_CONTENT_TAGS = ("script", "style")
+
+
+def _clean_repo_name(text: str) -> str:
+    return text.replace("\n", "").replace(" ", "")
+
+
+def _clean_stars(text: str) -> str:
+    return text.strip().replace(",", "") or "0"
+
+
+class HTMLExtractor:
+    """
+    Base class for extraction backends.
+
+    Backends implement ``trending_repos`` and ``page_text`` on top of their
+    parser; results are plain strings so they are identical across
+    backends.
+    """
+
+    name = ""
+    module = ""
+
+    @classmethod
+    def available(cls) -> bool:
+        """Whether the backend's parser is installed."""
+        return importlib.util.find_spec(cls.module) is not None
+
+    def trending_repos(self, html: str, limit: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        Extract repository rows from a GitHub trending page.
+
+        Args:
+            html: Page HTML
+            limit: Maximum rows to read
+
+        Returns:
+            Dicts with ``name`` (owner/repo), ``href``, ``description`` and
+            ``stars`` (digits as text, commas removed)
+        """
+        raise NotImplementedError
+
+    def page_text(self, html: str) -> Tuple[str, str]:
+        """
+        Extract a page's title and visible text.
+
+        Script and style contents are dropped; text nodes are stripped and
+        joined with newlines.
+
+        Returns:
+            (title, text)
+        """
+        raise NotImplementedError
+
+
+class SelectolaxExtractor(HTMLExtractor):
+    name = "selectolax"
+    module = "selectolax"
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+
+        self._parser = LexborHTMLParser
+
+    def trending_repos(self, html: str, limit: Optional[int] = None) -> List[Dict[str, str]]:
+        repos = []
+        for row in self._parser(html).css("article.Box-row")[:limit]:
+            link = row.css_first("h2 a")
+            if link is None:
+                continue
+            description = row.css_first("p")
+            stars = row.css_first("a[href*='/stargazers']")
+            repos.append({
+                "name": _clean_repo_name(link.text(strip=True)),
+                "href": link.attributes.get("href") or "",
+                "description": description.text(strip=True) if description is not None else "",
+                "stars": _clean_stars(stars.text(strip=True)) if stars is not None else "0",
+            })
+        return repos
+
+    def page_text(self, html: str) -> Tuple[str, str]:
+        tree = self._parser(html)
+        title = tree.css_first("title")
+        tree.strip_tags(list(NON_CONTENT_TAGS))
+        text = tree.root.text(separator="\n", strip=True) if tree.root is not None else ""
+        lines = [line for line in text.split("\n") if line]
+        return (title.text() if title is not None else ""), "\n".join(lines)
+
+
+class LxmlExtractor(HTMLExtractor):
+    name = "lxml"
+    module = "lxml"
+
+    ROW_XPATH = "//article[contains(concat(' ', normalize-space(@class), ' '), ' Box-row ')]"
+
+    def __init__(self):
+        import lxml.html
+
+        self._fromstring = lxml.html.document_fromstring
+
+    @staticmethod
+    def _text(element) -> str:
+        return "".join(s.strip() for s in element.itertext())
+
+    def trending_repos(self, html: str, limit: Optional[int] = None) -> List[Dict[str, str]]:
+        repos = []
+        for row in self._fromstring(html).xpath(self.ROW_XPATH)[:limit]:
+            link = row.xpath("(.//h2//a)[1]")
+            if not link:
+                continue
+            description = row.xpath("(.//p)[1]")
+            stars = row.xpath("(.//a[contains(@href, '/stargazers')])[1]")
+            repos.append({
+                "name": _clean_repo_name(self._text(link[0])),
+                "href": link[0].get("href") or "",
+                "description": self._text(description[0]) if description else "",
+                "stars": _clean_stars(self._text(stars[0])) if stars else "0",
+            })
+        return repos
+
+    def page_text(self, html: str) -> Tuple[str, str]:
+        root = self._fromstring(html)
+        title = root.find(".//title")
+        title_text = title.text_content() if title is not None else ""
+        for element in root.xpath("|".join(f"//{tag}" for tag in NON_CONTENT_TAGS)):
+            element.drop_tree()
+        lines = [s.strip() for s in root.itertext()]
+        return title_text, "\n".join(line for line in lines if line)
+
+
+class SoupExtractor(HTMLExtractor):
+    name = "bs4"
+    module = "bs4"
+
+    def __init__(self):
+        from bs4 import BeautifulSoup
+
+        self._soup = BeautifulSoup
+
+    def trending_repos(self, html: str, limit: Optional[int] = None) -> List[Dict[str, str]]:
+        repos = []
+        for row in self._soup(html, "html.parser").select("article.Box-row")[:limit]:
+            link = row.select_one("h2 a")
+            if not link:
+                continue
+            description = row.select_one("p")
+            stars = row.select_one("a[href*='/stargazers']")
+            repos.append({
+                "name": _clean_repo_name(link.get_text(strip=True)),
+                "href": link.get("href", ""),
+                "description": description.get_text(strip=True) if description else "",
+                "stars": _clean_stars(stars.get_text(strip=True)) if stars else "0",
+            })
+        return repos
+
+    def page_text(self, html: str) -> Tuple[str, str]:
+        soup = self._soup(html, "html.parser")
+        for element in soup(list(NON_CONTENT_TAGS)):
+            element.decompose()
+        title = soup.title.get_text() if soup.title else ""
+        return title, soup.get_text(separator="\n", strip=True)
+
+
+BACKENDS = {
+    "selectolax": SelectolaxExtractor,
+    "lxml": LxmlExtractor,
+    "bs4": SoupExtractor,
+}
+
+_extractors: Dict[str, HTMLExtractor] = {}
+_lock = threading.Lock()
+
+
+def available_backends() -> List[str]:
+    """Installed backends, fastest first."""
+    return [name for name, backend in BACKENDS.items() if backend.available()]
+
+
+def get_extractor(backend: Optional[str] = None) -> HTMLExtractor:
+    """
+    Return a (cached) extractor.
+
+    Args:
+        backend: Backend name; defaults to AGENT_RECIPES_HTML_BACKEND, then
+            the fastest installed backend
+
+    Raises:
+        ValueError: If the backend name is unknown
+        ImportError: If the backend, or any backend, is not installed
+    """
+    backend = backend or os.environ.get(BACKEND_ENV) or None
+    if backend is None:
+        installed = available_backends()
+        if not installed:
+            raise ImportError("No HTML parser installed; install selectolax, lxml or beautifulsoup4")
+        backend = installed[0]
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown HTML backend: {backend} (choose from {', '.join(BACKENDS)})")
+
+    extractor = _extractors.get(backend)
+    if extractor is None:
+        with _lock:
+            extractor = _extractors.get(backend)
+            if extractor is None:
+                extractor = BACKENDS[backend]()
+                logger.debug(f"Using {backend} HTML extractor")
+                _extractors[backend] = extractor
+    return extractor
+
+
+def trending_repos(html: str, limit: Optional[int] = None) -> List[Dict[str, str]]:
+    """Extract GitHub trending rows with the default extractor."""
+    return get_extractor().trending_repos(html, limit)
+
+
+def page_text(html: str) -> Tuple[str, str]:
+    """Extract (title, text) with the default extractor."""
+    return get_extractor().page_text(html)
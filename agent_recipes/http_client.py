@@ -0,0 +1,241 @@
+"""
+Shared HTTP client for recipe tools.
+
+Recipe tools used to call ``requests.get``/``requests.post`` directly, so
+every request opened a fresh TCP+TLS connection. This module keeps one
+pooled ``requests.Session`` per process with:
+
+- keep-alive connection pools sized by ``AGENT_RECIPES_HTTP_POOL_SIZE``
+- a cap on concurrent requests per host (``AGENT_RECIPES_HTTP_MAX_PER_HOST``);
+  a ``stream=True`` request keeps its slot until the response is closed, so
+  close streamed responses (``with response:``) when done
+- retries with exponential backoff on connection errors, 429 and 5xx
+  responses, honouring ``Retry-After``. Read timeouts and error statuses
+  are only retried for idempotent methods (GET, HEAD, PUT, ...); pass
+  ``retry=True`` to retry a POST that is safe to repeat
+- default (connect, read) timeouts when a caller passes none. Timeouts
+  apply per attempt, so with retries a call can take up to
+  ``(retries + 1) * (connect + read)`` plus backoff and ``Retry-After``
+  waits; use ``HTTPClient(retries=0)`` where the timeout must bound the
+  whole call
+
+Usage mirrors requests:
+
+    from agent_recipes import http_client
+
+    response = http_client.get(url, timeout=10)
+    response = http_client.post(url, json=payload)
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+DEFAULT_TIMEOUT: Tuple[float, float] = (10.0, 30.0)
+DEFAULT_POOL_SIZE = 32
+DEFAULT_MAX_PER_HOST = 8
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+USER_AGENT = "agent-recipes (+https://github.com/MervinPraison/agent-recipes)"
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+class HostLimiter:
+    """Caps the number of in-flight requests per host."""
+
+    def __init__(self, max_per_host: int = DEFAULT_MAX_PER_HOST):
+        self.max_per_host = max_per_host
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def semaphore(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc.lower()
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            with self._lock:
+                semaphore = self._semaphores.setdefault(
+                    host, threading.BoundedSemaphore(self.max_per_host)
+                )
+        return semaphore
+
+
+def _release_on_close(response: Any, semaphore: threading.BoundedSemaphore) -> None:
+    """Release a streamed response's host slot the first time it is closed."""
+    close = response.close
+    released = threading.Lock()
+
+    def _close() -> None:
+        try:
+            close()
+        finally:
+            if released.acquire(blocking=False):
+                semaphore.release()
+
+    response.close = _close
+
+
+class HTTPClient:
+    """
+    Pooled HTTP client with per-host limits, retries and default timeouts.
+
+    Args:
+        pool_size: Connections kept alive per host
+        max_per_host: Maximum concurrent requests to one host
+        retries: Retry attempts for connection errors and retryable statuses
+        backoff: Backoff factor; waits are backoff * 2 ** (attempt - 1)
+        timeout: Default (connect, read) timeout in seconds, per attempt
+    """
+
+    def __init__(
+        self,
+        pool_size: Optional[int] = None,
+        max_per_host: Optional[int] = None,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+    ):
+        self.pool_size = pool_size or _env_int("AGENT_RECIPES_HTTP_POOL_SIZE", DEFAULT_POOL_SIZE)
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.limiter = HostLimiter(
+            max_per_host or _env_int("AGENT_RECIPES_HTTP_MAX_PER_HOST", DEFAULT_MAX_PER_HOST)
+        )
+        self._session = None
+        self._retrying_session = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        """The pooled requests.Session (recreated after fork)."""
+        if self._session is None or self._pid != os.getpid():
+            with self._lock:
+                if self._session is None or self._pid != os.getpid():
+                    self._session = self._create_session()
+                    self._retrying_session = None
+                    self._pid = os.getpid()
+        return self._session
+
+    @property
+    def retrying_session(self):
+        """Session that also retries non-idempotent methods (``retry=True``)."""
+        self.session  # drops a session inherited across fork
+        if self._retrying_session is None:
+            with self._lock:
+                if self._retrying_session is None:
+                    self._retrying_session = self._create_session(retry_all_methods=True)
+        return self._retrying_session
+
+    def _create_session(self, retry_all_methods: bool = False):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # Connection errors are always retried (the request was not sent);
+        # read timeouts and error statuses only for idempotent methods,
+        # unless the caller opted in, so a slow POST is not sent twice
+        retry = Retry(
+            total=self.retries,
+            read=self.retries,
+            connect=self.retries,
+            status=self.retries,
+            backoff_factor=self.backoff,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=None if retry_all_methods else Retry.DEFAULT_ALLOWED_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["User-Agent"] = USER_AGENT
+        return session
+
+    def request(self, method: str, url: str, retry: bool = False, **kwargs: Any):
+        """
+        Send a request through the shared pool (see requests.request).
+
+        The timeout applies to each attempt, not to the call as a whole
+        (see the module docstring). With ``stream=True`` the per-host slot
+        is held until the response is closed.
+
+        Args:
+            retry: Also retry read timeouts and error statuses for
+                non-idempotent methods such as POST; only set this when
+                repeating the request is harmless
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        session = self.retrying_session if retry else self.session
+        semaphore = self.limiter.semaphore(url)
+        semaphore.acquire()
+        try:
+            response = session.request(method, url, **kwargs)
+        except BaseException:
+            semaphore.release()
+            raise
+        if not kwargs.get("stream"):
+            semaphore.release()
+            return response
+        _release_on_close(response, semaphore)
+        return response
+
+    def get(self, url: str, **kwargs: Any):
+        kwargs.setdefault("allow_redirects", True)
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any):
+        return self.request("POST", url, **kwargs)
+
+    def head(self, url: str, **kwargs: Any):
+        kwargs.setdefault("allow_redirects", False)
+        return self.request("HEAD", url, **kwargs)
+
+    def close(self) -> None:
+        with self._lock:
+            for session in (self._session, self._retrying_session):
+                if session is not None:
+                    session.close()
+            self._session = None
+            self._retrying_session = None
+
+
+_client: Optional[HTTPClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> HTTPClient:
+    """Return the process-wide HTTP client."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HTTPClient()
+    return _client
+
+
+def request(method: str, url: str, **kwargs: Any):
+    return get_client().request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs: Any):
+    return get_client().get(url, **kwargs)
+
+
+def post(url: str, **kwargs: Any):
+    return get_client().post(url, **kwargs)
+
+
+def head(url: str, **kwargs: Any):
+    return get_client().head(url, **kwargs)
@@ -0,0 +1,101 @@
+"""
+Lazy imports for recipe tools modules.
+
+Template tools.py files used to import praisonaiagents (and through it
+litellm, rich, etc.) at module level, so merely loading a recipe's tools
+cost hundreds of milliseconds or failed outright when an optional package
+was missing. ``lazy_import`` returns a stand-in that imports the target on
+first use:
+
+    from agent_recipes.lazy import lazy_import
+
+    VisionAgent = lazy_import("praisonaiagents", "VisionAgent")
+    read_file = lazy_import("praisonaiagents.tools", "read_file")
+    requests = lazy_import("requests")
+
+Calling the stand-in or reading an attribute resolves it. Stand-ins for
+functions keep their ``__name__`` without importing, and expose
+``__wrapped__``/``__doc__`` so tool registries and ``inspect.signature``
+see the real function once it is resolved.
+"""
+
+import importlib
+import threading
+from typing import Any, Optional
+
+_MISSING = object()
+
+
+class LazyObject:
+    """Stand-in for a module, or an attribute of a module, imported on first use."""
+
+    __slots__ = ("_module", "_attr", "_target", "_lock", "__name__", "__qualname__")
+
+    def __init__(self, module: str, attr: Optional[str] = None):
+        object.__setattr__(self, "_module", module)
+        object.__setattr__(self, "_attr", attr)
+        object.__setattr__(self, "_target", _MISSING)
+        object.__setattr__(self, "_lock", threading.Lock())
+        name = attr or module.rpartition(".")[2]
+        object.__setattr__(self, "__name__", name)
+        object.__setattr__(self, "__qualname__", name)
+
+    def _resolve(self) -> Any:
+        target = self._target
+        if target is _MISSING:
+            with self._lock:
+                target = self._target
+                if target is _MISSING:
+                    target = importlib.import_module(self._module)
+                    if self._attr is not None:
+                        target = getattr(target, self._attr)
+                    object.__setattr__(self, "_target", target)
+        return target
+
+    @property
+    def resolved(self) -> bool:
+        """Whether the target has been imported."""
+        return self._target is not _MISSING
+
+    @property
+    def __wrapped__(self) -> Any:
+        return self._resolve()
+
+    @property
+    def __doc__(self) -> Optional[str]:
+        return getattr(self._resolve(), "__doc__", None)
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._resolve(), name, value)
+
+    def __repr__(self) -> str:
+        target = f"{self._module}.{self._attr}" if self._attr else self._module
+        state = "resolved" if self.resolved else "unresolved"
+        return f"<lazy {target} ({state})>"
+
+
+def lazy_import(module: str, attr: Optional[str] = None) -> LazyObject:
+    """
+    Import ``module`` (or ``module.attr``) on first use.
+
+    Args:
+        module: Dotted module name
+        attr: Attribute of the module to import, as in ``from module import attr``
+
+    Returns:
+        A LazyObject standing in for the module or attribute
+    """
+    return LazyObject(module, attr)
+
+
+def resolve(obj: Any) -> Any:
+    """Return the real object behind a LazyObject, or obj unchanged."""
+    if isinstance(obj, LazyObject):
+        return obj._resolve()
+    return obj
@@ -0,0 +1,288 @@
+"""
+Persistent cache for LLM responses.
+
+Stores completions in a sqlite database keyed on model, system prompt,
+prompt, temperature and max_tokens, so repeated prompts (recurring claims,
+the same story enriched on every run, reruns) are answered locally. Entries
+expire after a TTL and the least recently used ones are evicted once the
+cache exceeds its size limit. Hit and miss counters and the total size are
+kept in the database, so they cover every process sharing it. Reads do not
+write: access times and counters are buffered and flushed in batches.
+
+The cache is opt-in: the shared ``LLMClient`` only uses it when
+``AGENT_RECIPES_LLM_CACHE`` is ``on`` (default location) or a database
+path, and even then only for deterministic (temperature 0) requests unless
+a call passes ``cache=True``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_ENV = "AGENT_RECIPES_LLM_CACHE"
+DEFAULT_LLM_CACHE_PATH = Path.home() / ".cache" / "agent-recipes" / "llm.sqlite"
+DEFAULT_TTL_SEC = 7 * 24 * 3600
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Buffered access times and counters are written after this many reads or
+# seconds, whichever comes first
+FLUSH_EVERY = 64
+FLUSH_INTERVAL_SEC = 5.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at);
+CREATE INDEX IF NOT EXISTS responses_created ON responses (created_at);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def cache_key(
+    prompt: str,
+    model: str,
+    temperature: Optional[float],
+    max_tokens: int,
+    system: Optional[str] = None,
+) -> str:
+    """Stable key for a completion request."""
+    payload = json.dumps(
+        {
+            "model": model,
+            "system": system,
+            "prompt": prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    sqlite-backed LLM response cache with TTL and LRU size eviction.
+
+    Args:
+        path: Database file
+        ttl_sec: Entries older than this are ignored and pruned (None: never)
+        max_bytes: Evict least recently used entries beyond this total size
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_LLM_CACHE_PATH,
+        ttl_sec: Optional[float] = DEFAULT_TTL_SEC,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+    ):
+        self.path = Path(path)
+        self.ttl_sec = ttl_sec
+        self.max_bytes = max_bytes
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._touched: Dict[str, float] = {}
+        self._pending: Dict[str, int] = {}
+        self._reads = 0
+        self._flushed_at = time.monotonic()
+
+    @classmethod
+    def from_env(cls) -> Optional["LLMCache"]:
+        """
+        Cache configured by AGENT_RECIPES_LLM_CACHE.
+
+        Returns None (no cache) unless the variable is ``on``/``1``/``true``
+        (default location) or a database path.
+        """
+        value = os.environ.get(LLM_CACHE_ENV, "").strip()
+        if value.lower() in ("", "off", "0", "false", "no"):
+            return None
+        if value.lower() in ("on", "1", "true", "yes"):
+            return cls()
+        return cls(value)
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections must not be shared across fork
+        if self._conn is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            with conn:
+                # Seed the running total once for databases created without it
+                conn.execute(
+                    "INSERT OR IGNORE INTO counters (name, value) "
+                    "SELECT 'bytes', COALESCE(SUM(size), 0) FROM responses"
+                )
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def _add(self, conn: sqlite3.Connection, name: str, amount: int) -> None:
+        conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount),
+        )
+
+    def _flush(self, conn: sqlite3.Connection) -> None:
+        """Write buffered access times and counters (caller holds the lock)."""
+        if self._touched:
+            conn.executemany(
+                "UPDATE responses SET accessed_at = MAX(accessed_at, ?) WHERE key = ?",
+                [(at, key) for key, at in self._touched.items()],
+            )
+        for name, amount in self._pending.items():
+            self._add(conn, name, amount)
+        self._touched.clear()
+        self._pending.clear()
+        self._reads = 0
+        self._flushed_at = time.monotonic()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response, or None on a miss."""
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                hit = row is not None and (self.ttl_sec is None or now - row[1] <= self.ttl_sec)
+                if hit:
+                    self._touched[key] = now
+                counter = "hits" if hit else "misses"
+                self._pending[counter] = self._pending.get(counter, 0) + 1
+                self._reads += 1
+                if self._reads >= FLUSH_EVERY or time.monotonic() - self._flushed_at >= FLUSH_INTERVAL_SEC:
+                    with conn:
+                        self._flush(conn)
+                return row[0] if hit else None
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            return None
+
+    def put(self, key: str, response: str, model: str = "") -> None:
+        """Store a response and evict entries beyond the size limit."""
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        try:
+            with self._lock:
+                conn = self._connection()
+                with conn:
+                    self._flush(conn)
+                    previous = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+                    conn.execute(
+                        "INSERT OR REPLACE INTO responses "
+                        "(key, model, response, size, created_at, accessed_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, model, response, size, now, now),
+                    )
+                    self._add(conn, "bytes", size - (previous[0] if previous else 0))
+                    self._evict(conn, now)
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    def _total_bytes(self, conn: sqlite3.Connection) -> int:
+        row = conn.execute("SELECT value FROM counters WHERE name = 'bytes'").fetchone()
+        return row[0] if row else 0
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> int:
+        removed = 0
+        freed = 0
+        if self.ttl_sec is not None:
+            cutoff = now - self.ttl_sec
+            # Range scans on the created_at index, so only expired rows are read
+            expired, expired_size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses WHERE created_at < ?", (cutoff,)
+            ).fetchone()
+            if expired:
+                conn.execute("DELETE FROM responses WHERE created_at < ?", (cutoff,))
+                removed += expired
+                freed += expired_size
+        if self.max_bytes is not None:
+            excess = self._total_bytes(conn) - freed - self.max_bytes
+            if excess > 0:
+                victims = []
+                for key, size in conn.execute(
+                    "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+                ):
+                    victims.append((key,))
+                    freed += size
+                    excess -= size
+                    if excess <= 0:
+                        break
+                conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+                removed += len(victims)
+        if freed:
+            self._add(conn, "bytes", -freed)
+        if removed:
+            self._add(conn, "evictions", removed)
+        return removed
+
+    def prune(self) -> int:
+        """Apply TTL and size limits now; return the number of entries removed."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                self._flush(conn)
+                return self._evict(conn, time.time())
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, total size and hit/miss/eviction counters."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                self._flush(conn)
+            entries = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            counters = dict(conn.execute("SELECT name, value FROM counters").fetchall())
+        hits = counters.get("hits", 0)
+        misses = counters.get("misses", 0)
+        return {
+            "path": str(self.path),
+            "entries": entries,
+            "size_bytes": counters.get("bytes", 0),
+            "hits": hits,
+            "misses": misses,
+            "evictions": counters.get("evictions", 0),
+            "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            conn = self._connection()
+            self._touched.clear()
+            self._pending.clear()
+            with conn:
+                conn.execute("DELETE FROM responses")
+                conn.execute("DELETE FROM counters")
+                conn.execute("INSERT INTO counters (name, value) VALUES ('bytes', 0)")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                try:
+                    with self._conn:
+                        self._flush(self._conn)
+                except sqlite3.Error as e:
+                    logger.warning(f"LLM cache flush failed: {e}")
+                self._conn.close()
+            self._conn = None
@@ -0,0 +1,476 @@
+"""
+Shared LLM client for recipe tools.
+
+Templates used to carry their own copy of ``call_llm``, each doing one
+blocking POST to ``/v1/chat/completions``. They now call through one
+process-wide ``LLMClient`` that provides:
+
+- connection reuse through the pooled ``agent_recipes.http_client``
+- request coalescing: identical in-flight deterministic requests share one
+  call, and ``complete_many`` sends a batch of prompts concurrently
+- token-bucket rate limiting on requests and estimated tokens per minute
+- retries with exponential backoff on rate limits, server errors and
+  connection failures
+- streaming via ``stream()``
+- pluggable back-ends, including ``StubBackend`` for tests and offline runs
+- an opt-in persistent response cache (``agent_recipes.llm_cache``). By
+  default only deterministic (temperature 0) requests use it; pass
+  ``cache=True`` to cache a sampled request or ``cache=False`` to bypass it
+
+The back-end is chosen with ``AGENT_RECIPES_LLM_BACKEND`` (``openai`` or
+``stub``); ``OPENAI_BASE_URL`` points the OpenAI back-end at any
+compatible server. Limits come from ``AGENT_RECIPES_LLM_RPM``,
+``AGENT_RECIPES_LLM_TPM`` and ``AGENT_RECIPES_LLM_CONCURRENCY``.
+"""
+
+import json
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "gpt-4o-mini"
+DEFAULT_CONCURRENCY = 8
+RETRYABLE_STATUSES = (408, 409, 429, 500, 502, 503, 504)
+
+
+class LLMError(RuntimeError):
+    """An LLM call failed."""
+
+    def __init__(self, message: str, status: Optional[int] = None, retryable: bool = False):
+        self.status = status
+        self.retryable = retryable
+        super().__init__(message)
+
+
+@dataclass(frozen=True)
+class LLMRequest:
+    """One chat completion request."""
+    prompt: str
+    model: str = DEFAULT_MODEL
+    max_tokens: int = 1000
+    temperature: Optional[float] = None
+    system: Optional[str] = None
+
+    def messages(self) -> List[Dict[str, str]]:
+        messages = []
+        if self.system:
+            messages.append({"role": "system", "content": self.system})
+        messages.append({"role": "user", "content": self.prompt})
+        return messages
+
+    def cache_key(self) -> str:
+        from .llm_cache import cache_key
+
+        return cache_key(self.prompt, self.model, self.temperature, self.max_tokens, self.system)
+
+    def estimated_tokens(self) -> int:
+        """Rough token cost (prompt at ~4 chars per token plus the completion cap)."""
+        return (len(self.prompt) + len(self.system or "")) // 4 + self.max_tokens
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Args:
+        rate: Tokens added per second
+        capacity: Maximum burst size (default: one second's worth, at least 1)
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """
+        Take amount tokens, blocking until they are available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        # Requests larger than the bucket are let through once it is full
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                wait = (amount - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+class OpenAIBackend:
+    """Back-end for the OpenAI (or a compatible) chat completions API."""
+
+    name = "openai"
+
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None, timeout: float = 60):
+        self.base_url = (base_url or os.environ.get("OPENAI_BASE_URL") or "https://api.openai.com/v1").rstrip("/")
+        self.api_key = api_key
+        self.timeout = timeout
+        self._http = None
+
+    @property
+    def http(self):
+        if self._http is None:
+            from .http_client import HTTPClient
+
+            # Retries are handled by LLMClient so the policy lives in one place
+            self._http = HTTPClient(retries=0)
+        return self._http
+
+    def _post(self, request: LLMRequest, stream: bool = False):
+        api_key = self.api_key or os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY not set")
+        payload: Dict[str, Any] = {
+            "model": request.model,
+            "messages": request.messages(),
+            "max_tokens": request.max_tokens,
+        }
+        if request.temperature is not None:
+            payload["temperature"] = request.temperature
+        if stream:
+            payload["stream"] = True
+        try:
+            response = self.http.post(
+                f"{self.base_url}/chat/completions",
+                headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
+                json=payload,
+                timeout=self.timeout,
+                stream=stream,
+            )
+        except OSError as e:
+            # requests' connection errors and timeouts subclass OSError
+            raise LLMError(f"LLM request failed: {e}", retryable=True) from e
+        if response.status_code >= 400:
+            # Release the connection (and its per-host slot) before raising;
+            # a streamed response is otherwise left open
+            try:
+                detail = response.text[:200]
+            finally:
+                response.close()
+            raise LLMError(
+                f"LLM request failed with HTTP {response.status_code}: {detail}",
+                status=response.status_code,
+                retryable=response.status_code in RETRYABLE_STATUSES,
+            )
+        return response
+
+    def complete(self, request: LLMRequest) -> str:
+        response = self._post(request)
+        return response.json()["choices"][0]["message"]["content"]
+
+    def stream(self, request: LLMRequest) -> Iterator[str]:
+        response = self._post(request, stream=True)
+        with response:
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                choices = json.loads(data).get("choices") or []
+                if choices:
+                    content = (choices[0].get("delta") or {}).get("content")
+                    if content:
+                        yield content
+
+
+class StubBackend:
+    """
+    Local back-end that never touches the network.
+
+    Args:
+        responder: Maps a request to its response text; a dict maps prompts
+            to responses. By default the response echoes the prompt.
+        delay: Seconds to sleep per call, to simulate latency
+    """
+
+    name = "stub"
+
+    def __init__(
+        self,
+        responder: Optional[Union[Callable[[LLMRequest], str], Dict[str, str]]] = None,
+        delay: float = 0.0,
+    ):
+        self.responder = responder
+        self.delay = delay
+        self.calls: List[LLMRequest] = []
+        self._lock = threading.Lock()
+
+    def complete(self, request: LLMRequest) -> str:
+        with self._lock:
+            self.calls.append(request)
+        if self.delay:
+            time.sleep(self.delay)
+        if callable(self.responder):
+            return self.responder(request)
+        if isinstance(self.responder, dict):
+            return self.responder.get(request.prompt, "")
+        return f"[stub {request.model}] {request.prompt}"
+
+    def stream(self, request: LLMRequest) -> Iterator[str]:
+        text = self.complete(request)
+        for index, word in enumerate(text.split(" ")):
+            yield word if index == 0 else " " + word
+
+
+_BACKENDS: Dict[str, Callable[[], Any]] = {
+    "openai": OpenAIBackend,
+    "stub": StubBackend,
+}
+
+
+def _env_float(name: str) -> Optional[float]:
+    value = os.environ.get(name)
+    return float(value) if value else None
+
+
+class LLMClient:
+    """
+    Rate-limited, retrying, coalescing LLM client.
+
+    Args:
+        backend: Back-end instance (default: from AGENT_RECIPES_LLM_BACKEND)
+        max_concurrency: Maximum concurrent calls
+        requests_per_minute: Request rate limit (None: unlimited)
+        tokens_per_minute: Estimated token rate limit (None: unlimited)
+        max_retries: Retries for transient failures
+        backoff: Base backoff in seconds, doubled per attempt with jitter
+        cache: Response cache consulted before calling the back-end
+    """
+
+    def __init__(
+        self,
+        backend: Any = None,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        cache: Any = None,
+    ):
+        if backend is None:
+            name = os.environ.get("AGENT_RECIPES_LLM_BACKEND", "openai")
+            if name not in _BACKENDS:
+                raise ValueError(f"Unknown LLM backend: {name}")
+            backend = _BACKENDS[name]()
+        self.backend = backend
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.cache = cache
+        self.request_bucket = (
+            TokenBucket(requests_per_minute / 60.0) if requests_per_minute else None
+        )
+        self.token_bucket = (
+            TokenBucket(tokens_per_minute / 60.0, capacity=tokens_per_minute) if tokens_per_minute else None
+        )
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._inflight: Dict[LLMRequest, Future] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "LLMClient":
+        from .llm_cache import LLMCache
+
+        concurrency = _env_float("AGENT_RECIPES_LLM_CONCURRENCY")
+        return cls(
+            cache=LLMCache.from_env(),
+            max_concurrency=int(concurrency) if concurrency else DEFAULT_CONCURRENCY,
+            requests_per_minute=_env_float("AGENT_RECIPES_LLM_RPM"),
+            tokens_per_minute=_env_float("AGENT_RECIPES_LLM_TPM"),
+        )
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_concurrency, thread_name_prefix="llm"
+                    )
+        return self._executor
+
+    def _throttle(self, request: LLMRequest) -> None:
+        if self.request_bucket is not None:
+            self.request_bucket.acquire()
+        if self.token_bucket is not None:
+            self.token_bucket.acquire(request.estimated_tokens())
+
+    def _with_retries(self, func: Callable[[], Any]) -> Any:
+        attempt = 0
+        while True:
+            try:
+                return func()
+            except LLMError as e:
+                if not e.retryable or attempt >= self.max_retries:
+                    raise
+                delay = self.backoff * (2 ** attempt) * (0.5 + random.random())
+                attempt += 1
+                logger.warning(f"{e}; retrying in {delay:.1f}s ({attempt}/{self.max_retries})")
+                time.sleep(delay)
+
+    def _call(self, request: LLMRequest, cache_key: Optional[str] = None) -> str:
+        def _once():
+            self._throttle(request)
+            return self.backend.complete(request)
+        response = self._with_retries(_once)
+        if cache_key is not None:
+            self.cache.put(cache_key, response, model=request.model)
+        return response
+
+    def submit(self, request: LLMRequest, cache: Optional[bool] = None) -> "Future[str]":
+        """
+        Schedule a request on the client's pool.
+
+        Cached responses are returned as completed futures. Identical
+        requests already in flight share the same future when they may also
+        share a cached answer (temperature 0 or ``cache=True``); sampled
+        requests each get their own completion.
+
+        Args:
+            request: Request to send
+            cache: Whether to use the response cache for this call; None
+                uses it only for deterministic (temperature 0) requests, so
+                sampled output is not frozen across runs
+        """
+        if cache is None:
+            cache = request.temperature == 0
+        cache_key = None
+        if cache and self.cache is not None:
+            cache_key = request.cache_key()
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                future: Future = Future()
+                future.set_result(cached)
+                return future
+
+        executor = self.executor
+        if not cache:
+            return executor.submit(self._call, request, cache_key)
+        with self._lock:
+            future = self._inflight.get(request)
+            if future is not None:
+                return future
+            future = executor.submit(self._call, request, cache_key)
+            self._inflight[request] = future
+
+        def _forget(done: Future) -> None:
+            with self._lock:
+                if self._inflight.get(request) is done:
+                    del self._inflight[request]
+        future.add_done_callback(_forget)
+        return future
+
+    def complete(self, prompt: str, cache: Optional[bool] = None, **kwargs: Any) -> str:
+        """Return the completion for one prompt."""
+        request = LLMRequest(prompt=prompt, **kwargs)
+        return self.submit(request, cache=cache).result()
+
+    def complete_many(
+        self,
+        prompts: Sequence[str],
+        return_exceptions: bool = False,
+        cache: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> List[Union[str, BaseException]]:
+        """
+        Complete several prompts concurrently.
+
+        Args:
+            prompts: Prompts sharing the same model and parameters
+            return_exceptions: Return failures in place instead of raising
+                the first one
+            cache: Whether to use the response cache for these calls (see
+                ``submit``)
+
+        Returns:
+            Completions in prompt order
+        """
+        futures = [self.submit(LLMRequest(prompt=prompt, **kwargs), cache=cache) for prompt in prompts]
+        results: List[Union[str, BaseException]] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+
+    def stream(self, prompt: str, **kwargs: Any) -> Iterator[str]:
+        """
+        Yield the completion for one prompt as it is generated.
+
+        Failures before the first chunk are retried; once output has
+        started, errors are raised to the caller.
+        """
+        request = LLMRequest(prompt=prompt, **kwargs)
+
+        def _open():
+            self._throttle(request)
+            chunks = self.backend.stream(request)
+            return next(chunks, None), chunks
+
+        first, chunks = self._with_retries(_open)
+        if first is not None:
+            yield first
+            yield from chunks
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+_client: Optional[LLMClient] = None
+_client_lock = threading.Lock()
+
+
+def get_llm_client() -> LLMClient:
+    """Return the process-wide LLM client."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = LLMClient.from_env()
+    return _client
+
+
+def set_llm_client(client: Optional[LLMClient]) -> Optional[LLMClient]:
+    """Replace the process-wide LLM client (e.g. with a stub in tests); returns the old one."""
+    global _client
+    with _client_lock:
+        previous, _client = _client, client
+    return previous
+
+
+def call_llm(
+    prompt: str,
+    max_tokens: int = 1000,
+    temperature: Optional[float] = None,
+    model: str = DEFAULT_MODEL,
+    system: Optional[str] = None,
+    cache: Optional[bool] = None,
+) -> str:
+    """Complete one prompt with the shared client (see ``LLMClient.submit`` for ``cache``)."""
+    return get_llm_client().complete(
+        prompt, cache=cache, max_tokens=max_tokens, temperature=temperature, model=model, system=system
+    )
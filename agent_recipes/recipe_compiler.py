@@ -0,0 +1,217 @@
+"""
+Compiled agents.yaml cache.
+
+Parses each recipe's agents.yaml once, keyed by the file's content hash,
+and turns it into a ``CompiledRecipe``:
+
+- ``metadata.requires`` normalized into lists, so ``run_recipe`` can check
+  requirements up front and fail fast
+- ``build_workflow()`` hands the already-parsed data to praisonaiagents'
+  workflow parser, so runs skip reading and YAML-parsing the file
+
+Compiled recipes are kept in memory and, when a cache directory is given
+(or ``AGENT_RECIPES_RECIPE_CACHE_DIR`` is set), the parsed YAML is stored
+on disk as JSON so new processes skip YAML parsing too.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+RECIPE_CACHE_DIR_ENV = "AGENT_RECIPES_RECIPE_CACHE_DIR"
+
+
+class RecipeRequirementsError(ValueError):
+    """Raised when a recipe's declared requirements are not met."""
+
+    def __init__(self, recipe: str, missing_env: List[str], missing_variables: List[str]):
+        self.recipe = recipe
+        self.missing_env = missing_env
+        self.missing_variables = missing_variables
+        parts = []
+        if missing_env:
+            parts.append(f"environment variables {', '.join(missing_env)}")
+        if missing_variables:
+            parts.append(f"variables {', '.join(missing_variables)}")
+        super().__init__(f"Recipe {recipe} is missing {' and '.join(parts)}")
+
+
+def _as_list(value: Any) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(v) for v in value]
+    return [str(value)]
+
+
+@dataclass
+class CompiledRecipe:
+    """A parsed agents.yaml with its declared requirements."""
+    name: str
+    path: Path
+    content_hash: str
+    data: Dict[str, Any]
+    required_env: List[str] = field(default_factory=list)
+    required_variables: List[str] = field(default_factory=list)
+    defaults: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_data(cls, path: Path, content_hash: str, data: Dict[str, Any]) -> "CompiledRecipe":
+        metadata = data.get("metadata") or {}
+        requires = metadata.get("requires") or {}
+        return cls(
+            name=metadata.get("name") or Path(path).parent.name,
+            path=Path(path),
+            content_hash=content_hash,
+            data=data,
+            required_env=_as_list(requires.get("env")),
+            required_variables=_as_list(requires.get("variables")),
+            defaults=dict(data.get("variables") or {}),
+        )
+
+    def missing_requirements(
+        self,
+        variables: Optional[Mapping[str, Any]] = None,
+        env: Optional[Mapping[str, str]] = None,
+    ) -> Tuple[List[str], List[str]]:
+        """Return (missing env vars, missing variables)."""
+        env = os.environ if env is None else env
+        variables = variables or {}
+        missing_env = [name for name in self.required_env if not env.get(name)]
+        missing_variables = [
+            name for name in self.required_variables
+            if name not in variables and name not in self.defaults
+        ]
+        return missing_env, missing_variables
+
+    def validate(
+        self,
+        variables: Optional[Mapping[str, Any]] = None,
+        env: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """
+        Check declared requirements.
+
+        Raises:
+            RecipeRequirementsError: If env vars or variables are missing
+        """
+        missing_env, missing_variables = self.missing_requirements(variables, env)
+        if missing_env or missing_variables:
+            raise RecipeRequirementsError(self.name, missing_env, missing_variables)
+
+    def build_workflow(self, tool_registry: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Build a praisonaiagents Workflow from the parsed recipe.
+
+        Equivalent to ``WorkflowManager.load_yaml(path)`` without reading
+        and parsing the file; each call gets a fresh Workflow built from a
+        copy of the cached data. Falls back to parsing the file when the
+        installed praisonaiagents has no dict-level parser entry point.
+        """
+        from praisonaiagents.workflows.yaml_parser import YAMLWorkflowParser
+
+        parser = YAMLWorkflowParser(tool_registry=tool_registry)
+        normalize = getattr(parser, "_normalize_yaml_config", None)
+        parse_data = getattr(parser, "_parse_workflow_data", None)
+        if normalize is None or parse_data is None:
+            return parser.parse_file(self.path)
+        return parse_data(normalize(copy.deepcopy(self.data)))
+
+
+class RecipeCompiler:
+    """
+    Compiles agents.yaml files and caches the results.
+
+    Files are re-read only when their (mtime, size) changes, and re-parsed
+    only when their content hash changes.
+
+    Args:
+        cache_dir: Directory for the on-disk parse cache (default:
+            $AGENT_RECIPES_RECIPE_CACHE_DIR, or memory only when unset)
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        if cache_dir is None:
+            cache_dir = os.environ.get(RECIPE_CACHE_DIR_ENV) or None
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._by_hash: Dict[str, CompiledRecipe] = {}
+        self._by_path: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self._lock = threading.Lock()
+
+    def _load_data(self, content: bytes, content_hash: str) -> Dict[str, Any]:
+        disk_path = self.cache_dir / f"{content_hash}.json" if self.cache_dir else None
+        if disk_path is not None:
+            try:
+                with open(disk_path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass
+
+        import yaml
+
+        data = yaml.safe_load(content) or {}
+        if not isinstance(data, dict):
+            raise ValueError("agents.yaml must contain a mapping")
+
+        if disk_path is not None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp_path = disk_path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, default=str)
+                os.replace(tmp_path, disk_path)
+            except (OSError, TypeError, ValueError) as e:
+                logger.debug(f"Could not write recipe cache {disk_path}: {e}")
+        return data
+
+    def compile(self, path: Union[str, Path]) -> CompiledRecipe:
+        """Return the compiled recipe for an agents.yaml file."""
+        path = Path(path)
+        key = str(path.resolve())
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        known = self._by_path.get(key)
+        if known is not None and known[0] == stamp:
+            compiled = self._by_hash.get(known[1])
+            if compiled is not None:
+                return compiled
+
+        content = path.read_bytes()
+        content_hash = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            compiled = self._by_hash.get(content_hash)
+            if compiled is None or compiled.path != path:
+                data = self._load_data(content, content_hash)
+                compiled = CompiledRecipe.from_data(path, content_hash, data)
+                self._by_hash[content_hash] = compiled
+            self._by_path[key] = (stamp, content_hash)
+        return compiled
+
+    def clear(self) -> None:
+        """Drop the in-memory cache."""
+        with self._lock:
+            self._by_hash.clear()
+            self._by_path.clear()
+
+
+_compiler: Optional[RecipeCompiler] = None
+_compiler_lock = threading.Lock()
+
+
+def compile_recipe(path: Union[str, Path]) -> CompiledRecipe:
+    """Compile an agents.yaml with the process-wide compiler."""
+    global _compiler
+    if _compiler is None:
+        with _compiler_lock:
+            if _compiler is None:
+                _compiler = RecipeCompiler()
+    return _compiler.compile(path)
@@ -3,10 +3,16 @@ Recipe Runtime - Shared utilities for all Agent-Recipes.
 
 Provides:
 - Output directory management
-- run.json generation
-- Logging setup
+- run.jsonl journal and run.json generation
+- Parallel, cached output hashing
+- Batch execution across many inputs
+- Async runner for I/O-bound recipes
+- Content-addressed result cache
+- Per-stage timing and resource metrics
+- Resumable stage checkpoints
+- Run-scoped logging
 - Dry-run support
-- Safety defaults
+- Safety defaults (no overwrites, resource limits, admission control)
 """
 
 from .core import (
@@ -15,7 +21,21 @@ from .core import (
     RecipeResult,
     create_output_dir,
     write_run_json,
+    recover_run,
     setup_logging,
+    RunLogging,
+)
+from .journal import RunJournal, compact_journal
+from .batch import BatchResult, run_batch
+from .async_runner import AsyncRecipeRunner
+from .cache import ResultCache
+from .metrics import measure, recipe_stage
+from .checkpoint import CheckpointStore
+from .limits import (
+    AdmissionController,
+    AdmissionTimeout,
+    ResourceLimitExceeded,
+    ResourceLimits,
 )
 
 __all__ = [
@@ -24,5 +44,20 @@ __all__ = [
     "RecipeResult",
     "create_output_dir",
     "write_run_json",
+    "recover_run",
     "setup_logging",
+    "RunLogging",
+    "RunJournal",
+    "compact_journal",
+    "BatchResult",
+    "run_batch",
+    "AsyncRecipeRunner",
+    "ResultCache",
+    "measure",
+    "recipe_stage",
+    "CheckpointStore",
+    "ResourceLimits",
+    "ResourceLimitExceeded",
+    "AdmissionController",
+    "AdmissionTimeout",
 ]
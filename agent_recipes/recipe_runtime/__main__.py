@@ -0,0 +1,8 @@
+"""
+Entry point for running as python -m agent_recipes.recipe_runtime
+"""
+
+from .cli import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+Asyncio recipe runner for I/O-bound recipes.
+
+``AsyncRecipeRunner`` is a sibling of ``RecipeRunner`` whose ``_execute``
+is a coroutine, so recipes that mostly wait on HTTP, LLM or subprocess
+calls can share one event loop. It produces the same ``RecipeResult``,
+run.jsonl and run.json as the synchronous runner. Output hashing,
+result-cache and checkpoint I/O, and writing run.json run in worker
+threads so they do not stall the loop.
+"""
+
+import asyncio
+import copy
+import inspect
+import logging
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Union
+
+from .batch import BatchResult, _item_dir_name, write_batch_manifest
+from .core import RecipeConfig, RecipeResult, RecipeRunner, create_output_dir, get_timestamp
+from .limits import ResourceLimitExceeded
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRecipeRunner(RecipeRunner):
+    """
+    Base class for recipes implemented with asyncio.
+
+    Subclasses implement ``async def _execute(self, config)`` and may
+    override ``async def _plan(self, config)``. ``stage()`` and
+    ``recipe_stage`` work as in ``RecipeRunner``, and ``run_stage`` is a
+    coroutine that accepts sync or async stage functions. Stages of
+    concurrent tasks overlap, so their process-wide CPU and I/O numbers
+    are left out (see ``metrics.measure``).
+
+    Example:
+        class FetchRunner(AsyncRecipeRunner):
+            async def _execute(self, config):
+                async with aiohttp.ClientSession() as session:
+                    ...
+
+        result = asyncio.run(FetchRunner("fetch").run(config))
+    """
+
+    async def run(self, config: RecipeConfig) -> RecipeResult:
+        """
+        Execute the recipe with the given configuration.
+
+        Args:
+            config: Recipe configuration
+
+        Returns:
+            RecipeResult with execution details
+        """
+        self._init_run(config)
+
+        try:
+            # Queue on the loop: a thread blocked in acquire() would hold
+            # an executor thread that admitted runs need for their I/O
+            if self.admission is not None:
+                self._admitted_after(await self.admission.acquire_async())
+            # Tag this task's context so run.log only receives its records
+            self._start_run(config, current_context_only=True)
+            self._start_limits(self._cancel_task(asyncio.current_task()))
+
+            if config.dry_run:
+                # Dry run - just plan, don't execute
+                self._mark_dry_run()
+                await self._plan(config)
+            else:
+                # Reuse a cached result or execute the recipe
+                cache_key, entry = await asyncio.to_thread(self._check_cache, config)
+                if entry is None:
+                    await self._execute(config)
+                self._stop_limits()
+                await asyncio.to_thread(self._complete_run, cache_key, entry)
+
+        except asyncio.CancelledError as e:
+            self._stop_limits()
+            if self._limit_violation is None:
+                self._fail_run(e)
+                raise
+            # Cancelled by the limit watchdog
+            self._fail_run(self._limit_violation)
+            raise self._limit_violation from None
+
+        except Exception as e:
+            self._stop_limits()
+            self._fail_run(e)
+            raise
+
+        finally:
+            self._stop_limits()
+            try:
+                await asyncio.to_thread(self._close_run)
+            finally:
+                self._detach_logging()
+                self._release()
+
+        return self._result
+
+    def _run_in_process(self, config: RecipeConfig) -> RecipeResult:
+        return asyncio.run(self.run(config))
+
+    def _cancel_task(self, task: "asyncio.Task") -> Callable[[ResourceLimitExceeded], None]:
+        """Violation handler that cancels the run's task from the watchdog thread."""
+        loop = asyncio.get_running_loop()
+
+        def _interrupt(violation: ResourceLimitExceeded) -> None:
+            loop.call_soon_threadsafe(task.cancel)
+        return _interrupt
+
+    async def run_stage(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        *args: Any,
+        artifacts: Iterable[Union[str, Path]] = (),
+        inputs: Any = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run a checkpointed stage of ``_execute``.
+
+        Same as ``RecipeRunner.run_stage``, but awaited: ``func`` may be a
+        coroutine function or a plain function (called on the loop), and
+        fingerprinting and checkpoint I/O run in a worker thread.
+
+        Example:
+            pages = await self.run_stage(
+                "fetch", self.fetch, config.input_path, artifacts=["pages.json"],
+            )
+        """
+        fingerprint = await asyncio.to_thread(self._stage_fingerprint, name, inputs)
+        skipped, value = await asyncio.to_thread(self._load_checkpoint, name, fingerprint)
+        if skipped:
+            return value
+
+        with self.stage(name):
+            value = func(*args, **kwargs)
+            if inspect.isawaitable(value):
+                value = await value
+        await asyncio.to_thread(self._save_checkpoint, name, fingerprint, artifacts, value)
+        return value
+
+    async def run_many(
+        self,
+        configs: Iterable[RecipeConfig],
+        max_concurrency: int = 16,
+        base_dir: Optional[Union[str, Path]] = None,
+    ) -> BatchResult:
+        """
+        Run the recipe over many inputs concurrently on the current loop.
+
+        Items get their own runner copy and output directory under a shared
+        batch directory, and a batch.json manifest is written, as with
+        ``RecipeRunner.run_many``.
+
+        Args:
+            configs: Item configurations
+            max_concurrency: Maximum number of runs in flight
+            base_dir: Base output directory (default: ./outputs)
+
+        Returns:
+            BatchResult with per-item results in input order
+        """
+        start = time.time()
+        batch_dir = create_output_dir(self.recipe_name, base_dir=base_dir)
+        batch = BatchResult(
+            recipe=self.recipe_name,
+            batch_dir=str(batch_dir),
+            executor="asyncio",
+            max_workers=max_concurrency,
+            started_at=get_timestamp(),
+        )
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run_item(index: int, config: RecipeConfig) -> RecipeResult:
+            if not config.output_dir:
+                item_dir = batch_dir / _item_dir_name(index, config.input_path)
+                config = replace(config, output_dir=str(item_dir))
+            async with semaphore:
+                worker = copy.copy(self)
+                try:
+                    return await worker.run(config)
+                except Exception:
+                    return worker.result
+
+        batch.results = list(await asyncio.gather(
+            *(_run_item(index, config) for index, config in enumerate(configs))
+        ))
+        batch.completed_at = get_timestamp()
+        batch.duration_sec = round(time.time() - start, 2)
+        await asyncio.to_thread(write_batch_manifest, batch_dir, batch)
+        return batch
+
+    async def _plan(self, config: RecipeConfig) -> None:
+        """
+        Plan the recipe execution (for dry-run).
+
+        Override in subclasses to provide planning output.
+        """
+        RecipeRunner._plan(self, config)
+
+    async def _execute(self, config: RecipeConfig) -> None:
+        """
+        Execute the recipe.
+
+        Override in subclasses to implement recipe logic.
+        """
+        raise NotImplementedError("Subclasses must implement async _execute()")
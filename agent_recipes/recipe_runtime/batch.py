@@ -0,0 +1,235 @@
+"""
+Batch execution of a recipe across many inputs.
+
+Each input runs on its own copy of the runner, in its own output directory
+under a shared batch directory, with its own run.log. A ``batch.json``
+manifest aggregating every item's status is written when the batch ends.
+"""
+
+import copy
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .core import (
+    RecipeConfig,
+    RecipeResult,
+    create_output_dir,
+    get_timestamp,
+)
+
+if TYPE_CHECKING:
+    from .core import RecipeRunner
+
+logger = logging.getLogger(__name__)
+
+BATCH_MANIFEST_NAME = "batch.json"
+EXECUTORS = ("thread", "process")
+
+
+@dataclass
+class BatchResult:
+    """Result of a batch of recipe runs."""
+    recipe: str
+    batch_dir: str
+    executor: str
+    max_workers: int
+    started_at: str
+    completed_at: Optional[str] = None
+    results: List[RecipeResult] = field(default_factory=list)
+    duration_sec: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for r in self.results if r.status in ("success", "cached", "dry_run"))
+
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.succeeded
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for batch.json."""
+        return {
+            "recipe": self.recipe,
+            "batch_dir": self.batch_dir,
+            "executor": self.executor,
+            "max_workers": self.max_workers,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
+            "total": len(self.results),
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "duration_sec": self.duration_sec,
+            "items": [
+                {
+                    "index": index,
+                    "input": r.input_path,
+                    "output_dir": r.output_dir,
+                    "status": r.status,
+                    "duration_sec": r.metrics.get("duration_sec"),
+                    "error": r.error,
+                }
+                for index, r in enumerate(self.results)
+            ],
+        }
+
+
+def _item_dir_name(index: int, input_path: str) -> str:
+    """Build a filesystem-safe, unique directory name for a batch item."""
+    stem = Path(input_path.rstrip("/")).stem or "input"
+    stem = re.sub(r"[^A-Za-z0-9._-]+", "_", stem)[:64]
+    return f"{index:05d}-{stem}"
+
+
+def _failed_item(runner: "RecipeRunner", config: RecipeConfig, error: BaseException) -> RecipeResult:
+    """Build the result recorded for an item that failed outside its run."""
+    return RecipeResult(
+        recipe=runner.recipe_name,
+        version=runner.version,
+        status="failed",
+        started_at=get_timestamp(),
+        completed_at=get_timestamp(),
+        input_path=config.input_path,
+        output_dir=config.output_dir or "",
+        config=config.to_dict(),
+        error=str(error) or type(error).__name__,
+    )
+
+
+def _run_item(runner: "RecipeRunner", config: RecipeConfig) -> RecipeResult:
+    """
+    Run one batch item on a private copy of the runner.
+
+    Module-level so it can be pickled for the process executor. Failures
+    are captured in the returned result rather than raised.
+    """
+    worker = copy.copy(runner)
+    worker.isolate_logs = True
+    try:
+        return worker.run(config)
+    except Exception as e:
+        if worker.result is not None:
+            return worker.result
+        return _failed_item(runner, config, e)
+
+
+def run_batch(
+    runner: "RecipeRunner",
+    configs: Iterable[RecipeConfig],
+    max_workers: Optional[int] = None,
+    executor: str = "thread",
+    base_dir: Optional[Union[str, Path]] = None,
+) -> BatchResult:
+    """
+    Run a recipe over many inputs with bounded concurrency.
+
+    Items without an explicit ``output_dir`` get one under a shared,
+    timestamped batch directory. At most ``max_workers`` items run at once
+    and at most twice that many are queued, so very large batches do not
+    materialize every pending future up front.
+
+    Args:
+        runner: Runner to copy for each item
+        configs: Item configurations
+        max_workers: Worker pool size (default: cpu_count)
+        executor: "thread" for I/O-bound recipes, "process" for CPU-bound
+            ones (the runner must then be picklable)
+        base_dir: Base output directory (default: ./outputs)
+
+    Returns:
+        BatchResult with per-item results in input order
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor: {executor}. Use one of {EXECUTORS}")
+
+    max_workers = max_workers or os.cpu_count() or 1
+    start = time.time()
+    batch_dir = create_output_dir(runner.recipe_name, base_dir=base_dir)
+    batch = BatchResult(
+        recipe=runner.recipe_name,
+        batch_dir=str(batch_dir),
+        executor=executor,
+        max_workers=max_workers,
+        started_at=get_timestamp(),
+    )
+
+    # Submit a clean copy so state from earlier runs is not shared or pickled
+    template = copy.copy(runner)
+    template._result = None
+    template._journal = None
+    template._output_dir = None
+    template._log_path = None
+    template._logging = None
+    template._watchdog = None
+    template._limit_lock = None
+    template._subprocess_slots = None
+    template._children = set()
+
+    pool_cls = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+    results: Dict[int, RecipeResult] = {}
+    pending: Dict[Future, Tuple[int, RecipeConfig]] = {}
+
+    def _drain() -> None:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            index, config = pending.pop(future)
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                # The item never produced a result, e.g. the runner could not
+                # be pickled or a worker process died (BrokenProcessPool)
+                logger.error(f"Batch item {index} could not run: {e!r}")
+                results[index] = _failed_item(runner, config, e)
+            logger.info(f"Batch item {index} finished: {results[index].status}")
+
+    with pool_cls(max_workers=max_workers) as pool:
+        for index, config in enumerate(configs):
+            if not config.output_dir:
+                item_dir = batch_dir / _item_dir_name(index, config.input_path)
+                config = replace(config, output_dir=str(item_dir))
+            try:
+                pending[pool.submit(_run_item, template, config)] = (index, config)
+            except Exception as e:
+                # A broken process pool refuses further submissions
+                logger.error(f"Batch item {index} could not be submitted: {e!r}")
+                results[index] = _failed_item(runner, config, e)
+                continue
+            if len(pending) >= max_workers * 2:
+                _drain()
+        while pending:
+            _drain()
+
+    batch.results = [results[i] for i in sorted(results)]
+    batch.completed_at = get_timestamp()
+    batch.duration_sec = round(time.time() - start, 2)
+    write_batch_manifest(batch_dir, batch)
+    return batch
+
+
+def write_batch_manifest(batch_dir: Path, batch: BatchResult) -> Path:
+    """
+    Write batch.json to the batch directory.
+
+    Args:
+        batch_dir: Batch directory
+        batch: Batch result
+
+    Returns:
+        Path to batch.json
+    """
+    manifest_path = Path(batch_dir) / BATCH_MANIFEST_NAME
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(batch.to_dict(), f, indent=2)
+    return manifest_path
@@ -0,0 +1,386 @@
+"""
+Content-addressed result cache for recipe runs.
+
+A run is keyed on the recipe name, recipe version, a content hash of its
+input and its normalized configuration. On a hit the cached outputs are
+hardlinked (or reflinked, or as a last resort copied) into the new output
+directory instead of executing the recipe again.
+
+Cache layout::
+
+    <root>/<key[:2]>/<key>/meta.json
+    <root>/<key[:2]>/<key>/files/<output paths...>
+
+Note that hardlinked outputs share storage with the cache entry, so
+recipes must not modify a previous run's outputs in place. Entries whose
+files have gone missing are treated as misses and replaced on the next store.
+"""
+
+import errno
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .hashing import HASH_CACHE_NAME, HASH_CACHE_TMP_NAME, hash_file
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "AGENT_RECIPES_CACHE_DIR"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "agent-recipes" / "results"
+
+# Config keys that do not affect what a recipe produces
+VOLATILE_CONFIG_KEYS = ("output_dir", "force", "verbose", "dry_run", "config_file", "resume")
+
+# Linux FICLONE ioctl for copy-on-write reflinks (btrfs, xfs)
+_FICLONE = 0x40049409
+
+
+def hash_input(input_path: str) -> str:
+    """
+    Content hash of a local recipe input.
+
+    Files are hashed by content, directories by their sorted relative paths
+    and file contents (hash cache files, which change whenever a directory
+    is re-collected, are skipped).
+    """
+    path = Path(input_path)
+    if path.is_file():
+        return hash_file(path)
+
+    sha256 = hashlib.sha256()
+    for child in sorted(
+        p for p in path.rglob("*")
+        if p.is_file() and p.name not in (HASH_CACHE_NAME, HASH_CACHE_TMP_NAME)
+    ):
+        sha256.update(child.relative_to(path).as_posix().encode("utf-8"))
+        sha256.update(b"\0")
+        sha256.update(hash_file(child).encode("ascii"))
+    return sha256.hexdigest()
+
+
+def normalize_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop config keys that do not influence recipe outputs."""
+    return {k: v for k, v in config.items() if k not in VOLATILE_CONFIG_KEYS}
+
+
+def link_or_copy(src: Path, dst: Path) -> str:
+    """
+    Materialize src at dst as cheaply as the filesystem allows.
+
+    Returns:
+        "hardlink", "reflink" or "copy"
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(src, dst)
+        return "hardlink"
+    except OSError:
+        pass
+
+    try:
+        import fcntl
+
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        shutil.copystat(src, dst)
+        return "reflink"
+    except (ImportError, OSError):
+        if dst.exists():
+            dst.unlink()
+
+    shutil.copy2(src, dst)
+    return "copy"
+
+
+@dataclass
+class CacheEntry:
+    """A cached recipe result."""
+    key: str
+    path: Path
+    recipe: str
+    version: str
+    created_at: float
+    last_used: float
+    size: int
+    outputs: List[str] = field(default_factory=list)
+    source_run: str = ""
+
+    @property
+    def files_dir(self) -> Path:
+        return self.path / "files"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "key": self.key,
+            "recipe": self.recipe,
+            "version": self.version,
+            "created_at": self.created_at,
+            "last_used": self.last_used,
+            "size": self.size,
+            "outputs": self.outputs,
+            "source_run": self.source_run,
+        }
+
+
+class ResultCache:
+    """
+    On-disk, content-addressed cache of recipe outputs.
+
+    Args:
+        root: Cache directory (default: $AGENT_RECIPES_CACHE_DIR or
+            ~/.cache/agent-recipes/results)
+        max_bytes: Evict least recently used entries beyond this size
+        max_age_sec: Evict entries unused for longer than this
+    """
+
+    def __init__(
+        self,
+        root: Optional[Union[str, Path]] = None,
+        max_bytes: Optional[int] = None,
+        max_age_sec: Optional[float] = None,
+    ):
+        if root is None:
+            root = os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.max_age_sec = max_age_sec
+
+    def key_for(
+        self,
+        recipe: str,
+        version: str,
+        input_path: str,
+        config: Dict[str, Any],
+    ) -> str:
+        """Compute the cache key of a run."""
+        payload = json.dumps(
+            {
+                "recipe": recipe,
+                "version": version,
+                "input": hash_input(input_path),
+                "config": normalize_config(config),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def _read_entry(self, entry_dir: Path) -> Optional[CacheEntry]:
+        meta_path = entry_dir / "meta.json"
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        meta.pop("key", None)
+        return CacheEntry(key=entry_dir.name, path=entry_dir, **meta)
+
+    def _write_entry(self, entry: CacheEntry) -> None:
+        tmp_path = entry.path / "meta.json.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry.to_dict(), f, indent=2)
+        os.replace(tmp_path, entry.path / "meta.json")
+
+    def _is_complete(self, entry: CacheEntry) -> bool:
+        """Whether every output file of the entry is still on disk."""
+        return all((entry.files_dir / rel_path).is_file() for rel_path in entry.outputs)
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for key, refreshing its last-used time."""
+        entry = self._read_entry(self._entry_dir(key))
+        if entry is None:
+            return None
+        if self.max_age_sec is not None and time.time() - entry.last_used > self.max_age_sec:
+            self._remove(entry)
+            return None
+        if not self._is_complete(entry):
+            logger.warning(f"Cache entry {key} is missing files; treating it as a miss")
+            return None
+        entry.last_used = time.time()
+        self._write_entry(entry)
+        return entry
+
+    def store(
+        self,
+        key: str,
+        output_dir: Union[str, Path],
+        outputs: List[str],
+        recipe: str,
+        version: str,
+    ) -> CacheEntry:
+        """
+        Store a run's outputs under key.
+
+        Args:
+            key: Cache key from key_for()
+            output_dir: Output directory of the run
+            outputs: Output paths relative to output_dir
+            recipe: Recipe name
+            version: Recipe version
+
+        Returns:
+            The new cache entry, or the existing one if a complete entry
+            was already stored under key
+        """
+        output_dir = Path(output_dir)
+        entry_dir = self._entry_dir(key)
+        existing = self._read_entry(entry_dir)
+        if existing is not None and self._is_complete(existing):
+            # Same key means same outputs; leave the entry other runs may be
+            # materializing from in place
+            return existing
+        staging = entry_dir.with_name(f".{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        if staging.exists():
+            shutil.rmtree(staging)
+
+        size = 0
+        for rel_path in outputs:
+            src = output_dir / rel_path
+            link_or_copy(src, staging / "files" / rel_path)
+            size += src.stat().st_size
+
+        now = time.time()
+        entry = CacheEntry(
+            key=key,
+            path=staging,
+            recipe=recipe,
+            version=version,
+            created_at=now,
+            last_used=now,
+            size=size,
+            outputs=list(outputs),
+            source_run=str(output_dir),
+        )
+        staging.mkdir(parents=True, exist_ok=True)
+        self._write_entry(entry)
+
+        # Move an incomplete entry aside with one rename so no reader sees it
+        # half-deleted, then swap the new entry in
+        stale = entry_dir.with_name(f".{key}.{os.getpid()}.{threading.get_ident()}.old")
+        try:
+            os.rename(entry_dir, stale)
+        except FileNotFoundError:
+            stale = None
+        try:
+            os.replace(staging, entry_dir)
+        except OSError as e:
+            # Another process stored the same key first
+            if e.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+                raise
+            shutil.rmtree(staging, ignore_errors=True)
+        if stale is not None:
+            shutil.rmtree(stale, ignore_errors=True)
+        entry.path = entry_dir
+
+        if self.max_bytes is not None or self.max_age_sec is not None:
+            self.prune()
+        return entry
+
+    def materialize(self, entry: CacheEntry, output_dir: Union[str, Path]) -> Dict[str, int]:
+        """
+        Link a cached entry's outputs into output_dir.
+
+        Returns:
+            Count of files per method ("hardlink", "reflink", "copy")
+
+        Raises:
+            OSError: If a cached file disappeared (e.g. the entry was evicted
+                concurrently); files linked so far are removed again
+        """
+        output_dir = Path(output_dir)
+        methods: Dict[str, int] = {}
+        linked: List[Path] = []
+        try:
+            for rel_path in entry.outputs:
+                dst = output_dir / rel_path
+                if dst.exists():
+                    dst.unlink()
+                method = link_or_copy(entry.files_dir / rel_path, dst)
+                linked.append(dst)
+                methods[method] = methods.get(method, 0) + 1
+        except OSError:
+            for dst in linked:
+                dst.unlink(missing_ok=True)
+            raise
+        return methods
+
+    def entries(self) -> List[CacheEntry]:
+        """List all cache entries, least recently used first."""
+        if not self.root.exists():
+            return []
+        entries = []
+        for shard in self.root.iterdir():
+            if not shard.is_dir():
+                continue
+            for entry_dir in shard.iterdir():
+                if entry_dir.name.startswith("."):
+                    continue
+                entry = self._read_entry(entry_dir)
+                if entry is not None:
+                    entries.append(entry)
+        entries.sort(key=lambda e: e.last_used)
+        return entries
+
+    def total_size(self) -> int:
+        """Total size in bytes of all cached outputs."""
+        return sum(e.size for e in self.entries())
+
+    def _remove(self, entry: CacheEntry) -> None:
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+    def prune(
+        self,
+        max_bytes: Optional[int] = None,
+        max_age_sec: Optional[float] = None,
+    ) -> List[CacheEntry]:
+        """
+        Evict expired entries, then least recently used ones over the size cap.
+
+        Args:
+            max_bytes: Size cap (default: the cache's max_bytes)
+            max_age_sec: Age cap (default: the cache's max_age_sec)
+
+        Returns:
+            Evicted entries
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        max_age_sec = self.max_age_sec if max_age_sec is None else max_age_sec
+
+        entries = self.entries()
+        evicted = []
+        now = time.time()
+
+        if max_age_sec is not None:
+            for entry in list(entries):
+                if now - entry.last_used > max_age_sec:
+                    entries.remove(entry)
+                    evicted.append(entry)
+
+        if max_bytes is not None:
+            total = sum(e.size for e in entries)
+            while entries and total > max_bytes:
+                entry = entries.pop(0)
+                total -= entry.size
+                evicted.append(entry)
+
+        for entry in evicted:
+            self._remove(entry)
+            logger.info(f"Evicted cache entry {entry.key} ({entry.recipe}, {entry.size} bytes)")
+        return evicted
+
+    def clear(self) -> int:
+        """Remove every entry. Returns the number removed."""
+        entries = self.entries()
+        for entry in entries:
+            self._remove(entry)
+        return len(entries)
@@ -0,0 +1,169 @@
+"""
+Stage checkpoints for resumable recipe runs.
+
+When a stage run through ``RecipeRunner.run_stage`` completes, its
+fingerprint, artifacts and (JSON-serializable) return value are saved to
+``.checkpoints/<stage>.json`` in the output directory. A run started with
+``RecipeConfig(resume=<output_dir>)`` reuses that directory and skips every
+stage whose fingerprint still matches and whose artifacts are intact.
+There is no command-line flag for this; front-ends that want one pass
+their output directory through to ``RecipeConfig.resume``.
+
+A stage fingerprint covers the recipe name and version, the input content
+hash, the normalized config, the previous stage's fingerprint (so a re-run
+stage invalidates everything after it) and any extra ``inputs`` the stage
+declares.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+from .cache import hash_input, normalize_config
+from .hashing import hash_file
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_DIR_NAME = ".checkpoints"
+
+
+def run_fingerprint(recipe: str, version: str, input_path: str, config: Dict[str, Any]) -> str:
+    """Fingerprint of everything a run's stages depend on."""
+    if input_path.startswith(("http://", "https://")):
+        input_hash = hashlib.sha256(input_path.encode("utf-8")).hexdigest()
+    else:
+        input_hash = hash_input(input_path)
+    payload = json.dumps(
+        {
+            "recipe": recipe,
+            "version": version,
+            "input": input_hash,
+            "config": normalize_config(config),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def stage_fingerprint(
+    run_fp: str,
+    stage: str,
+    previous: Optional[str] = None,
+    inputs: Any = None,
+) -> str:
+    """Fingerprint of one stage, chained to the previous stage."""
+    payload = json.dumps(
+        {"run": run_fp, "stage": stage, "previous": previous, "inputs": inputs},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CheckpointStore:
+    """Reads and writes stage checkpoints under an output directory."""
+
+    def __init__(self, output_dir: Union[str, Path]):
+        self.output_dir = Path(output_dir)
+        self.root = self.output_dir / CHECKPOINT_DIR_NAME
+
+    def _path(self, stage: str) -> Path:
+        safe = re.sub(r"[^A-Za-z0-9._-]+", "_", stage)
+        return self.root / f"{safe}.json"
+
+    def load(self, stage: str) -> Optional[Dict[str, Any]]:
+        """Return the checkpoint for a stage, if any."""
+        try:
+            with open(self._path(stage), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(
+        self,
+        stage: str,
+        fingerprint: str,
+        artifacts: Iterable[Union[str, Path]] = (),
+        result: Any = None,
+    ) -> Dict[str, Any]:
+        """
+        Record a completed stage.
+
+        Args:
+            stage: Stage name
+            fingerprint: Stage fingerprint
+            artifacts: Files the stage produced (relative to the output dir
+                or absolute paths inside it)
+            result: Stage return value, stored if JSON-serializable
+
+        Returns:
+            The checkpoint record
+        """
+        records = []
+        for artifact in artifacts:
+            path = Path(artifact)
+            if not path.is_absolute():
+                path = self.output_dir / path
+            stat = path.stat()
+            records.append({
+                "path": path.relative_to(self.output_dir).as_posix(),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": hash_file(path),
+            })
+
+        try:
+            json.dumps(result)
+        except (TypeError, ValueError):
+            logger.debug(f"Stage {stage} result is not JSON-serializable; not checkpointed")
+            result = None
+
+        checkpoint = {
+            "stage": stage,
+            "fingerprint": fingerprint,
+            "completed_at": datetime.now(timezone.utc).isoformat(),
+            "artifacts": records,
+            "result": result,
+        }
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._path(stage)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f, indent=2)
+        os.replace(tmp_path, path)
+        return checkpoint
+
+    def is_valid(self, stage: str, fingerprint: str) -> bool:
+        """
+        Check a stage can be skipped.
+
+        The fingerprint must match and every artifact must still exist with
+        the recorded size and either the recorded mtime or content hash.
+        """
+        checkpoint = self.load(stage)
+        if checkpoint is None or checkpoint.get("fingerprint") != fingerprint:
+            return False
+        for record in checkpoint.get("artifacts", []):
+            path = self.output_dir / record["path"]
+            try:
+                stat = path.stat()
+            except OSError:
+                return False
+            if stat.st_size != record["size"]:
+                return False
+            if stat.st_mtime_ns != record["mtime_ns"] and hash_file(path) != record["sha256"]:
+                return False
+        return True
+
+    def clear(self, stage: Optional[str] = None) -> None:
+        """Remove one stage's checkpoint, or all of them."""
+        paths = [self._path(stage)] if stage else list(self.root.glob("*.json"))
+        for path in paths:
+            if path.exists():
+                path.unlink()
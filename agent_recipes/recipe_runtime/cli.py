@@ -0,0 +1,118 @@
+"""
+CLI for the recipe runtime.
+
+Provides command-line interface for:
+- cache list: Show cached recipe results
+- cache stats: Show cache size and entry count
+- cache prune: Evict entries by size and/or age
+- cache clear: Remove every cached result
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from typing import List, Optional
+
+from .cache import ResultCache
+
+_SIZE_UNITS = {"": 1, "k": 1024, "m": 1024 ** 2, "g": 1024 ** 3, "t": 1024 ** 4}
+_AGE_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def parse_size(value: str) -> int:
+    """Parse a size such as 500M or 10G into bytes."""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([kmgt]?)i?b?\s*", value.lower())
+    if not match:
+        raise argparse.ArgumentTypeError(f"Invalid size: {value}")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2)])
+
+
+def parse_age(value: str) -> float:
+    """Parse an age such as 90m, 12h or 7d into seconds."""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*", value.lower())
+    if not match:
+        raise argparse.ArgumentTypeError(f"Invalid age: {value}")
+    return float(match.group(1)) * _AGE_UNITS[match.group(2) or "s"]
+
+
+def format_size(size: int) -> str:
+    """Format bytes for display."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}TB"
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        prog="agent_recipes.recipe_runtime",
+        description="Recipe runtime maintenance commands"
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+
+    # Cache command
+    cache_parser = subparsers.add_parser("cache", help="Inspect and prune the result cache")
+    cache_parser.add_argument("--dir", help="Cache directory (default: $AGENT_RECIPES_CACHE_DIR "
+                                            "or ~/.cache/agent-recipes/results)")
+    cache_sub = cache_parser.add_subparsers(dest="cache_command", help="Cache commands")
+
+    list_parser = cache_sub.add_parser("list", help="List cached results")
+    list_parser.add_argument("--recipe", help="Only show entries for this recipe")
+    list_parser.add_argument("--json", action="store_true",
+                             help="Output as JSON")
+
+    cache_sub.add_parser("stats", help="Show cache size and entry count")
+
+    prune_parser = cache_sub.add_parser("prune", help="Evict entries by size and/or age")
+    prune_parser.add_argument("--max-size", type=parse_size,
+                              help="Keep the cache under this size (e.g., 10G)")
+    prune_parser.add_argument("--max-age", type=parse_age,
+                              help="Evict entries unused for this long (e.g., 7d)")
+
+    cache_sub.add_parser("clear", help="Remove every cached result")
+
+    args = parser.parse_args(argv)
+
+    if args.command != "cache" or not args.cache_command:
+        parser.print_help()
+        sys.exit(1)
+
+    cache = ResultCache(args.dir)
+
+    if args.cache_command == "list":
+        entries = [e for e in cache.entries() if not args.recipe or e.recipe == args.recipe]
+        if args.json:
+            print(json.dumps([e.to_dict() for e in entries], indent=2))
+            return
+        now = time.time()
+        for entry in entries:
+            idle_h = (now - entry.last_used) / 3600
+            print(f"{entry.key[:16]}  {entry.recipe:<30} {entry.version:<8} "
+                  f"{format_size(entry.size):>8}  {len(entry.outputs):>4} files  "
+                  f"idle {idle_h:.1f}h")
+
+    elif args.cache_command == "stats":
+        entries = cache.entries()
+        print(f"Cache: {cache.root}")
+        print(f"Entries: {len(entries)}")
+        print(f"Size: {format_size(sum(e.size for e in entries))}")
+
+    elif args.cache_command == "prune":
+        if args.max_size is None and args.max_age is None:
+            print("Error: specify --max-size and/or --max-age")
+            sys.exit(1)
+        evicted = cache.prune(max_bytes=args.max_size, max_age_sec=args.max_age)
+        freed = sum(e.size for e in evicted)
+        print(f"Evicted {len(evicted)} entries ({format_size(freed)})")
+
+    elif args.cache_command == "clear":
+        print(f"Removed {cache.clear()} entries")
+
+
+if __name__ == "__main__":
+    main()
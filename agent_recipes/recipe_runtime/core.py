@@ -9,14 +9,38 @@ Provides the foundation for all recipe execution including:
 - Safety defaults (no overwrites, resource limits)
 """
 
-import hashlib
+import contextvars
+import inspect
 import json
 import logging
+import logging.handlers
+import multiprocessing
+import os
+import pickle
+import queue
+import subprocess
+import threading
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .hashing import HASH_CACHE_NAME, HASH_CACHE_TMP_NAME, HashCache, hash_file, hash_files
+from .checkpoint import CHECKPOINT_DIR_NAME, CheckpointStore, run_fingerprint, stage_fingerprint
+from .journal import JOURNAL_NAME, RunJournal, compact_journal
+from .limits import (
+    AdmissionController,
+    LimitWatchdog,
+    ResourceLimitExceeded,
+    ResourceLimits,
+)
+from .metrics import measure
+
+if TYPE_CHECKING:
+    from .batch import BatchResult
+    from .cache import CacheEntry, ResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -32,11 +56,12 @@ class RecipeConfig:
     force: bool = False
     verbose: bool = False
     config_file: Optional[str] = None
+    resume: Optional[str] = None
     extra: Dict[str, Any] = field(default_factory=dict)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for run.json."""
-        return {
+        data = {
             "recipe_name": self.recipe_name,
             "input_path": self.input_path,
             "output_dir": self.output_dir,
@@ -44,8 +69,10 @@ class RecipeConfig:
             "dry_run": self.dry_run,
             "force": self.force,
             "verbose": self.verbose,
-            **self.extra,
         }
+        if self.resume:
+            data["resume"] = self.resume
+        return {**data, **self.extra}
 
 
 @dataclass
@@ -70,7 +97,7 @@ class RecipeResult:
     """Result of a recipe execution."""
     recipe: str
     version: str
-    status: str  # success, failed, dry_run
+    status: str  # success, cached, failed, dry_run
     started_at: str
     completed_at: Optional[str] = None
     input_path: str = ""
@@ -97,6 +124,24 @@ class RecipeResult:
             "logs": self.logs,
             "error": self.error,
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RecipeResult":
+        """Build a result from a run.json dictionary."""
+        return cls(
+            recipe=data.get("recipe", ""),
+            version=data.get("version", ""),
+            status=data.get("status", ""),
+            started_at=data.get("started_at") or "",
+            completed_at=data.get("completed_at"),
+            input_path=data.get("input", ""),
+            output_dir=data.get("output_dir", ""),
+            config=data.get("config", {}),
+            outputs=[OutputFile(**o) for o in data.get("outputs", [])],
+            metrics=data.get("metrics", {}),
+            logs=data.get("logs", ""),
+            error=data.get("error"),
+        )
 
 
 def get_timestamp() -> str:
@@ -144,39 +189,72 @@ def create_output_dir(
     return output_dir
 
 
+# Runtime bookkeeping files and directories that are never reported as
+# recipe outputs
+RUNTIME_FILES = {"run.json", "run.log", JOURNAL_NAME, HASH_CACHE_NAME, HASH_CACHE_TMP_NAME}
+RUNTIME_DIRS = {CHECKPOINT_DIR_NAME}
+
+
 def calculate_sha256(path: Path) -> str:
     """Calculate SHA256 hash of a file."""
-    sha256 = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+    return hash_file(path)
 
 
-def collect_outputs(output_dir: Path, include_hash: bool = True) -> List[OutputFile]:
+def collect_outputs(
+    output_dir: Path,
+    include_hash: bool = True,
+    max_workers: Optional[int] = None,
+    use_cache: bool = True,
+) -> List[OutputFile]:
     """
     Collect information about output files.
     
+    Hashes are computed in a thread pool and cached per directory by
+    (path, size, mtime_ns), so re-collecting a resumed run only hashes
+    files that changed.
+    
     Args:
         output_dir: Output directory to scan
         include_hash: Calculate SHA256 hashes
+        max_workers: Hashing thread pool size
+        use_cache: Reuse and update the directory's hash cache
         
     Returns:
         List of OutputFile objects
     """
-    outputs = []
+    output_dir = Path(output_dir)
+    paths = sorted(
+        path for path in output_dir.rglob("*")
+        if path.is_file()
+        and path.name not in RUNTIME_FILES
+        and path.relative_to(output_dir).parts[0] not in RUNTIME_DIRS
+    )
     
-    for path in output_dir.rglob("*"):
-        if path.is_file() and path.name != "run.json" and path.name != "run.log":
-            rel_path = path.relative_to(output_dir)
-            sha256 = calculate_sha256(path) if include_hash else None
-            
-            outputs.append(OutputFile(
+    if not include_hash:
+        return [
+            OutputFile(
                 name=path.name,
-                path=str(rel_path),
+                path=str(path.relative_to(output_dir)),
                 size=path.stat().st_size,
-                sha256=sha256,
-            ))
+            )
+            for path in paths
+        ]
+    
+    cache = HashCache(output_dir) if use_cache else None
+    hashed = hash_files(output_dir, paths, max_workers=max_workers, cache=cache)
+    if cache is not None:
+        cache.prune(path.relative_to(output_dir).as_posix() for path in paths)
+        cache.save()
+    
+    outputs = []
+    for path in paths:
+        size, sha256 = hashed[path]
+        outputs.append(OutputFile(
+            name=path.name,
+            path=str(path.relative_to(output_dir)),
+            size=size,
+            sha256=sha256,
+        ))
     
     return outputs
 
@@ -203,40 +281,201 @@ def write_run_json(
     return run_json_path
 
 
+def recover_run(output_dir: Union[str, Path]) -> RecipeResult:
+    """
+    Rebuild a run's result from its run.jsonl journal.
+    
+    Used after a crash or kill, when run.json was never written. The
+    recovered result is written to run.json; runs that never reached
+    their end event are marked ``interrupted``.
+    
+    Args:
+        output_dir: Output directory of the run
+        
+    Returns:
+        Recovered RecipeResult
+    """
+    output_dir = Path(output_dir)
+    result = RecipeResult.from_dict(compact_journal(output_dir / JOURNAL_NAME))
+    write_run_json(output_dir, result)
+    return result
+
+
+class _ThreadFilter(logging.Filter):
+    """Only pass records emitted by one thread."""
+    
+    def __init__(self, thread_id: int):
+        super().__init__()
+        self.thread_id = thread_id
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.thread == self.thread_id
+
+
+class _ContextFilter(logging.Filter):
+    """Only pass records emitted while a run's context variable is set."""
+    
+    def __init__(self, run_id: int):
+        super().__init__()
+        self.run_id = run_id
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        return _current_run.get() == self.run_id
+
+
+# Identifies the run owning the current thread/task context, so concurrent
+# asyncio runs on one event loop keep separate logs.
+_current_run: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar(
+    "recipe_current_run", default=None
+)
+
+
+# Verbose runs lower the root level to DEBUG; the previous level is
+# restored once the last concurrent verbose run finishes.
+_verbose_lock = threading.Lock()
+_verbose_runs = 0
+_saved_root_level: Optional[int] = None
+
+
+class RunLogging:
+    """
+    Run-scoped logging to ``run.log``.
+    
+    A file handler is attached to the root logger when the run starts and
+    removed and closed when it stops, so long-lived workers do not
+    accumulate handlers or file descriptors across runs. With
+    ``use_queue=True`` records are handed to a ``QueueHandler`` and written
+    by a ``QueueListener`` thread, so recipe threads never block on log I/O.
+    
+    ``current_thread_only`` and ``current_context_only`` restrict the file
+    to records from the starting thread or asyncio task respectively, for
+    runs that share a process.
+    
+    Example:
+        with RunLogging(output_dir, verbose=True) as log_path:
+            ...
+    """
+    
+    def __init__(
+        self,
+        output_dir: Union[str, Path],
+        verbose: bool = False,
+        current_thread_only: bool = False,
+        current_context_only: bool = False,
+        use_queue: bool = False,
+    ):
+        self.log_path = Path(output_dir) / "run.log"
+        self.verbose = verbose
+        self.current_thread_only = current_thread_only
+        self.current_context_only = current_context_only
+        self.use_queue = use_queue
+        self._context_token: Optional[contextvars.Token] = None
+        self._file_handler: Optional[logging.Handler] = None
+        self._root_handler: Optional[logging.Handler] = None
+        self._listener: Optional[logging.handlers.QueueListener] = None
+    
+    def start(self) -> Path:
+        """Attach the run's handler to the root logger."""
+        global _verbose_runs, _saved_root_level
+        
+        if self._root_handler is not None:
+            return self.log_path
+        
+        level = logging.DEBUG if self.verbose else logging.INFO
+        
+        # Create file handler
+        file_handler = logging.FileHandler(self.log_path)
+        file_handler.setLevel(level)
+        file_handler.setFormatter(logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        ))
+        self._file_handler = file_handler
+        
+        if self.use_queue:
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            root_handler: logging.Handler = logging.handlers.QueueHandler(log_queue)
+            root_handler.setLevel(level)
+            self._listener = logging.handlers.QueueListener(
+                log_queue, file_handler, respect_handler_level=True
+            )
+            self._listener.start()
+        else:
+            root_handler = file_handler
+        
+        if self.current_thread_only:
+            root_handler.addFilter(_ThreadFilter(threading.get_ident()))
+        if self.current_context_only:
+            self._context_token = _current_run.set(id(self))
+            root_handler.addFilter(_ContextFilter(id(self)))
+        
+        # Add to root logger
+        root_logger = logging.getLogger()
+        root_logger.addHandler(root_handler)
+        self._root_handler = root_handler
+        
+        if self.verbose:
+            with _verbose_lock:
+                if _verbose_runs == 0:
+                    _saved_root_level = root_logger.level
+                _verbose_runs += 1
+                root_logger.setLevel(logging.DEBUG)
+        
+        return self.log_path
+    
+    def stop(self) -> None:
+        """Detach the handler, flush pending records and close the file."""
+        global _verbose_runs
+        
+        if self._root_handler is None:
+            return
+        
+        root_logger = logging.getLogger()
+        root_logger.removeHandler(self._root_handler)
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        self._root_handler.close()
+        self._file_handler.close()
+        self._root_handler = None
+        self._file_handler = None
+        if self._context_token is not None:
+            _current_run.reset(self._context_token)
+            self._context_token = None
+        
+        if self.verbose:
+            with _verbose_lock:
+                _verbose_runs -= 1
+                if _verbose_runs == 0 and _saved_root_level is not None:
+                    root_logger.setLevel(_saved_root_level)
+    
+    def __enter__(self) -> Path:
+        return self.start()
+    
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
 def setup_logging(
     output_dir: Path,
     verbose: bool = False,
+    current_thread_only: bool = False,
 ) -> Path:
     """
     Setup logging for a recipe run.
     
+    The handler stays attached until the process exits; use ``RunLogging``
+    to scope it to a run.
+    
     Args:
         output_dir: Output directory for log file
         verbose: Enable verbose logging
+        current_thread_only: Only write records from the calling thread,
+            so concurrent runs in one process keep separate logs
         
     Returns:
         Path to log file
     """
-    log_path = output_dir / "run.log"
-    
-    # Configure logging
-    level = logging.DEBUG if verbose else logging.INFO
-    
-    # Create file handler
-    file_handler = logging.FileHandler(log_path)
-    file_handler.setLevel(level)
-    file_handler.setFormatter(logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    ))
-    
-    # Add to root logger
-    root_logger = logging.getLogger()
-    root_logger.addHandler(file_handler)
-    
-    if verbose:
-        root_logger.setLevel(logging.DEBUG)
-    
-    return log_path
+    return RunLogging(output_dir, verbose, current_thread_only).start()
 
 
 class RecipeRunner:
@@ -245,7 +484,9 @@ class RecipeRunner:
     
     Handles:
     - Output directory creation
-    - run.json generation
+    - Optional result caching
+    - Resource limits and admission control
+    - run.jsonl journal and run.json generation
     - Logging
     - Dry-run mode
     - Error handling
@@ -255,13 +496,37 @@ class RecipeRunner:
         self,
         recipe_name: str,
         version: str = "1.0.0",
+        cache: Optional["ResultCache"] = None,
+        queue_logging: bool = False,
+        limits: Optional[ResourceLimits] = None,
+        admission: Optional[AdmissionController] = None,
     ):
         self.recipe_name = recipe_name
         self.version = version
+        self.cache = cache
+        self.queue_logging = queue_logging
+        self.limits = limits
+        self.admission = admission
         self._start_time: Optional[float] = None
         self._result: Optional[RecipeResult] = None
         self._output_dir: Optional[Path] = None
         self._log_path: Optional[Path] = None
+        self._journal: Optional[RunJournal] = None
+        self._logging: Optional[RunLogging] = None
+        self._resuming = False
+        self._run_fp: Optional[str] = None
+        self._last_stage_fp: Optional[str] = None
+        self._admitted = False
+        self._watchdog: Optional[LimitWatchdog] = None
+        self._limit_lock: Optional[threading.Lock] = None
+        # (grace seconds, callback) set in run_isolated()'s child process
+        self._kill_after: Optional[Tuple[float, Callable[[ResourceLimitExceeded], None]]] = None
+        self._kill_timer: Optional[threading.Timer] = None
+        self._limit_violation: Optional[ResourceLimitExceeded] = None
+        self._subprocess_slots: Optional[threading.BoundedSemaphore] = None
+        self._children: set = set()
+        # Set on per-item copies by run_many() to keep logs separate
+        self.isolate_logs = False
     
     def run(self, config: RecipeConfig) -> RecipeResult:
         """
@@ -273,77 +538,588 @@ class RecipeRunner:
         Returns:
             RecipeResult with execution details
         """
+        self._init_run(config)
+        
+        try:
+            self._admit()
+            self._start_run(config)
+            self._start_limits()
+            
+            if config.dry_run:
+                # Dry run - just plan, don't execute
+                self._mark_dry_run()
+                self._plan(config)
+            else:
+                # Reuse a cached result or execute the recipe
+                cache_key, entry = self._check_cache(config)
+                if entry is None:
+                    self._execute(config)
+                    self.check_limits()
+                self._stop_limits()
+                self._complete_run(cache_key, entry)
+            
+        except Exception as e:
+            self._stop_limits()
+            if isinstance(e, ResourceLimitExceeded) and self._limit_violation is not None:
+                e = self._limit_violation
+            self._fail_run(e)
+            raise e
+        
+        finally:
+            self._stop_limits()
+            self._finish_run()
+            self._release()
+        
+        return self._result
+    
+    def run_isolated(self, config: RecipeConfig, kill_grace_sec: float = 5.0) -> RecipeResult:
+        """
+        Run the recipe in a forked child process that can be hard-killed.
+        
+        Limits are normally enforced cooperatively, which cannot stop code
+        that never reaches a ``check_limits()`` (a long C call, a tight
+        loop). Here the child exits ``kill_grace_sec`` after a violation if
+        the run has not stopped by then, and the parent rebuilds run.json
+        from the journal with the run marked failed. On platforms without
+        ``fork`` the recipe runs in this process.
+        
+        Args:
+            config: Recipe configuration
+            kill_grace_sec: Seconds a violating run gets to stop by itself
+            
+        Returns:
+            RecipeResult with execution details
+            
+        Raises:
+            ResourceLimitExceeded: If the run exceeded a limit
+        """
+        try:
+            context = multiprocessing.get_context("fork")
+        except ValueError:
+            return self._run_in_process(config)
+        
+        receiver, sender = context.Pipe(duplex=False)
+        
+        def _child() -> None:
+            receiver.close()
+            
+            def _kill(violation: ResourceLimitExceeded) -> None:
+                logger.error(f"Run did not stop within {kill_grace_sec}s of {violation}; killing it")
+                output_dir = str(self._output_dir) if self._output_dir else None
+                sender.send(("killed", violation, output_dir))
+                os._exit(1)
+            
+            self._kill_after = (kill_grace_sec, _kill)
+            try:
+                result = self._run_in_process(config)
+                message = ("ok", result, None)
+            except BaseException as e:
+                try:
+                    pickle.dumps(e)
+                except Exception:
+                    e = RuntimeError(f"{type(e).__name__}: {e}")
+                message = ("error", self._result, e)
+            try:
+                sender.send(message)
+            finally:
+                os._exit(0)
+        
+        process = context.Process(target=_child, name=f"recipe-{self.recipe_name}", daemon=False)
+        process.start()
+        sender.close()
+        try:
+            message = receiver.recv()
+        except EOFError:
+            message = None
+        finally:
+            receiver.close()
+            process.join()
+        
+        if message is None:
+            raise RuntimeError(f"Recipe process exited with code {process.exitcode}")
+        kind, payload, extra = message
+        if kind == "ok":
+            self._result = payload
+            return payload
+        if kind == "error":
+            self._result = payload
+            raise extra
+        
+        # Hard-killed: run.json was never written
+        violation, output_dir = payload, extra
+        if output_dir:
+            result = recover_run(output_dir)
+            result.status = "failed"
+            result.error = str(violation)
+            write_run_json(Path(output_dir), result)
+            self._result = result
+        raise violation
+    
+    def _run_in_process(self, config: RecipeConfig) -> RecipeResult:
+        """Execute a run in this process (``run_isolated``'s child)."""
+        return self.run(config)
+    
+    def _init_run(self, config: RecipeConfig) -> None:
+        """Reset per-run state and initialize the result."""
         self._start_time = time.time()
-        started_at = get_timestamp()
+        self._journal = None
+        self._logging = None
+        self._output_dir = None
+        self._log_path = None
+        self._resuming = False
+        self._run_fp: Optional[str] = None
+        self._last_stage_fp: Optional[str] = None
+        self._admitted = False
+        self._watchdog = None
+        self._kill_timer = None
+        self._limit_lock = threading.Lock()
+        self._limit_violation = None
+        self._children = set()
+        self._subprocess_slots = None
+        if self.limits is not None and self.limits.max_subprocesses:
+            self._subprocess_slots = threading.BoundedSemaphore(self.limits.max_subprocesses)
         
         # Initialize result
         self._result = RecipeResult(
             recipe=self.recipe_name,
             version=self.version,
             status="running",
-            started_at=started_at,
+            started_at=get_timestamp(),
             input_path=config.input_path,
             config=config.to_dict(),
         )
+    
+    def _start_run(self, config: RecipeConfig, current_context_only: bool = False) -> None:
+        """Validate input, create the output directory, logging and journal."""
+        # Validate input
+        self._validate_input(config)
         
+        # Create output directory
+        if config.resume:
+            self._output_dir = Path(config.resume)
+            if not self._output_dir.is_dir():
+                raise FileNotFoundError(f"Cannot resume, output directory not found: {config.resume}")
+            self._resuming = True
+        elif config.output_dir:
+            self._output_dir = Path(config.output_dir)
+            self._output_dir.mkdir(parents=True, exist_ok=config.force)
+        else:
+            self._output_dir = create_output_dir(
+                self.recipe_name,
+                force=config.force,
+            )
+        
+        self._result.output_dir = str(self._output_dir)
+        
+        # Setup logging
+        self._logging = RunLogging(
+            self._output_dir,
+            config.verbose,
+            current_thread_only=self.isolate_logs and not current_context_only,
+            current_context_only=current_context_only,
+            use_queue=self.queue_logging,
+        )
+        self._log_path = self._logging.start()
+        self._result.logs = str(self._log_path)
+        
+        # Start the journal
+        self._journal = RunJournal(self._output_dir)
+        self._journal.record(
+            "run_start",
+            recipe=self.recipe_name,
+            version=self.version,
+            started_at=self._result.started_at,
+            input=config.input_path,
+            output_dir=str(self._output_dir),
+            config=self._result.config,
+            logs=self._result.logs,
+        )
+        if self._result.metrics:
+            # Metrics gathered before the journal existed (e.g. admission wait)
+            self._journal.record("metrics", metrics=dict(self._result.metrics))
+        
+        logger.info(f"{'Resuming' if self._resuming else 'Starting'} recipe: {self.recipe_name}")
+        logger.info(f"Input: {config.input_path}")
+        logger.info(f"Output: {self._output_dir}")
+    
+    def _admit(self) -> None:
+        """Wait for the admission controller, if any, to admit this run."""
+        if self.admission is None:
+            return
+        self._admitted_after(self.admission.acquire())
+    
+    def _admitted_after(self, waited: float) -> None:
+        """Record an admission that took ``waited`` seconds."""
+        self._admitted = True
+        # Queue time is reported separately from the run's duration
+        self._start_time = time.time()
+        self._add_metrics(admission_wait_sec=round(waited, 3))
+        if waited >= 1:
+            logger.info(f"Admitted after waiting {waited:.1f}s")
+    
+    def _release(self) -> None:
+        if self._admitted:
+            self.admission.release()
+            self._admitted = False
+    
+    def _start_limits(self, interrupt: Optional[Callable[[ResourceLimitExceeded], None]] = None) -> None:
+        """
+        Start the limit watchdog for this run.
+        
+        On a violation, child processes are killed and the violation is
+        raised at the run's next ``check_limits()``. ``interrupt`` is an
+        extra handler (the async runner cancels its task).
+        """
+        if self.limits is None:
+            return
+        self._add_metrics(limits=self.limits.to_dict())
+        if not self.limits.needs_watchdog:
+            return
+        
+        def _on_violation(violation: ResourceLimitExceeded) -> None:
+            with self._limit_lock:
+                if self._watchdog is None:
+                    return
+                self._limit_violation = violation
+                if self._journal is not None and not self._journal.closed:
+                    self._journal.record("limit_exceeded", **{
+                        "limit": violation.limit,
+                        "value": violation.value,
+                        "max": violation.maximum,
+                    })
+                for proc in list(self._children):
+                    proc.kill()
+                if interrupt is not None:
+                    interrupt(violation)
+                if self._kill_after is not None:
+                    grace, kill = self._kill_after
+                    self._kill_timer = threading.Timer(grace, kill, (violation,))
+                    self._kill_timer.daemon = True
+                    self._kill_timer.start()
+        
+        self._watchdog = LimitWatchdog(self.limits, self._output_dir, _on_violation).start()
+    
+    def _stop_limits(self) -> None:
+        """Stop the watchdog; no limit exception is raised after this returns."""
+        with self._limit_lock:
+            watchdog, self._watchdog = self._watchdog, None
+            if self._kill_timer is not None:
+                # The run stopped by itself within the grace period
+                self._kill_timer.cancel()
+                self._kill_timer = None
+        if watchdog is None:
+            return
+        watchdog.stop()
+        peaks = {}
+        if watchdog.peak_memory_mb is not None:
+            peaks["peak_memory_mb"] = round(watchdog.peak_memory_mb, 1)
+        if self.limits.max_output_bytes is not None:
+            peaks["peak_output_bytes"] = watchdog.peak_output_bytes
+        if self._limit_violation is not None:
+            peaks["violation"] = str(self._limit_violation)
+        if peaks:
+            self._add_metrics(limits={**self.limits.to_dict(), **peaks})
+    
+    def check_limits(self) -> None:
+        """
+        Raise if this run has exceeded a limit.
+        
+        Limits are enforced cooperatively: this is called when stages start
+        and end, around ``run_subprocess`` and after ``_execute``. Long
+        loops inside a stage should call it too for a prompt abort; for
+        code that cannot, use ``run_isolated``.
+        """
+        if self._limit_violation is not None:
+            raise self._limit_violation
+    
+    def run_subprocess(
+        self,
+        args: Any,
+        check: bool = False,
+        input: Optional[Union[str, bytes]] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a subprocess under this run's limits.
+        
+        Behaves like ``subprocess.run``, but waits for a slot when
+        ``limits.max_subprocesses`` processes are already running and
+        kills the process if the run exceeds a limit.
+        """
+        self.check_limits()
+        slots = self._subprocess_slots
+        if slots is not None:
+            slots.acquire()
         try:
-            # Validate input
-            self._validate_input(config)
-            
-            # Create output directory
-            if config.output_dir:
-                self._output_dir = Path(config.output_dir)
-                self._output_dir.mkdir(parents=True, exist_ok=config.force)
-            else:
-                self._output_dir = create_output_dir(
-                    self.recipe_name,
-                    force=config.force,
-                )
-            
-            self._result.output_dir = str(self._output_dir)
-            
-            # Setup logging
-            self._log_path = setup_logging(self._output_dir, config.verbose)
-            self._result.logs = str(self._log_path)
-            
-            logger.info(f"Starting recipe: {self.recipe_name}")
-            logger.info(f"Input: {config.input_path}")
-            logger.info(f"Output: {self._output_dir}")
-            
-            if config.dry_run:
-                # Dry run - just plan, don't execute
-                self._result.status = "dry_run"
-                logger.info("DRY RUN - no files will be created")
-                self._plan(config)
-            else:
-                # Execute the recipe
-                self._execute(config)
-                
-                # Collect outputs
-                self._result.outputs = collect_outputs(self._output_dir)
-                self._result.status = "success"
-            
-        except Exception as e:
-            self._result.status = "failed"
-            self._result.error = str(e)
-            logger.exception(f"Recipe failed: {e}")
-            raise
+            if input is not None:
+                kwargs["stdin"] = subprocess.PIPE
+            with subprocess.Popen(args, **kwargs) as proc:
+                self._children.add(proc)
+                try:
+                    stdout, stderr = proc.communicate(input=input, timeout=timeout)
+                except BaseException:
+                    proc.kill()
+                    proc.wait()
+                    raise
+                finally:
+                    self._children.discard(proc)
+            retcode = proc.poll()
+        finally:
+            if slots is not None:
+                slots.release()
+        
+        self.check_limits()
+        if check and retcode:
+            raise subprocess.CalledProcessError(retcode, args, output=stdout, stderr=stderr)
+        return subprocess.CompletedProcess(args, retcode, stdout, stderr)
+    
+    def _mark_dry_run(self) -> None:
+        self._result.status = "dry_run"
+        logger.info("DRY RUN - no files will be created")
+    
+    def _check_cache(self, config: RecipeConfig) -> Tuple[Optional[str], Optional["CacheEntry"]]:
+        """Look the run up in the result cache, materializing a hit."""
+        cache_key = self._cache_key(config)
+        entry = self.cache.lookup(cache_key) if cache_key else None
+        if entry is not None:
+            try:
+                methods = self.cache.materialize(entry, self._output_dir)
+            except OSError as e:
+                # The entry lost files after lookup; run the recipe instead
+                logger.warning(f"Cache entry {cache_key} could not be materialized ({e}); executing")
+                return cache_key, None
+            logger.info(f"Cache hit: {cache_key} (from {entry.source_run})")
+            self._add_metrics(cache={
+                "key": cache_key,
+                "hit": True,
+                "source_run": entry.source_run,
+                "materialized": methods,
+            })
+        return cache_key, entry
+    
+    def _complete_run(self, cache_key: Optional[str], entry: Optional["CacheEntry"]) -> None:
+        """Collect outputs, populate the cache and mark the run finished."""
+        # Collect outputs
+        self._result.outputs = collect_outputs(self._output_dir)
+        for output in self._result.outputs:
+            self._journal.record("output", **output.to_dict())
+        
+        if cache_key and entry is None:
+            self.cache.store(
+                cache_key,
+                self._output_dir,
+                [o.path for o in self._result.outputs],
+                recipe=self.recipe_name,
+                version=self.version,
+            )
+            self._add_metrics(cache={"key": cache_key, "hit": False})
+        self._result.status = "cached" if entry is not None else "success"
+    
+    def _fail_run(self, error: Exception) -> None:
+        self._result.status = "failed"
+        self._result.error = str(error)
+        logger.exception(f"Recipe failed: {error}")
+    
+    def _finish_run(self) -> None:
+        """Finalize metrics, compact the journal into run.json and detach logging."""
+        self._close_run()
+        self._detach_logging()
+    
+    def _close_run(self) -> None:
+        """Finalize metrics and compact the journal into run.json."""
+        # Finalize result
+        self._result.completed_at = get_timestamp()
         
+        # Calculate metrics
+        duration = time.time() - self._start_time
+        self._add_metrics(duration_sec=round(duration, 2))
+        
+        # Close the journal and compact it into run.json
+        if self._journal is not None:
+            self._journal.record(
+                "run_end",
+                status=self._result.status,
+                completed_at=self._result.completed_at,
+                error=self._result.error,
+            )
+            self._journal.close()
+            self._result = RecipeResult.from_dict(compact_journal(self._journal.path))
+        
+        # Write run.json
+        if self._output_dir:
+            write_run_json(self._output_dir, self._result)
+    
+    def _detach_logging(self) -> None:
+        """Detach the run's log handler (in the context that attached it)."""
+        if self._logging is not None:
+            self._logging.stop()
+            self._logging = None
+    
+    def run_many(
+        self,
+        configs: Iterable[RecipeConfig],
+        max_workers: Optional[int] = None,
+        executor: str = "thread",
+        base_dir: Optional[Union[str, Path]] = None,
+    ) -> "BatchResult":
+        """
+        Run the recipe over many inputs with bounded concurrency.
+        
+        See ``recipe_runtime.batch.run_batch`` for details.
+        """
+        from .batch import run_batch
+        
+        return run_batch(
+            self,
+            configs,
+            max_workers=max_workers,
+            executor=executor,
+            base_dir=base_dir,
+        )
+    
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Dict[str, Any]]:
+        """
+        Run a named, measured stage of ``_execute``.
+        
+        Wall time, subprocess count and the process-wide CPU time, peak RSS
+        and bytes read/written are recorded in the journal and end up in
+        ``metrics["stages"][name]`` of run.json. The process-wide numbers
+        are left out (and ``overlapped`` is set) when the stage ran
+        alongside another one. Repeated stages with the same name are
+        aggregated.
+        
+        Example:
+            with self.stage("transcribe"):
+                ...
+        """
+        self.check_limits()
+        if self._journal is not None:
+            self._journal.record("stage_start", stage=name)
+        status, error = "success", None
+        try:
+            with measure() as stage_metrics:
+                yield stage_metrics
+            self.check_limits()
+        except BaseException as e:
+            status, error = "failed", str(e)
+            raise
         finally:
-            # Finalize result
-            self._result.completed_at = get_timestamp()
+            if self._journal is not None:
+                extra = {"error": error} if error else {}
+                self._journal.record(
+                    "stage_end",
+                    stage=name,
+                    status=status,
+                    **stage_metrics,
+                    **extra,
+                )
+    
+    def run_stage(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        *args: Any,
+        artifacts: Iterable[Union[str, Path]] = (),
+        inputs: Any = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run a checkpointed stage of ``_execute``.
+        
+        The stage runs inside ``stage(name)`` and, on success, a checkpoint
+        with its fingerprint, artifacts and return value is saved. When the
+        run was started with ``RecipeConfig(resume=...)`` and the stage's
+        fingerprint and artifacts are unchanged, ``func`` is skipped and the
+        checkpointed return value is returned instead.
+        
+        Args:
+            name: Stage name (unique within the recipe)
+            func: Stage implementation
+            artifacts: Files the stage writes, relative to the output dir
+            inputs: Extra JSON-serializable values the stage depends on
             
-            # Calculate metrics
-            duration = time.time() - self._start_time
-            self._result.metrics = {
-                "duration_sec": round(duration, 2),
-            }
+        Returns:
+            The stage's return value
+            
+        Raises:
+            TypeError: If ``func`` is a coroutine function; async stages
+                need ``AsyncRecipeRunner.run_stage``
             
-            # Write run.json
-            if self._output_dir:
-                write_run_json(self._output_dir, self._result)
+        Example:
+            transcript = self.run_stage(
+                "transcribe", self.transcribe, config.input_path,
+                artifacts=["transcript.json"],
+            )
+        """
+        if inspect.iscoroutinefunction(func):
+            raise TypeError(
+                f"Stage {name} is a coroutine function; use AsyncRecipeRunner "
+                f"and await self.run_stage(...)"
+            )
+        fingerprint = self._stage_fingerprint(name, inputs)
+        skipped, value = self._load_checkpoint(name, fingerprint)
+        if skipped:
+            return value
         
-        return self._result
+        with self.stage(name):
+            value = func(*args, **kwargs)
+            if inspect.isawaitable(value):
+                if inspect.iscoroutine(value):
+                    value.close()
+                raise TypeError(
+                    f"Stage {name} returned an awaitable; use AsyncRecipeRunner "
+                    f"and await self.run_stage(...)"
+                )
+        self._save_checkpoint(name, fingerprint, artifacts, value)
+        return value
+    
+    def _stage_fingerprint(self, name: str, inputs: Any) -> str:
+        """Fingerprint of a stage, chained to the previous one."""
+        if self._run_fp is None:
+            self._run_fp = run_fingerprint(
+                self.recipe_name, self.version, self._result.input_path, self._result.config
+            )
+        return stage_fingerprint(self._run_fp, name, self._last_stage_fp, inputs)
+    
+    def _load_checkpoint(self, name: str, fingerprint: str) -> Tuple[bool, Any]:
+        """Return (True, checkpointed value) when a resumed stage can be skipped."""
+        store = CheckpointStore(self._output_dir)
+        if not (self._resuming and store.is_valid(name, fingerprint)):
+            return False, None
+        logger.info(f"Skipping stage {name}: checkpoint is up to date")
+        if self._journal is not None:
+            self._journal.record("stage_skipped", stage=name, reason="checkpoint")
+        self._last_stage_fp = fingerprint
+        return True, store.load(name).get("result")
+    
+    def _save_checkpoint(
+        self,
+        name: str,
+        fingerprint: str,
+        artifacts: Iterable[Union[str, Path]],
+        value: Any,
+    ) -> None:
+        CheckpointStore(self._output_dir).save(name, fingerprint, artifacts, result=value)
+        self._last_stage_fp = fingerprint
+    
+    def _add_metrics(self, **metrics: Any) -> None:
+        """Merge metrics into the result and record them in the journal."""
+        self._result.metrics.update(metrics)
+        if self._journal is not None and not self._journal.closed:
+            self._journal.record("metrics", metrics=metrics)
+    
+    def _cache_key(self, config: RecipeConfig) -> Optional[str]:
+        """Cache key for this run, or None when caching does not apply."""
+        if self.cache is None or config.input_path.startswith(("http://", "https://")):
+            return None
+        return self.cache.key_for(
+            self.recipe_name,
+            self.version,
+            config.input_path,
+            self._result.config,
+        )
     
     def _validate_input(self, config: RecipeConfig) -> None:
         """Validate input path exists."""
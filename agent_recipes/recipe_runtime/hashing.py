@@ -0,0 +1,198 @@
+"""
+Output hashing engine.
+
+Provides:
+- Large-buffer / mmap-backed SHA256 hashing
+- Parallel hashing of many files in a thread pool
+- A per-directory (path, size, mtime_ns) -> digest cache so unchanged
+  files are not rehashed when outputs are re-collected
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+HASH_CACHE_NAME = ".hashcache.json"
+# Written next to the cache and renamed over it on save
+HASH_CACHE_TMP_NAME = ".hashcache.tmp"
+
+# Files at or above this size are hashed through mmap instead of read().
+MMAP_THRESHOLD = 16 * 1024 * 1024
+READ_BUFFER_SIZE = 1024 * 1024
+MMAP_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+def hash_file(path: Union[str, Path], mmap_threshold: int = MMAP_THRESHOLD) -> str:
+    """
+    Calculate SHA256 hash of a file.
+
+    Small files are read with a 1 MiB buffer; large files are mapped into
+    memory and fed to hashlib in chunks, which releases the GIL so several
+    files can be hashed concurrently.
+
+    Args:
+        path: File to hash
+        mmap_threshold: Minimum size in bytes for the mmap path
+
+    Returns:
+        Hex digest
+    """
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size and size >= mmap_threshold:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    for offset in range(0, size, MMAP_CHUNK_SIZE):
+                        sha256.update(view[offset:offset + MMAP_CHUNK_SIZE])
+                finally:
+                    view.release()
+        else:
+            for chunk in iter(lambda: f.read(READ_BUFFER_SIZE), b""):
+                sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+class HashCache:
+    """
+    Digest cache for the files of one directory.
+
+    Entries are keyed by path relative to the directory and are only
+    reused while the file's size and mtime_ns are unchanged. The cache is
+    persisted as a JSON file inside the directory (written through a
+    temporary file); callers scanning the directory skip both names.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        filename: str = HASH_CACHE_NAME,
+        tmp_filename: str = HASH_CACHE_TMP_NAME,
+    ):
+        self.root = Path(root)
+        self.path = self.root / filename
+        self.tmp_path = self.root / tmp_filename
+        self._entries: Dict[str, Dict[str, object]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.load()
+
+    def load(self) -> None:
+        """Load cache entries from disk, ignoring unreadable caches."""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._entries = data.get("entries", {})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable hash cache {self.path}: {e}")
+            self._entries = {}
+
+    def save(self) -> None:
+        """Persist the cache if it changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            with open(self.tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "entries": self._entries}, f)
+            os.replace(self.tmp_path, self.path)
+            self._dirty = False
+
+    def get(self, rel_path: str, stat: os.stat_result) -> Optional[str]:
+        """Return the cached digest if the file is unchanged."""
+        entry = self._entries.get(rel_path)
+        if (
+            entry
+            and entry.get("size") == stat.st_size
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            return entry.get("sha256")
+        return None
+
+    def put(self, rel_path: str, stat: os.stat_result, digest: str) -> None:
+        """Record the digest for a file."""
+        with self._lock:
+            self._entries[rel_path] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": digest,
+            }
+            self._dirty = True
+
+    def prune(self, keep: Iterable[str]) -> None:
+        """Drop entries for files that no longer exist."""
+        keep = set(keep)
+        with self._lock:
+            stale = [k for k in self._entries if k not in keep]
+            for key in stale:
+                del self._entries[key]
+            if stale:
+                self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def hash_files(
+    root: Union[str, Path],
+    paths: Iterable[Path],
+    max_workers: Optional[int] = None,
+    cache: Optional[HashCache] = None,
+) -> Dict[Path, Tuple[int, str]]:
+    """
+    Hash many files under a directory in parallel.
+
+    Args:
+        root: Directory the paths live under (used for cache keys)
+        paths: Files to hash
+        max_workers: Thread pool size (default: min(8, cpu_count))
+        cache: Optional HashCache consulted before hashing
+
+    Returns:
+        Mapping of path to (size, sha256)
+    """
+    root = Path(root)
+    results: Dict[Path, Tuple[int, str]] = {}
+    pending = []
+
+    for path in paths:
+        stat = path.stat()
+        rel_path = path.relative_to(root).as_posix()
+        digest = cache.get(rel_path, stat) if cache is not None else None
+        if digest is not None:
+            results[path] = (stat.st_size, digest)
+        else:
+            pending.append((path, rel_path, stat))
+
+    if not pending:
+        return results
+
+    def _hash(item):
+        path, rel_path, stat = item
+        digest = hash_file(path)
+        if cache is not None:
+            cache.put(rel_path, stat, digest)
+        return path, stat.st_size, digest
+
+    if max_workers is None:
+        max_workers = min(8, os.cpu_count() or 1)
+
+    if max_workers <= 1 or len(pending) == 1:
+        for path, size, digest in map(_hash, pending):
+            results[path] = (size, digest)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for path, size, digest in executor.map(_hash, pending):
+                results[path] = (size, digest)
+
+    return results
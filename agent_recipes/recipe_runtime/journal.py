@@ -0,0 +1,197 @@
+"""
+Append-only run journal.
+
+Every recipe run streams its progress to ``run.jsonl`` in the output
+directory: run start, stage start/end, outputs, metrics and run end are
+each written as one JSON line and flushed immediately. Dashboards can tail
+the file, and ``run.json`` is compacted from it at the end of the run (or
+after a crash, by replaying whatever was written).
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, Union
+
+JOURNAL_NAME = "run.jsonl"
+
+
+class RunJournal:
+    """
+    Writer for a run's ``run.jsonl`` journal.
+
+    Each event is a JSON object with ``ts`` and ``event`` keys plus the
+    event payload. Writes are serialized with a lock so stages running in
+    worker threads can record events safely.
+    """
+
+    def __init__(self, output_dir: Union[str, Path], fsync: bool = False):
+        self.path = Path(output_dir) / JOURNAL_NAME
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def record(self, event: str, **data: Any) -> Dict[str, Any]:
+        """Append an event and flush it to disk."""
+        entry = {
+            "ts": datetime.now(timezone.utc).isoformat(),
+            "event": event,
+            **data,
+        }
+        line = json.dumps(entry, default=str)
+        with self._lock:
+            if self._file.closed:
+                raise ValueError(f"Journal is closed: {self.path}")
+            self._file.write(line + "\n")
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+        return entry
+
+    def close(self) -> None:
+        """Close the journal file."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def __enter__(self) -> "RunJournal":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_journal(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the events of a journal.
+
+    A truncated final line (from a killed process) is skipped.
+    """
+    path = Path(path)
+    if path.is_dir():
+        path = path / JOURNAL_NAME
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def _merge_stage(stage: Dict[str, Any], entry: Dict[str, Any]) -> None:
+    """
+    Fold a stage_end event into a stage record.
+
+    A stage that ran several times is aggregated: numeric metrics are
+    summed, except ``peak_*`` metrics which keep the maximum, and
+    ``overlapped`` stays set once any call overlapped another stage.
+    """
+    calls = stage.get("calls", 0)
+    for key, value in entry.items():
+        if key in ("event", "stage", "ts"):
+            continue
+        previous = stage.get(key)
+        if key == "overlapped":
+            value = bool(value or previous)
+        elif calls and isinstance(value, (int, float)) and isinstance(previous, (int, float)) \
+                and not isinstance(value, bool):
+            if key.startswith("peak_"):
+                value = max(previous, value)
+            else:
+                value = round(previous + value, 3)
+        stage[key] = value
+    stage["calls"] = calls + 1
+    stage["completed_at"] = entry["ts"]
+
+
+def compact_journal(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Fold a journal into the run.json dictionary.
+
+    Stage events are collected under ``metrics["stages"]`` keyed by stage
+    name. A resumed run appends to the same journal; each ``run_start``
+    discards the previous attempt's outputs, metrics and stages, so only
+    the latest attempt is reported. A journal whose last attempt has no
+    ``run_end`` event is reported with status ``interrupted``.
+
+    Args:
+        path: Journal file or the output directory containing it
+
+    Returns:
+        Dictionary in the same shape as ``RecipeResult.to_dict()``
+    """
+    run: Dict[str, Any] = {
+        "recipe": "",
+        "version": "",
+        "started_at": None,
+        "completed_at": None,
+        "status": "interrupted",
+        "input": "",
+        "output_dir": "",
+        "config": {},
+        "outputs": [],
+        "metrics": {},
+        "logs": "",
+        "error": None,
+    }
+    outputs: Dict[str, Dict[str, Any]] = {}
+    stages: Dict[str, Dict[str, Any]] = {}
+    finished = False
+
+    for entry in read_journal(path):
+        event = entry.get("event")
+        if event == "run_start":
+            for key in ("recipe", "version", "started_at", "input", "output_dir", "config", "logs"):
+                if key in entry:
+                    run[key] = entry[key]
+            run["status"] = "running"
+            run["error"] = None
+            run["completed_at"] = None
+            run["metrics"] = {}
+            outputs.clear()
+            stages.clear()
+            finished = False
+        elif event == "stage_start":
+            stage = stages.setdefault(entry["stage"], {"started_at": entry["ts"]})
+            stage["status"] = "running"
+        elif event == "stage_end":
+            _merge_stage(stages.setdefault(entry["stage"], {}), entry)
+        elif event == "stage_skipped":
+            stage = stages.setdefault(entry["stage"], {})
+            stage["status"] = "skipped"
+            stage["reason"] = entry.get("reason")
+        elif event == "output":
+            outputs[entry["path"]] = {
+                "name": entry.get("name"),
+                "path": entry["path"],
+                "size": entry.get("size"),
+                "sha256": entry.get("sha256"),
+            }
+        elif event == "metrics":
+            run["metrics"].update(entry.get("metrics", {}))
+        elif event == "run_end":
+            run["status"] = entry.get("status", run["status"])
+            run["completed_at"] = entry.get("completed_at", entry["ts"])
+            run["error"] = entry.get("error")
+            finished = True
+
+    if not finished:
+        run["status"] = "interrupted"
+        for stage in stages.values():
+            if stage.get("status") == "running":
+                stage["status"] = "interrupted"
+
+    run["outputs"] = list(outputs.values())
+    if stages:
+        run["metrics"]["stages"] = stages
+    return run
+
@@ -0,0 +1,380 @@
+"""
+Resource limits and admission control for recipe runs.
+
+Provides:
+- ``ResourceLimits``: per-run caps on wall time, memory, bytes written to
+  the output directory and concurrent subprocesses
+- ``LimitWatchdog``: a background thread that samples a run and reports
+  the first exceeded cap; the run stops cooperatively at its next limit
+  check (see ``RecipeRunner.check_limits`` and ``run_isolated``)
+- ``AdmissionController``: a process-wide gate that queues new runs while
+  too many are active or the host is saturated (load, free memory)
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceLimitExceeded(RuntimeError):
+    """Raised inside a run that exceeded one of its resource limits."""
+
+    def __init__(self, limit: str = "", value: Any = None, maximum: Any = None):
+        self.limit = limit
+        self.value = value
+        self.maximum = maximum
+        super().__init__(f"Resource limit exceeded: {limit} = {value} (max {maximum})")
+
+    def __reduce__(self):
+        # Keep the fields when sent back from an isolated run's process
+        return type(self), (self.limit, self.value, self.maximum)
+
+
+class AdmissionTimeout(RuntimeError):
+    """Raised when a run could not be admitted before its timeout."""
+
+
+@dataclass
+class ResourceLimits:
+    """
+    Per-run resource limits. ``None`` disables a limit.
+
+    Memory is the resident set size of the whole process (plus children
+    when psutil is installed), so in a process running several recipes
+    concurrently it caps their combined footprint.
+    """
+    max_wall_sec: Optional[float] = None
+    max_memory_mb: Optional[float] = None
+    max_output_bytes: Optional[int] = None
+    max_subprocesses: Optional[int] = None
+    check_interval_sec: float = 1.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "max_wall_sec": self.max_wall_sec,
+            "max_memory_mb": self.max_memory_mb,
+            "max_output_bytes": self.max_output_bytes,
+            "max_subprocesses": self.max_subprocesses,
+        }
+
+    @property
+    def needs_watchdog(self) -> bool:
+        return any(
+            v is not None
+            for v in (self.max_wall_sec, self.max_memory_mb, self.max_output_bytes)
+        )
+
+
+def current_rss_mb() -> Optional[float]:
+    """Current RSS of this process and its children in MiB, if available."""
+    try:
+        import psutil
+
+        process = psutil.Process()
+        rss = process.memory_info().rss
+        for child in process.children(recursive=True):
+            try:
+                rss += child.memory_info().rss
+            except psutil.Error:
+                pass
+        return rss / (1024 * 1024)
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def directory_size(path: Path) -> int:
+    """Total size in bytes of the files under path."""
+    total = 0
+    stack = [str(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total
+
+
+class LimitWatchdog:
+    """
+    Samples a run and calls ``on_violation`` once a limit is exceeded.
+
+    Args:
+        limits: Limits to enforce
+        output_dir: Output directory whose size is capped
+        on_violation: Called once, from the watchdog thread, with the
+            ResourceLimitExceeded describing the violation
+    """
+
+    def __init__(
+        self,
+        limits: ResourceLimits,
+        output_dir: Path,
+        on_violation: Callable[[ResourceLimitExceeded], None],
+    ):
+        self.limits = limits
+        self.output_dir = Path(output_dir)
+        self.on_violation = on_violation
+        self.violation: Optional[ResourceLimitExceeded] = None
+        self.peak_memory_mb: Optional[float] = None
+        self.peak_output_bytes = 0
+        self._start = time.monotonic()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="recipe-limit-watchdog", daemon=True)
+
+    def start(self) -> "LimitWatchdog":
+        self._start = time.monotonic()
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def check(self) -> Optional[ResourceLimitExceeded]:
+        """Sample the run once and return a violation, if any."""
+        limits = self.limits
+        if limits.max_wall_sec is not None:
+            elapsed = time.monotonic() - self._start
+            if elapsed > limits.max_wall_sec:
+                return ResourceLimitExceeded("wall_sec", round(elapsed, 1), limits.max_wall_sec)
+        if limits.max_memory_mb is not None:
+            rss = current_rss_mb()
+            if rss is not None:
+                self.peak_memory_mb = max(self.peak_memory_mb or 0.0, rss)
+                if rss > limits.max_memory_mb:
+                    return ResourceLimitExceeded("memory_mb", round(rss, 1), limits.max_memory_mb)
+        if limits.max_output_bytes is not None:
+            size = directory_size(self.output_dir)
+            self.peak_output_bytes = max(self.peak_output_bytes, size)
+            if size > limits.max_output_bytes:
+                return ResourceLimitExceeded("output_bytes", size, limits.max_output_bytes)
+        return None
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.limits.check_interval_sec):
+            violation = self.check()
+            if violation is not None:
+                self.violation = violation
+                logger.error(str(violation))
+                self.on_violation(violation)
+                return
+
+
+def _host_load() -> Optional[float]:
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (AttributeError, OSError):
+        return None
+
+
+def _host_available_mb() -> Optional[float]:
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError):
+        pass
+    try:
+        import psutil
+
+        return psutil.virtual_memory().available / (1024 * 1024)
+    except ImportError:
+        return None
+
+
+class AdmissionController:
+    """
+    Process-wide admission control for recipe runs.
+
+    A run is admitted when fewer than ``max_concurrent_runs`` runs are
+    active and, if configured, the host's 1-minute load average per CPU is
+    below ``max_load_per_cpu`` and at least ``min_available_mb`` of memory
+    is available. Otherwise it waits in FIFO order.
+
+    The process-wide instance returned by ``default()`` reads its settings
+    from AGENT_RECIPES_MAX_RUNS, AGENT_RECIPES_MAX_LOAD and
+    AGENT_RECIPES_MIN_AVAILABLE_MB.
+    """
+
+    _default: Optional["AdmissionController"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_concurrent_runs: Optional[int] = None,
+        max_load_per_cpu: Optional[float] = None,
+        min_available_mb: Optional[float] = None,
+        poll_interval_sec: float = 0.5,
+    ):
+        self.max_concurrent_runs = max_concurrent_runs or os.cpu_count() or 1
+        self.max_load_per_cpu = max_load_per_cpu
+        self.min_available_mb = min_available_mb
+        self.poll_interval_sec = poll_interval_sec
+        self._cond = threading.Condition()
+        self._active = 0
+        self._queue: list = []
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker processes get their own gate with the same settings
+        return {
+            "max_concurrent_runs": self.max_concurrent_runs,
+            "max_load_per_cpu": self.max_load_per_cpu,
+            "min_available_mb": self.min_available_mb,
+            "poll_interval_sec": self.poll_interval_sec,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)
+
+    @classmethod
+    def default(cls) -> "AdmissionController":
+        """Return the process-wide controller."""
+        with cls._default_lock:
+            if cls._default is None:
+                def _env(name, cast):
+                    value = os.environ.get(name)
+                    return cast(value) if value else None
+
+                cls._default = cls(
+                    max_concurrent_runs=_env("AGENT_RECIPES_MAX_RUNS", int),
+                    max_load_per_cpu=_env("AGENT_RECIPES_MAX_LOAD", float),
+                    min_available_mb=_env("AGENT_RECIPES_MIN_AVAILABLE_MB", float),
+                )
+            return cls._default
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        return len(self._queue)
+
+    def host_saturated(self) -> bool:
+        """Whether host load or memory is past the configured thresholds."""
+        if self.max_load_per_cpu is not None:
+            load = _host_load()
+            if load is not None and load > self.max_load_per_cpu:
+                return True
+        if self.min_available_mb is not None:
+            available = _host_available_mb()
+            if available is not None and available < self.min_available_mb:
+                return True
+        return False
+
+    def _try_admit(self, ticket: object) -> bool:
+        """Admit ticket if it is first in line and a slot is free (lock held)."""
+        if (
+            self._queue[0] is ticket
+            and self._active < self.max_concurrent_runs
+            and not self.host_saturated()
+        ):
+            self._queue.pop(0)
+            self._active += 1
+            self._cond.notify_all()
+            return True
+        return False
+
+    def _timeout_error(self, timeout: float) -> AdmissionTimeout:
+        return AdmissionTimeout(
+            f"Run not admitted within {timeout}s "
+            f"({self._active} active, {len(self._queue)} waiting)"
+        )
+
+    def acquire(self, timeout: Optional[float] = None) -> float:
+        """
+        Wait for admission.
+
+        Args:
+            timeout: Give up after this many seconds
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            AdmissionTimeout: If not admitted within timeout
+        """
+        start = time.monotonic()
+        ticket = object()
+        with self._cond:
+            self._queue.append(ticket)
+            try:
+                while True:
+                    if self._try_admit(ticket):
+                        return time.monotonic() - start
+                    remaining = None
+                    if timeout is not None:
+                        remaining = timeout - (time.monotonic() - start)
+                        if remaining <= 0:
+                            raise self._timeout_error(timeout)
+                    wait = self.poll_interval_sec
+                    if remaining is not None:
+                        wait = min(wait, remaining)
+                    self._cond.wait(wait)
+            except BaseException:
+                if ticket in self._queue:
+                    self._queue.remove(ticket)
+                    self._cond.notify_all()
+                raise
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> float:
+        """
+        Wait for admission without blocking a thread.
+
+        Same as ``acquire``, but the wait is an ``asyncio.sleep`` poll on
+        the event loop, so queued async runs do not hold executor threads
+        the admitted runs need.
+        """
+        import asyncio
+
+        start = time.monotonic()
+        ticket = object()
+        with self._cond:
+            self._queue.append(ticket)
+        try:
+            while True:
+                with self._cond:
+                    if self._try_admit(ticket):
+                        return time.monotonic() - start
+                wait = self.poll_interval_sec
+                if timeout is not None:
+                    remaining = timeout - (time.monotonic() - start)
+                    if remaining <= 0:
+                        with self._cond:
+                            raise self._timeout_error(timeout)
+                    wait = min(wait, remaining)
+                await asyncio.sleep(wait)
+        except BaseException:
+            with self._cond:
+                if ticket in self._queue:
+                    self._queue.remove(ticket)
+                    self._cond.notify_all()
+            raise
+
+    def release(self) -> None:
+        """Release an admitted run's slot."""
+        with self._cond:
+            self._active = max(0, self._active - 1)
+            self._cond.notify_all()
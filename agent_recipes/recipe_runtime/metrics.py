@@ -0,0 +1,214 @@
+"""
+Lightweight per-stage resource instrumentation.
+
+Measures, for a block of code:
+- Wall time
+- Number of subprocesses started from the block (counted through the
+  ``subprocess.Popen`` audit event, scoped with a context variable so
+  only the block's own thread or task, and ``asyncio.to_thread`` calls
+  it makes, are counted)
+- CPU time (including reaped child processes), peak RSS of the process
+  and its children, and bytes read/written through read/write syscalls
+
+The last group (``PROCESS_WIDE_METRICS``) comes from process-wide
+counters: it is only meaningful while the block is the only measured
+code running. When measured blocks overlap across threads or tasks those
+keys are left out and ``overlapped`` is set instead. ``peak_rss_mb`` is
+the process's high-water mark, not the block's own peak.
+
+Uses only the standard library on Linux/macOS; ``psutil`` is used for I/O
+counters where /proc is unavailable, if it is installed.
+"""
+
+import contextvars
+import functools
+import inspect
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Set, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Metrics read from process-wide counters; dropped for overlapping blocks
+PROCESS_WIDE_METRICS = ("cpu_sec", "peak_rss_mb", "read_bytes", "write_bytes")
+
+
+class _Block:
+    """Book-keeping for one active ``measure()`` block."""
+
+    __slots__ = ("subprocesses", "overlapped")
+
+    def __init__(self):
+        self.subprocesses = 0
+        self.overlapped = False
+
+
+# Enclosing measure() blocks of the current thread/task, outermost first
+_blocks: contextvars.ContextVar[Tuple[_Block, ...]] = contextvars.ContextVar(
+    "agent_recipes_measure_blocks", default=()
+)
+_active: Set[_Block] = set()
+_active_lock = threading.Lock()
+_hook_lock = threading.Lock()
+_hook_installed = False
+
+
+def _audit_hook(event: str, args: Tuple[Any, ...]) -> None:
+    if event == "subprocess.Popen":
+        for block in _blocks.get():
+            block.subprocesses += 1
+
+
+def _install_subprocess_hook() -> None:
+    """
+    Install the audit hook that counts subprocesses.
+
+    Audit hooks cannot be removed, but this one only reads a context
+    variable: it never replaces ``subprocess.Popen`` and counts nothing
+    outside a ``measure()`` block.
+    """
+    global _hook_installed
+    if _hook_installed:
+        return
+    with _hook_lock:
+        if not _hook_installed:
+            sys.addaudithook(_audit_hook)
+            _hook_installed = True
+
+
+def _io_counters() -> Optional[Tuple[int, int]]:
+    """Return (bytes_read, bytes_written) for this process, if available."""
+    try:
+        with open("/proc/self/io", "r") as f:
+            fields = dict(line.split(":", 1) for line in f if ":" in line)
+        return int(fields["rchar"]), int(fields["wchar"])
+    except (OSError, KeyError, ValueError):
+        pass
+    try:
+        import psutil
+
+        counters = psutil.Process().io_counters()
+        return counters.read_bytes, counters.write_bytes
+    except Exception:
+        return None
+
+
+def _rss_to_mb(maxrss: int) -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    if sys.platform == "darwin":
+        return maxrss / (1024 * 1024)
+    return maxrss / 1024
+
+
+def snapshot() -> Dict[str, Any]:
+    """Capture the current resource counters."""
+    snap: Dict[str, Any] = {
+        "wall": time.perf_counter(),
+        "cpu": time.process_time(),
+        "children_cpu": 0.0,
+        "peak_rss_mb": None,
+        "io": _io_counters(),
+    }
+    if resource is not None:
+        own = resource.getrusage(resource.RUSAGE_SELF)
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        snap["children_cpu"] = children.ru_utime + children.ru_stime
+        snap["peak_rss_mb"] = round(_rss_to_mb(max(own.ru_maxrss, children.ru_maxrss)), 1)
+    return snap
+
+
+def diff(start: Dict[str, Any], end: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn two snapshots into (process-wide) metrics."""
+    metrics: Dict[str, Any] = {
+        "duration_sec": round(end["wall"] - start["wall"], 3),
+        "cpu_sec": round(
+            (end["cpu"] - start["cpu"]) + (end["children_cpu"] - start["children_cpu"]), 3
+        ),
+        "peak_rss_mb": end["peak_rss_mb"],
+    }
+    if start["io"] is not None and end["io"] is not None:
+        metrics["read_bytes"] = end["io"][0] - start["io"][0]
+        metrics["write_bytes"] = end["io"][1] - start["io"][1]
+    return metrics
+
+
+@contextmanager
+def measure(sink: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Measure the resources used by a block.
+
+    The yielded dictionary is filled in when the block exits, so it can be
+    read afterwards (also when the block raises). Blocks may nest; a block
+    overlaps another when neither encloses the other, e.g. stages running
+    on two threads at once.
+
+    Example:
+        with measure() as m:
+            render()
+        print(m["duration_sec"], m.get("cpu_sec"))
+    """
+    _install_subprocess_hook()
+    metrics = sink if sink is not None else {}
+    block = _Block()
+    enclosing = _blocks.get()
+    with _active_lock:
+        for other in _active:
+            if other not in enclosing:
+                other.overlapped = True
+                block.overlapped = True
+        _active.add(block)
+    token = _blocks.set(enclosing + (block,))
+    start = snapshot()
+    try:
+        yield metrics
+    finally:
+        end = snapshot()
+        try:
+            _blocks.reset(token)
+        except ValueError:  # exited from another context
+            pass
+        with _active_lock:
+            _active.discard(block)
+        measured = diff(start, end)
+        measured["subprocesses"] = block.subprocesses
+        if block.overlapped:
+            for key in PROCESS_WIDE_METRICS:
+                measured.pop(key, None)
+            measured["overlapped"] = True
+        metrics.update(measured)
+
+
+def recipe_stage(name: str) -> Callable:
+    """
+    Decorator that runs a RecipeRunner method as a named, measured stage.
+
+    Works on plain and ``async def`` methods.
+
+    Example:
+        class MyRunner(RecipeRunner):
+            @recipe_stage("transcribe")
+            def transcribe(self, config):
+                ...
+    """
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                with self.stage(name):
+                    return await func(self, *args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with self.stage(name):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,401 @@
+"""
+Warm recipe server.
+
+Runs recipes in a long-lived process so short recipes do not pay for
+importing praisonaiagents, indexing templates, compiling agents.yaml and
+loading tools.py modules on every call. The server speaks newline-delimited
+JSON-RPC 2.0 over a Unix socket or stdin/stdout and runs requests on a pool
+of worker threads, building each run's workflow from the compiled recipe.
+
+When ``AGENT_RECIPES_SOCKET`` points at a running server, ``run_recipe``
+and ``call_recipe`` dispatch to it and fall back to running in-process if
+it cannot be reached.
+
+Usage:
+    python -m agent_recipes.server --socket /tmp/agent-recipes.sock --workers 4
+    python -m agent_recipes.server --stdio --preload wordpress-publisher
+"""
+
+import argparse
+import inspect
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SOCKET_ENV = "AGENT_RECIPES_SOCKET"
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+# Set in the server process so recipes calling other recipes run in-process
+# instead of dispatching back to the (possibly saturated) server.
+_serving = False
+
+
+class RecipeServerError(RuntimeError):
+    """Error response from the recipe server."""
+
+    def __init__(self, message: str, code: int = SERVER_ERROR):
+        self.code = code
+        super().__init__(message)
+
+
+class RecipeServer:
+    """
+    Dispatches JSON-RPC requests to warm recipe workers.
+
+    Args:
+        workers: Number of requests executed concurrently
+        preload: Recipes whose tools.py is imported at startup
+    """
+
+    def __init__(self, workers: int = 4, preload: Iterable[str] = ()):
+        self.workers = workers
+        self.preload = list(preload)
+        self._slots = threading.BoundedSemaphore(workers)
+        self._shutdown: Optional[Callable[[], None]] = None
+        self.methods: Dict[str, Callable[..., Any]] = {
+            "ping": lambda: "pong",
+            "list_templates": self._list_templates,
+            "run_recipe": self._run_recipe,
+            "call_recipe": self._call_recipe,
+            "reload_tools": self._reload_tools,
+            "shutdown": self._request_shutdown,
+        }
+
+    def warm(self) -> None:
+        """Do the one-off work every run would otherwise repeat."""
+        global _serving
+        _serving = True
+
+        from . import get_template_info, list_templates
+        from .recipe_compiler import compile_recipe
+        from .tools_cache import load_tools
+
+        try:
+            import praisonaiagents.workflows  # noqa: F401
+        except ImportError:
+            logger.warning("praisonaiagents is not installed; run_recipe will fail")
+
+        names = list_templates()
+        for name in names:
+            info = get_template_info(name)
+            if info.has_agents_yaml:
+                try:
+                    compile_recipe(info.agents_yaml)
+                except Exception as e:
+                    logger.warning(f"Could not compile {name}: {e}")
+        for name in self.preload:
+            info = get_template_info(name)
+            if info.has_tools:
+                load_tools(info.tools_py, f"{name}_tools")
+        logger.info(f"Recipe server warm: {len(names)} templates, {len(self.preload)} preloaded")
+
+    def _list_templates(self) -> List[str]:
+        from . import list_templates
+
+        return list_templates()
+
+    def _run_recipe(
+        self,
+        recipe_name: str,
+        input_data: Optional[str] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        verbose: bool = False,
+    ) -> Any:
+        from . import _run_recipe_local
+
+        return _run_recipe_local(recipe_name, input_data, variables, verbose)
+
+    def _call_recipe(self, recipe_name: str, input_data: str = "") -> str:
+        result = self.methods["run_recipe"](recipe_name, input_data=input_data)
+        return str(result.get("output", ""))
+
+    def _reload_tools(self, recipe_name: Optional[str] = None) -> None:
+        from . import reload_tools
+
+        reload_tools(recipe_name)
+
+    def _request_shutdown(self) -> bool:
+        if self._shutdown is not None:
+            threading.Thread(target=self._shutdown, daemon=True).start()
+        return True
+
+    def handle(self, line: str) -> Optional[Dict[str, Any]]:
+        """
+        Handle one JSON-RPC request line.
+
+        Returns:
+            The response object, or None for notifications
+        """
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return _error(None, PARSE_ERROR, f"Parse error: {e}")
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return _error(None, INVALID_REQUEST, "Invalid request")
+
+        request_id = request.get("id")
+        method = self.methods.get(request["method"])
+        if method is None:
+            return _error(request_id, METHOD_NOT_FOUND, f"Method not found: {request['method']}")
+
+        params = request.get("params") or {}
+        args, kwargs = (params, {}) if isinstance(params, list) else ((), params)
+        try:
+            inspect.signature(method).bind(*args, **kwargs)
+        except TypeError as e:
+            return _error(request_id, INVALID_PARAMS, str(e))
+        try:
+            with self._slots:
+                result = method(*args, **kwargs)
+        except Exception as e:
+            logger.exception(f"Request {request['method']} failed")
+            return _error(request_id, SERVER_ERROR, f"{type(e).__name__}: {e}")
+
+        if "id" not in request:
+            return None
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    def serve_unix(self, path: str) -> None:
+        """Serve on a Unix socket until a shutdown request or Ctrl-C."""
+        server_obj = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for raw in self.rfile:
+                    if not raw.strip():
+                        continue
+                    response = server_obj.handle(raw.decode("utf-8"))
+                    if response is not None:
+                        self.wfile.write(_encode(response))
+                        self.wfile.flush()
+
+        if os.path.exists(path):
+            os.unlink(path)
+        with socketserver.ThreadingUnixStreamServer(path, _Handler) as server:
+            server.daemon_threads = True
+            self._shutdown = server.shutdown
+            logger.info(f"Recipe server listening on {path}")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                if os.path.exists(path):
+                    os.unlink(path)
+
+    def serve_stdio(self, stdin=None, stdout=None) -> None:
+        """
+        Serve requests read line by line from stdin until EOF.
+
+        Responses are the only thing written to stdout: while serving,
+        ``sys.stdout`` (and, when serving the real stdout, file descriptor 1
+        for subprocesses and C extensions) is pointed at stderr, so prints
+        from recipes cannot corrupt the response stream.
+        """
+        stdin = stdin or sys.stdin
+        saved_stdout = sys.stdout
+        saved_fd = None
+        if stdout is None:
+            stdout = sys.stdout
+            try:
+                sys.stdout.flush()
+                saved_fd = os.dup(sys.stdout.fileno())
+                os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+                stdout = os.fdopen(os.dup(saved_fd), "w", encoding="utf-8")
+            except (AttributeError, OSError, ValueError):
+                # No real file descriptor (e.g. captured stdout)
+                if saved_fd is not None:
+                    os.close(saved_fd)
+                    saved_fd = None
+        write_lock = threading.Lock()
+        stopped = threading.Event()
+        self._shutdown = stopped.set
+
+        def _respond(line: str) -> None:
+            response = self.handle(line)
+            if response is not None:
+                with write_lock:
+                    stdout.write(_encode(response).decode("utf-8"))
+                    stdout.flush()
+
+        sys.stdout = sys.stderr
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for line in stdin:
+                    if stopped.is_set():
+                        break
+                    if line.strip():
+                        pool.submit(_respond, line)
+        finally:
+            sys.stdout = saved_stdout
+            if saved_fd is not None:
+                stdout.close()
+                os.dup2(saved_fd, saved_stdout.fileno())
+                os.close(saved_fd)
+
+
+def _encode(response: Dict[str, Any]) -> bytes:
+    return (json.dumps(response, default=str) + "\n").encode("utf-8")
+
+
+def _error(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+class RecipeClient:
+    """
+    Client for a recipe server listening on a Unix socket.
+
+    Each in-flight call uses its own connection, so calls from several
+    threads run concurrently on the server; connections are returned to a
+    small idle pool and reused. A client may be shared between threads.
+
+    Args:
+        socket_path: Server socket
+        timeout: Socket timeout in seconds
+        max_idle: Idle connections kept open for reuse
+    """
+
+    def __init__(self, socket_path: str, timeout: Optional[float] = None, max_idle: int = 8):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._idle: List[Tuple[socket.socket, Any]] = []
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> Tuple[socket.socket, Any]:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        return sock, sock.makefile("rb")
+
+    @staticmethod
+    def _discard(connection: Tuple[socket.socket, Any]) -> None:
+        sock, file = connection
+        file.close()
+        sock.close()
+
+    def close(self) -> None:
+        """Close the idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            self._discard(connection)
+
+    def call(self, method: str, **params) -> Any:
+        """Call a server method and return its result."""
+        with self._lock:
+            self._next_id += 1
+            request_id = self._next_id
+            connection = self._idle.pop() if self._idle else None
+        if connection is None:
+            connection = self._connect()
+
+        request = {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+        sock, file = connection
+        try:
+            sock.sendall(_encode(request))
+            line = file.readline()
+        except BaseException:
+            self._discard(connection)
+            raise
+        if not line:
+            self._discard(connection)
+            raise ConnectionError("Recipe server closed the connection")
+
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(connection)
+                connection = None
+        if connection is not None:
+            self._discard(connection)
+
+        response = json.loads(line)
+        if "error" in response:
+            error = response["error"]
+            raise RecipeServerError(error.get("message", ""), error.get("code", SERVER_ERROR))
+        return response.get("result")
+
+    def run_recipe(self, recipe_name: str, input_data: Optional[str] = None,
+                   variables: Optional[Dict[str, Any]] = None, verbose: bool = False) -> Any:
+        return self.call("run_recipe", recipe_name=recipe_name, input_data=input_data,
+                         variables=variables, verbose=verbose)
+
+    def call_recipe(self, recipe_name: str, input_data: str = "") -> str:
+        return self.call("call_recipe", recipe_name=recipe_name, input_data=input_data)
+
+
+_clients: Dict[str, RecipeClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client() -> Optional[RecipeClient]:
+    """Return a client for the server named by AGENT_RECIPES_SOCKET, if any."""
+    path = os.environ.get(SOCKET_ENV)
+    if _serving or not path or not os.path.exists(path):
+        return None
+    with _clients_lock:
+        client = _clients.get(path)
+        if client is None:
+            client = _clients[path] = RecipeClient(path)
+        return client
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        prog="agent_recipes.server",
+        description="Serve recipes from a warm, long-lived process"
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--socket", help=f"Unix socket path (default: ${SOCKET_ENV})")
+    mode.add_argument("--stdio", action="store_true", help="Serve JSON-RPC over stdin/stdout")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent requests (default: 4)")
+    parser.add_argument("--preload", default="",
+                        help="Comma-separated recipes whose tools are loaded at startup")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Verbose logging")
+    args = parser.parse_args(argv)
+
+    # Logs go to stderr so they never interleave with stdio responses
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        stream=sys.stderr,
+    )
+
+    server = RecipeServer(
+        workers=args.workers,
+        preload=[name for name in args.preload.split(",") if name],
+    )
+    server.warm()
+
+    if args.stdio:
+        server.serve_stdio()
+        return
+
+    path = args.socket or os.environ.get(SOCKET_ENV)
+    if not path:
+        parser.error(f"--socket or ${SOCKET_ENV} is required unless --stdio is given")
+    server.serve_unix(path)
+
+
+if __name__ == "__main__":
+    main()
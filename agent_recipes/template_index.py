@@ -0,0 +1,218 @@
+"""
+Template index for Agent Recipes.
+
+Builds an in-memory index of the bundled templates once, from the
+templates directory and ``manifest.yaml``, so resolving a recipe's path,
+tags, requirements or whether it ships a ``tools.py`` is a dictionary
+lookup. The index is rebuilt when the templates directory or the manifest
+changes; those mtimes are re-checked at most every ``check_interval``
+seconds so hot lookups do not hit the filesystem.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PACKAGE_DIR = Path(__file__).parent
+TEMPLATES_DIR = PACKAGE_DIR / "templates"
+MANIFEST_CANDIDATES = (PACKAGE_DIR / "manifest.yaml", PACKAGE_DIR.parent / "manifest.yaml")
+
+
+def _load_yaml(path: Path) -> Dict[str, Any]:
+    import yaml
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+    except (OSError, yaml.YAMLError) as e:
+        logger.warning(f"Could not read {path}: {e}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+@dataclass
+class TemplateInfo:
+    """Indexed metadata for one template."""
+    name: str
+    path: Path
+    has_agents_yaml: bool = False
+    has_recipe_yaml: bool = False
+    has_tools: bool = False
+    title: str = ""
+    version: Optional[str] = None
+    description: str = ""
+    tags: List[str] = field(default_factory=list)
+    _requires: Optional[Dict[str, Any]] = field(default=None, repr=False)
+
+    @property
+    def agents_yaml(self) -> Path:
+        return self.path / "agents.yaml"
+
+    @property
+    def tools_py(self) -> Path:
+        return self.path / "tools.py"
+
+    @property
+    def requires(self) -> Dict[str, Any]:
+        """
+        Template requirements (env, packages, external tools, ...).
+
+        Taken from the manifest when listed there, otherwise read once from
+        the template's recipe.yaml or agents.yaml ``metadata.requires``.
+        """
+        if self._requires is None:
+            requires: Dict[str, Any] = {}
+            if self.has_recipe_yaml:
+                requires = _load_yaml(self.path / "recipe.yaml").get("requires") or {}
+            if not requires and self.has_agents_yaml:
+                metadata = _load_yaml(self.agents_yaml).get("metadata") or {}
+                requires = metadata.get("requires") or {}
+            self._requires = requires
+        return self._requires
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "path": str(self.path),
+            "title": self.title,
+            "version": self.version,
+            "description": self.description,
+            "tags": list(self.tags),
+            "requires": self.requires,
+            "has_agents_yaml": self.has_agents_yaml,
+            "has_recipe_yaml": self.has_recipe_yaml,
+            "has_tools": self.has_tools,
+        }
+
+
+class TemplateIndex:
+    """
+    Lazily built, mtime-invalidated index of templates.
+
+    Args:
+        templates_dir: Directory containing one folder per template
+        manifest_path: manifest.yaml to merge metadata from (default: the
+            first of the package's or repository's manifest.yaml that exists)
+        check_interval: Minimum seconds between staleness checks
+    """
+
+    def __init__(
+        self,
+        templates_dir: Path = TEMPLATES_DIR,
+        manifest_path: Optional[Path] = None,
+        check_interval: float = 2.0,
+    ):
+        self.templates_dir = Path(templates_dir)
+        if manifest_path is None:
+            manifest_path = next((p for p in MANIFEST_CANDIDATES if p.exists()), None)
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+        self.check_interval = check_interval
+        self._templates: Dict[str, TemplateInfo] = {}
+        self._tags: Dict[str, List[str]] = {}
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _current_stamp(self) -> Tuple[int, int]:
+        def _mtime(path: Optional[Path]) -> int:
+            try:
+                return os.stat(path).st_mtime_ns if path else 0
+            except OSError:
+                return 0
+        return _mtime(self.templates_dir), _mtime(self.manifest_path)
+
+    def _build(self) -> None:
+        templates: Dict[str, TemplateInfo] = {}
+        if self.templates_dir.exists():
+            for entry in os.scandir(self.templates_dir):
+                if not entry.is_dir() or entry.name.startswith((".", "__")):
+                    continue
+                files = set(os.listdir(entry.path))
+                templates[entry.name] = TemplateInfo(
+                    name=entry.name,
+                    path=Path(entry.path),
+                    has_agents_yaml="agents.yaml" in files,
+                    has_recipe_yaml="recipe.yaml" in files,
+                    has_tools="tools.py" in files,
+                )
+
+        manifest = _load_yaml(self.manifest_path) if self.manifest_path else {}
+        for name, meta in (manifest.get("templates") or {}).items():
+            info = templates.get(name)
+            if info is None or not isinstance(meta, dict):
+                continue
+            info.title = meta.get("name", "")
+            info.version = meta.get("version")
+            info.description = meta.get("description", "")
+            info.tags = list(meta.get("tags") or [])
+            if meta.get("requires") is not None:
+                info._requires = meta["requires"]
+
+        tags: Dict[str, List[str]] = {}
+        for name in sorted(templates):
+            for tag in templates[name].tags:
+                tags.setdefault(tag, []).append(name)
+
+        self._templates = dict(sorted(templates.items()))
+        self._tags = tags
+
+    def _ensure_fresh(self) -> None:
+        now = time.monotonic()
+        if self._stamp is not None and now - self._checked_at < self.check_interval:
+            return
+        with self._lock:
+            if self._stamp is not None and now - self._checked_at < self.check_interval:
+                return
+            stamp = self._current_stamp()
+            if stamp != self._stamp:
+                self._build()
+                self._stamp = stamp
+            self._checked_at = now
+
+    def invalidate(self) -> None:
+        """Force a rebuild on the next lookup."""
+        with self._lock:
+            self._stamp = None
+
+    def get(self, name: str) -> Optional[TemplateInfo]:
+        """Return a template's info, or None if it does not exist."""
+        self._ensure_fresh()
+        return self._templates.get(name)
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+    def names(self) -> List[str]:
+        """Sorted template names."""
+        self._ensure_fresh()
+        return list(self._templates)
+
+    def templates(self) -> List[TemplateInfo]:
+        """All indexed templates, sorted by name."""
+        self._ensure_fresh()
+        return list(self._templates.values())
+
+    def by_tag(self, tag: str) -> List[str]:
+        """Names of templates carrying a tag."""
+        self._ensure_fresh()
+        return list(self._tags.get(tag, []))
+
+
+_index: Optional[TemplateIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_index() -> TemplateIndex:
+    """Return the process-wide index of the bundled templates."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = TemplateIndex()
+    return _index
@@ -17,29 +17,10 @@ logger = logging.getLogger(__name__)
 
 
 def call_llm(prompt: str, max_tokens: int = 1000) -> str:
-    """Call OpenAI API for text generation."""
-    import requests
-    
-    api_key = os.environ.get("OPENAI_API_KEY")
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY not set")
-    
-    response = requests.post(
-        "https://api.openai.com/v1/chat/completions",
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        },
-        json={
-            "model": "gpt-4o-mini",
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": max_tokens,
-            "temperature": 0.7,
-        },
-        timeout=90,
-    )
-    response.raise_for_status()
-    return response.json()["choices"][0]["message"]["content"]
+    """Call the shared LLM client for text generation."""
+    from agent_recipes.llm_client import call_llm as _call_llm
+
+    return _call_llm(prompt, max_tokens=max_tokens, temperature=0.7)
 
 
 def generate_brief(
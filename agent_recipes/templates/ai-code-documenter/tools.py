@@ -3,8 +3,11 @@ Tools for ai-code-documenter recipe.
 Uses CodeAgent for code explanation and documentation generation.
 """
 
-from praisonaiagents import CodeAgent
-from praisonaiagents.tools import read_file, write_file
+from agent_recipes.lazy import lazy_import
+
+CodeAgent = lazy_import("praisonaiagents", "CodeAgent")
+read_file = lazy_import("praisonaiagents.tools", "read_file")
+write_file = lazy_import("praisonaiagents.tools", "write_file")
 
 _code_agent = None
 
@@ -3,8 +3,12 @@ Tools for ai-code-reviewer recipe.
 Uses CodeAgent for intelligent code review.
 """
 
-from praisonaiagents import CodeAgent
-from praisonaiagents.tools import read_file, analyze_code, lint_code
+from agent_recipes.lazy import lazy_import
+
+CodeAgent = lazy_import("praisonaiagents", "CodeAgent")
+read_file = lazy_import("praisonaiagents.tools", "read_file")
+analyze_code = lazy_import("praisonaiagents.tools", "analyze_code")
+lint_code = lazy_import("praisonaiagents.tools", "lint_code")
 
 _code_agent = None
 
@@ -216,9 +216,9 @@ def crawl_url(url: str, extract_main_content: bool = True) -> Dict[str, Any]:
     except ImportError:
         debug_print("Crawl4AI not available, using Jina fallback...")
         try:
-            import requests
+            from agent_recipes import http_client
             jina_url = f"https://r.jina.ai/{url}"
-            resp = requests.get(jina_url, timeout=30)
+            resp = http_client.get(jina_url, timeout=30)
             success_print(f"Jina crawled {len(resp.text)} chars")
             return {
                 "url": url,
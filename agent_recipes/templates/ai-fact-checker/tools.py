@@ -16,29 +16,10 @@ logger = logging.getLogger(__name__)
 
 
 def call_llm(prompt: str, max_tokens: int = 1000) -> str:
-    """Call OpenAI API for text generation."""
-    import requests
-    
-    api_key = os.environ.get("OPENAI_API_KEY")
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY not set")
-    
-    response = requests.post(
-        "https://api.openai.com/v1/chat/completions",
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        },
-        json={
-            "model": "gpt-4o-mini",
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": max_tokens,
-            "temperature": 0.3,
-        },
-        timeout=60,
-    )
-    response.raise_for_status()
-    return response.json()["choices"][0]["message"]["content"]
+    """Call the shared LLM client for text generation."""
+    from agent_recipes.llm_client import call_llm as _call_llm
+
+    return _call_llm(prompt, max_tokens=max_tokens, temperature=0.3)
 
 
 def extract_claims(
@@ -112,12 +93,13 @@ def verify_claims(
     Returns:
         Dictionary with verification results
     """
-    verified = []
+    from agent_recipes.llm_client import get_llm_client
     
+    prompts = []
     for claim in claims:
         claim_text = claim.get("claim", "")
         
-        prompt = f"""Verify this claim and assess its accuracy:
+        prompts.append(f"""Verify this claim and assess its accuracy:
 
 Claim: {claim_text}
 
@@ -129,36 +111,42 @@ Provide:
 Format:
 VERDICT: [verdict]
 EXPLANATION: [explanation]
-SUGGESTED_SOURCE: [source type]"""
-        
-        try:
-            result = call_llm(prompt, max_tokens=300)
-            
-            verification = {
-                **claim,
-                "verdict": "UNVERIFIABLE",
-                "explanation": "",
-                "suggested_source": "",
-            }
-            
-            for line in result.split("\n"):
-                line = line.strip()
-                if line.startswith("VERDICT:"):
-                    verification["verdict"] = line[8:].strip().upper()
-                elif line.startswith("EXPLANATION:"):
-                    verification["explanation"] = line[12:].strip()
-                elif line.startswith("SUGGESTED_SOURCE:"):
-                    verification["suggested_source"] = line[17:].strip()
-            
-            verified.append(verification)
-            
-        except Exception as e:
-            logger.warning(f"Error verifying claim: {e}")
+SUGGESTED_SOURCE: [source type]""")
+    
+    # Verify all claims concurrently through the shared LLM client; verdicts
+    # for recurring claims may be served from the response cache
+    results = get_llm_client().complete_many(
+        prompts, return_exceptions=True, cache=True, max_tokens=300, temperature=0.3
+    )
+    
+    verified = []
+    for claim, result in zip(claims, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Error verifying claim: {result}")
             verified.append({
                 **claim,
                 "verdict": "ERROR",
-                "explanation": str(e),
+                "explanation": str(result),
             })
+            continue
+        
+        verification = {
+            **claim,
+            "verdict": "UNVERIFIABLE",
+            "explanation": "",
+            "suggested_source": "",
+        }
+        
+        for line in result.split("\n"):
+            line = line.strip()
+            if line.startswith("VERDICT:"):
+                verification["verdict"] = line[8:].strip().upper()
+            elif line.startswith("EXPLANATION:"):
+                verification["explanation"] = line[12:].strip()
+            elif line.startswith("SUGGESTED_SOURCE:"):
+                verification["suggested_source"] = line[17:].strip()
+        
+        verified.append(verification)
     
     # Generate flags for problematic claims
     flags = []
@@ -212,9 +200,9 @@ def find_citations(
         
         if use_web_search and tavily_key:
             try:
-                import requests
+                from agent_recipes import http_client
                 
-                response = requests.post(
+                response = http_client.post(
                     "https://api.tavily.com/search",
                     json={
                         "api_key": tavily_key,
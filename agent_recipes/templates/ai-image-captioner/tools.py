@@ -3,7 +3,9 @@ Tools for ai-image-captioner recipe.
 Uses VisionAgent for intelligent image analysis and captioning.
 """
 
-from praisonaiagents import VisionAgent
+from agent_recipes.lazy import lazy_import
+
+VisionAgent = lazy_import("praisonaiagents", "VisionAgent")
 
 # Lazy-load the vision agent
 _vision_agent = None
@@ -3,11 +3,15 @@ Tools for ai-image-cataloger recipe.
 Uses VisionAgent for image analysis and file tools for organization.
 """
 
-from praisonaiagents import VisionAgent
-from praisonaiagents.tools import read_file, list_files
 import os
 import json
 
+from agent_recipes.lazy import lazy_import
+
+VisionAgent = lazy_import("praisonaiagents", "VisionAgent")
+read_file = lazy_import("praisonaiagents.tools", "read_file")
+list_files = lazy_import("praisonaiagents.tools", "list_files")
+
 _vision_agent = None
 
 def _get_vision_agent():
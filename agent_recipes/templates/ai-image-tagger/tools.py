@@ -3,7 +3,9 @@ Tools for ai-image-tagger recipe.
 Uses VisionAgent for intelligent image tagging and categorization.
 """
 
-from praisonaiagents import VisionAgent
+from agent_recipes.lazy import lazy_import
+
+VisionAgent = lazy_import("praisonaiagents", "VisionAgent")
 
 _vision_agent = None
 
@@ -13,123 +13,422 @@ Tools for crawling AI news from multiple sources:
 import json
 import os
 import logging
+import tempfile
+import threading
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 from urllib.parse import urljoin
 
 logger = logging.getLogger(__name__)
 
 
-def crawl_hackernews(
+class CrawlState:
+    """
+    Persistent state for incremental crawls.
+    
+    Remembers the items already returned (with their last score), stories
+    known not to match (so they are not refetched) and the ETag/Last-Modified
+    of each endpoint, so later crawls send conditional requests and only
+    return new or changed items. State is a JSON file; items, ignored stories
+    and endpoint validators not refreshed for ``max_age_hours`` are forgotten
+    on save.
+    
+    Crawlers only stage what they find: an item is recorded when it is
+    ``commit``-ted as part of a crawl's result, and an endpoint's validators
+    are recorded once the endpoint was read to the end and every candidate
+    it produced was committed. Items a crawl drops (top-k cut, timed-out
+    source) therefore come back next time instead of hiding behind a 304.
+    """
+    
+    def __init__(self, path: str, max_age_hours: float = 168):
+        self.path = path
+        self.max_age_hours = max_age_hours
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self.ignored: Dict[str, float] = {}
+        self.endpoints: Dict[str, Dict[str, str]] = {}
+        # url -> {"validators": ..., "keys": candidate keys, "done": bool}
+        self._staged: Dict[str, Dict[str, Any]] = {}
+        self._candidates: set = set()
+        self._committed: set = set()
+        self._closed = False
+        self._lock = threading.Lock()
+        self.load()
+    
+    def load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.items = data.get("items", {})
+        self.ignored = data.get("ignored", {})
+        self.endpoints = data.get("endpoints", {})
+    
+    def save(self) -> None:
+        import time
+        
+        cutoff = time.time() - self.max_age_hours * 3600
+        with self._lock:
+            self.items = {k: v for k, v in self.items.items() if v.get("seen_at", 0) >= cutoff}
+            self.ignored = {k: v for k, v in self.ignored.items() if v >= cutoff}
+            self.endpoints = {k: v for k, v in self.endpoints.items() if v.get("seen_at", 0) >= cutoff}
+            data = {"items": self.items, "ignored": self.ignored, "endpoints": self.endpoints}
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        # A unique temp file per save, so concurrent crawls sharing a state
+        # file never write into each other's partial output
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".crawl-state-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    def close(self) -> None:
+        """Ignore further updates, e.g. from sources still running after a timeout."""
+        with self._lock:
+            self._closed = True
+            self._staged.clear()
+            self._candidates.clear()
+            self._committed.clear()
+    
+    @staticmethod
+    def key_for(article: Dict[str, Any]) -> str:
+        """State key of an article: its source family and URL."""
+        return f"{article.get('source', '').split('/')[0]}:{article.get('url', '')}"
+    
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for an endpoint."""
+        with self._lock:
+            validators = self.endpoints.get(url, {})
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+    
+    def record_validators(self, url: str, response_headers: Any) -> None:
+        """Stage an endpoint's validators until its items are committed."""
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        with self._lock:
+            if self._closed:
+                return
+            self._staged[url] = {
+                "validators": {"etag": etag or "", "last_modified": last_modified or ""}
+                if etag or last_modified else None,
+                "keys": set(),
+                "done": False,
+            }
+    
+    def endpoint_done(self, url: str) -> None:
+        """Mark a staged endpoint as read to the end."""
+        with self._lock:
+            if url in self._staged:
+                self._staged[url]["done"] = True
+    
+    def is_ignored(self, key: str) -> bool:
+        with self._lock:
+            return key in self.ignored
+    
+    def ignore(self, key: str) -> None:
+        """Remember an item that will never be returned (e.g. off-topic)."""
+        import time
+        
+        with self._lock:
+            if not self._closed:
+                self.ignored[key] = time.time()
+    
+    def is_new_or_changed(self, key: str, score: Any = 0, endpoint: Optional[str] = None) -> bool:
+        """
+        Whether an item is new or its score changed since it was last returned.
+        
+        Does not record the item (see ``commit``); a key is only reported
+        once per crawl, so duplicates across endpoints are dropped.
+        """
+        with self._lock:
+            if self._closed or key in self._candidates:
+                return False
+            previous = self.items.get(key)
+            if previous is not None and previous.get("score") == score:
+                return False
+            self._candidates.add(key)
+            if endpoint in self._staged:
+                self._staged[endpoint]["keys"].add(key)
+            return True
+    
+    def commit(self, articles: List[Dict[str, Any]]) -> None:
+        """
+        Record the articles a crawl actually returned.
+        
+        Also records the validators of every endpoint that was read to the
+        end and whose candidates have all been returned.
+        """
+        import time
+        
+        now = time.time()
+        with self._lock:
+            if self._closed:
+                return
+            for article in articles:
+                key = self.key_for(article)
+                self.items[key] = {"score": article.get("score", 0), "seen_at": now}
+                self._committed.add(key)
+            for url, staged in list(self._staged.items()):
+                if staged["done"] and staged["keys"] <= self._committed:
+                    if staged["validators"]:
+                        self.endpoints[url] = {**staged["validators"], "seen_at": now}
+                    else:
+                        self.endpoints.pop(url, None)
+                    del self._staged[url]
+
+
+def _conditional_get(url: str, state: Optional[CrawlState] = None, headers: Optional[Dict[str, str]] = None, **kwargs):
+    """
+    GET with If-None-Match/If-Modified-Since from the crawl state.
+    
+    Responses that are not returned (304s and errors) are closed, so
+    streamed connections go back to the pool.
+    
+    Returns:
+        The response, or None if the endpoint is unchanged (HTTP 304)
+    """
+    from agent_recipes import http_client
+    
+    headers = dict(headers or {})
+    if state is not None:
+        headers.update(state.conditional_headers(url))
+    response = http_client.get(url, headers=headers, **kwargs)
+    if response.status_code == 304:
+        response.close()
+        logger.info(f"Not modified since last crawl: {url}")
+        return None
+    try:
+        response.raise_for_status()
+    except Exception:
+        response.close()
+        raise
+    if state is not None:
+        state.record_validators(url, response.headers)
+    return response
+
+
+def _committed(state: Optional[CrawlState], articles: Iterator[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Materialize a crawler's articles and commit them all to the state."""
+    articles = list(articles)
+    if state is not None:
+        state.commit(articles)
+    return articles
+
+
+HN_API_URL = "https://hacker-news.firebaseio.com/v0"
+HN_DEFAULT_KEYWORDS = ["ai", "gpt", "llm", "machine learning", "openai", "anthropic", "google ai", "neural", "transformer"]
+
+
+def _fetch_hn_item(story_id: int) -> Optional[Dict[str, Any]]:
+    """Fetch one HackerNews item, or None if it cannot be fetched."""
+    from agent_recipes import http_client
+    
+    try:
+        response = http_client.get(f"{HN_API_URL}/item/{story_id}.json", timeout=5)
+        return response.json()
+    except Exception as e:
+        logger.warning(f"Error fetching story {story_id}: {e}")
+        return None
+
+
+def _hn_article(
+    story: Optional[Dict[str, Any]],
+    story_id: int,
+    keywords: List[str],
+    cutoff_time: datetime,
+) -> Optional[Dict[str, Any]]:
+    """Convert an HN item to an article if it is an AI-related story in the time window."""
+    if not story or story.get("type") != "story":
+        return None
+    
+    title = story.get("title", "").lower()
+    
+    # Check if AI-related
+    if not any(kw in title for kw in keywords):
+        return None
+    
+    # Check time window
+    story_time = datetime.fromtimestamp(story.get("time", 0), tz=timezone.utc)
+    if story_time < cutoff_time:
+        return None
+    
+    return {
+        "title": story.get("title", ""),
+        "url": story.get("url", f"https://news.ycombinator.com/item?id={story_id}"),
+        "source": "hackernews",
+        "published": story_time.isoformat(),
+        "score": story.get("score", 0),
+        "comments": story.get("descendants", 0),
+        "author": story.get("by", ""),
+        "content": "",  # HN doesn't provide content
+    }
+
+
+def iter_hackernews(
     max_articles: int = 20,
     time_window_hours: int = 24,
     keywords: Optional[List[str]] = None,
-) -> List[Dict[str, Any]]:
+    concurrency: int = 8,
+    state: Optional[CrawlState] = None,
+) -> Iterator[Dict[str, Any]]:
     """
-    Crawl HackerNews for AI-related stories.
+    Yield AI-related HackerNews stories as they are fetched.
+    
+    Items are fetched concurrently, at most ``concurrency`` at a time, and
+    checked in top-stories order; fetching stops as soon as
+    ``max_articles`` matching stories are found.
     
     Args:
         max_articles: Maximum number of articles to fetch
         time_window_hours: Only fetch articles from the last N hours
         keywords: Filter by keywords (default: AI-related terms)
+        concurrency: Maximum concurrent item requests (1 fetches serially)
+        state: Crawl state; stories returned before are refetched and only
+            returned again if their score changed, stories known not to
+            match are skipped without being fetched
         
-    Returns:
-        List of article dictionaries
+    Yields:
+        Article dictionaries
     """
-    import requests
+    from concurrent.futures import ThreadPoolExecutor
     
-    keywords = keywords or ["ai", "gpt", "llm", "machine learning", "openai", "anthropic", "google ai", "neural", "transformer"]
+    keywords = keywords or HN_DEFAULT_KEYWORDS
     
-    articles = []
-    base_url = "https://hacker-news.firebaseio.com/v0"
+    count = 0
     
     try:
         # Get top stories
-        response = requests.get(f"{base_url}/topstories.json", timeout=10)
-        response.raise_for_status()
+        top_url = f"{HN_API_URL}/topstories.json"
+        response = _conditional_get(top_url, state, timeout=10)
+        if response is None:
+            return
         story_ids = response.json()[:100]  # Get top 100 to filter
+        if state is not None:
+            story_ids = [i for i in story_ids if not state.is_ignored(f"hackernews:{i}")]
         
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=time_window_hours)
         
-        for story_id in story_ids:
-            if len(articles) >= max_articles:
-                break
-                
+        # Keep a bounded window of requests in flight and consume them in
+        # ranking order, so results match a serial crawl
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            pending = iter(story_ids)
+            window = []
+            for story_id in pending:
+                window.append((story_id, pool.submit(_fetch_hn_item, story_id)))
+                if len(window) >= concurrency:
+                    break
+            
             try:
-                story_response = requests.get(f"{base_url}/item/{story_id}.json", timeout=5)
-                story = story_response.json()
-                
-                if not story or story.get("type") != "story":
-                    continue
-                
-                title = story.get("title", "").lower()
-                
-                # Check if AI-related
-                if not any(kw in title for kw in keywords):
-                    continue
-                
-                # Check time window
-                story_time = datetime.fromtimestamp(story.get("time", 0), tz=timezone.utc)
-                if story_time < cutoff_time:
-                    continue
+                while window and count < max_articles:
+                    story_id, future = window.pop(0)
+                    next_id = next(pending, None)
+                    if next_id is not None:
+                        window.append((next_id, pool.submit(_fetch_hn_item, next_id)))
+                    
+                    story = future.result()
+                    article = _hn_article(story, story_id, keywords, cutoff_time)
+                    if state is not None and article is None and story:
+                        # Remember non-matching stories so they are not refetched
+                        state.ignore(f"hackernews:{story_id}")
+                    if article is None:
+                        continue
+                    if state is not None and not state.is_new_or_changed(
+                        CrawlState.key_for(article), article["score"], endpoint=top_url
+                    ):
+                        continue
+                    count += 1
+                    yield article
                 
-                articles.append({
-                    "title": story.get("title", ""),
-                    "url": story.get("url", f"https://news.ycombinator.com/item?id={story_id}"),
-                    "source": "hackernews",
-                    "published": story_time.isoformat(),
-                    "score": story.get("score", 0),
-                    "comments": story.get("descendants", 0),
-                    "author": story.get("by", ""),
-                    "content": "",  # HN doesn't provide content
-                })
-            except Exception as e:
-                logger.warning(f"Error fetching story {story_id}: {e}")
-                continue
+                if not window and state is not None:
+                    state.endpoint_done(top_url)
+            finally:
+                # Stop early (or on close): drop requests that have not started yet
+                for _, future in window:
+                    future.cancel()
                 
     except Exception as e:
         logger.error(f"Error crawling HackerNews: {e}")
-    
-    return articles
 
 
-def crawl_reddit(
-    subreddits: Optional[List[str]] = None,
+def crawl_hackernews(
     max_articles: int = 20,
     time_window_hours: int = 24,
+    keywords: Optional[List[str]] = None,
+    concurrency: int = 8,
+    state: Optional[CrawlState] = None,
 ) -> List[Dict[str, Any]]:
     """
-    Crawl Reddit for AI-related posts.
+    Crawl HackerNews for AI-related stories.
+    
+    Items are fetched concurrently, at most ``concurrency`` at a time, and
+    checked in top-stories order; fetching stops as soon as
+    ``max_articles`` matching stories are found.
     
     Args:
-        subreddits: List of subreddits to crawl
         max_articles: Maximum number of articles to fetch
         time_window_hours: Only fetch articles from the last N hours
+        keywords: Filter by keywords (default: AI-related terms)
+        concurrency: Maximum concurrent item requests (1 fetches serially)
+        state: Crawl state; only new stories or stories whose score changed
+            are returned, and the returned ones are committed to it
         
     Returns:
         List of article dictionaries
     """
-    import requests
+    return _committed(state, iter_hackernews(max_articles, time_window_hours, keywords, concurrency, state))
+
+
+def iter_reddit(
+    subreddits: Optional[List[str]] = None,
+    max_articles: int = 20,
+    time_window_hours: int = 24,
+    state: Optional[CrawlState] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield AI-related Reddit posts as each subreddit listing arrives.
     
+    Args:
+        subreddits: List of subreddits to crawl
+        max_articles: Maximum number of articles to fetch
+        time_window_hours: Only fetch articles from the last N hours
+        state: Crawl state; only new posts or posts whose score changed
+            are returned
+        
+    Yields:
+        Article dictionaries
+    """
     subreddits = subreddits or ["MachineLearning", "artificial", "LocalLLaMA", "OpenAI", "ClaudeAI"]
-    articles = []
+    count = 0
     
     headers = {"User-Agent": "PraisonAI News Crawler 1.0"}
     
     for subreddit in subreddits:
-        if len(articles) >= max_articles:
+        if count >= max_articles:
             break
             
         try:
             url = f"https://www.reddit.com/r/{subreddit}/hot.json?limit=25"
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
+            response = _conditional_get(url, state, headers=headers, timeout=10)
+            if response is None:
+                continue
             data = response.json()
             
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=time_window_hours)
             
             for post in data.get("data", {}).get("children", []):
-                if len(articles) >= max_articles:
+                if count >= max_articles:
                     break
                     
                 post_data = post.get("data", {})
@@ -139,7 +438,7 @@ def crawl_reddit(
                 if created < cutoff_time:
                     continue
                 
-                articles.append({
+                article = {
                     "title": post_data.get("title", ""),
                     "url": post_data.get("url", ""),
                     "source": f"reddit/r/{subreddit}",
@@ -148,90 +447,228 @@ def crawl_reddit(
                     "comments": post_data.get("num_comments", 0),
                     "author": post_data.get("author", ""),
                     "content": post_data.get("selftext", "")[:500],
-                })
+                }
+                if state is not None and not state.is_new_or_changed(
+                    CrawlState.key_for(article), article["score"], endpoint=url
+                ):
+                    continue
+                
+                count += 1
+                yield article
+            else:
+                if state is not None:
+                    state.endpoint_done(url)
                 
         except Exception as e:
             logger.warning(f"Error crawling r/{subreddit}: {e}")
             continue
+
+
+def crawl_reddit(
+    subreddits: Optional[List[str]] = None,
+    max_articles: int = 20,
+    time_window_hours: int = 24,
+    state: Optional[CrawlState] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Crawl Reddit for AI-related posts.
     
-    return articles
+    Args:
+        subreddits: List of subreddits to crawl
+        max_articles: Maximum number of articles to fetch
+        time_window_hours: Only fetch articles from the last N hours
+        state: Crawl state; only new posts or posts whose score changed
+            are returned, and the returned ones are committed to it
+        
+    Returns:
+        List of article dictionaries
+    """
+    return _committed(state, iter_reddit(subreddits, max_articles, time_window_hours, state))
 
 
-def crawl_arxiv(
+ARXIV_API_URL = "http://export.arxiv.org/api/query"
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+
+def _iter_atom_entries(response) -> Iterator[Any]:
+    """
+    Incrementally parse an Atom feed from a streamed response.
+    
+    Yields each ``<entry>`` element once it is complete and then drops it
+    from the tree, so memory stays flat however long the feed is.
+    """
+    import xml.etree.ElementTree as ET
+    
+    source = response.raw
+    source.decode_content = True
+    root = None
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+            continue
+        if elem.tag == f"{ATOM_NS}entry":
+            yield elem
+            root.clear()
+
+
+def _parse_published(text: Optional[str]) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(text.strip().replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+
+
+def _arxiv_article(entry) -> Dict[str, Any]:
+    title = entry.find(f"{ATOM_NS}title")
+    summary = entry.find(f"{ATOM_NS}summary")
+    published = entry.find(f"{ATOM_NS}published")
+    link = entry.find(f"{ATOM_NS}id")
+    authors = entry.findall(f"{ATOM_NS}author/{ATOM_NS}name")
+    return {
+        "title": title.text.strip() if title is not None and title.text else "",
+        "url": link.text if link is not None else "",
+        "source": "arxiv",
+        "published": published.text if published is not None else "",
+        "content": summary.text.strip()[:500] if summary is not None and summary.text else "",
+        "authors": [a.text for a in authors],
+        "score": 0,
+    }
+
+
+def iter_arxiv(
     categories: Optional[List[str]] = None,
     max_articles: int = 20,
     time_window_hours: int = 48,
-) -> List[Dict[str, Any]]:
+    state: Optional[CrawlState] = None,
+    page_size: int = 100,
+    page_delay: float = 3.0,
+) -> Iterator[Dict[str, Any]]:
     """
-    Crawl arXiv for AI research papers.
+    Yield recent arXiv papers from the AI categories.
+    
+    Results are requested newest first, a page at a time via the API's
+    ``start`` parameter, and each page is parsed as it streams in. The
+    crawl stops at the first paper older than the time window, so no
+    further pages are downloaded.
     
     Args:
         categories: arXiv categories to search
         max_articles: Maximum number of papers to fetch
         time_window_hours: Only fetch papers from the last N hours
+        state: Crawl state; only papers not returned before are included
+        page_size: Papers requested per API call
+        page_delay: Seconds to wait between API calls, as the arXiv API
+            terms of use ask
         
-    Returns:
-        List of paper dictionaries
+    Yields:
+        Article dictionaries
     """
-    import requests
-    import xml.etree.ElementTree as ET
+    import time
     
     categories = categories or ["cs.AI", "cs.LG", "cs.CL", "cs.CV", "cs.NE"]
-    articles = []
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=time_window_hours)
+    page_size = max(1, min(page_size, max_articles))
+    count = 0
+    start = 0
     
     try:
         # Build query
         cat_query = " OR ".join([f"cat:{cat}" for cat in categories])
-        url = f"http://export.arxiv.org/api/query?search_query={cat_query}&sortBy=submittedDate&sortOrder=descending&max_results={max_articles}"
-        
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
         
-        # Parse XML
-        root = ET.fromstring(response.content)
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
-        
-        for entry in root.findall("atom:entry", ns):
-            title = entry.find("atom:title", ns)
-            summary = entry.find("atom:summary", ns)
-            published = entry.find("atom:published", ns)
-            link = entry.find("atom:id", ns)
-            authors = entry.findall("atom:author/atom:name", ns)
+        while count < max_articles:
+            if start and page_delay:
+                time.sleep(page_delay)
+            url = (
+                f"{ARXIV_API_URL}?search_query={cat_query}&sortBy=submittedDate"
+                f"&sortOrder=descending&start={start}&max_results={page_size}"
+            )
+            response = _conditional_get(url, state, timeout=30, stream=True)
+            if response is None:
+                return
             
-            articles.append({
-                "title": title.text.strip() if title is not None else "",
-                "url": link.text if link is not None else "",
-                "source": "arxiv",
-                "published": published.text if published is not None else "",
-                "content": summary.text.strip()[:500] if summary is not None else "",
-                "authors": [a.text for a in authors],
-                "score": 0,
-            })
+            entries = 0
+            try:
+                for entry in _iter_atom_entries(response):
+                    entries += 1
+                    article = _arxiv_article(entry)
+                    
+                    # Results are newest first: stop at the first paper
+                    # outside the window
+                    published = _parse_published(article["published"])
+                    if published is not None and published < cutoff:
+                        if state is not None:
+                            state.endpoint_done(url)
+                        return
+                    
+                    if state is not None and not state.is_new_or_changed(
+                        CrawlState.key_for(article), article["score"], endpoint=url
+                    ):
+                        continue
+                    
+                    count += 1
+                    yield article
+                    if count >= max_articles:
+                        return
+                if state is not None:
+                    state.endpoint_done(url)
+            finally:
+                response.close()
+            
+            if entries < page_size:
+                return
+            start += page_size
             
     except Exception as e:
         logger.error(f"Error crawling arXiv: {e}")
+
+
+def crawl_arxiv(
+    categories: Optional[List[str]] = None,
+    max_articles: int = 20,
+    time_window_hours: int = 48,
+    state: Optional[CrawlState] = None,
+    page_size: int = 100,
+    page_delay: float = 3.0,
+) -> List[Dict[str, Any]]:
+    """
+    Crawl arXiv for AI research papers.
     
-    return articles
+    Args:
+        categories: arXiv categories to search
+        max_articles: Maximum number of papers to fetch
+        time_window_hours: Only fetch papers from the last N hours
+        state: Crawl state; only papers not returned before are included,
+            and the returned ones are committed to it
+        page_size: Papers requested per API call
+        page_delay: Seconds to wait between API calls
+        
+    Returns:
+        List of paper dictionaries
+    """
+    return _committed(state, iter_arxiv(categories, max_articles, time_window_hours, state, page_size, page_delay))
 
 
-def crawl_github_trending(
+def iter_github_trending(
     language: Optional[str] = None,
     max_repos: int = 20,
-) -> List[Dict[str, Any]]:
+    state: Optional[CrawlState] = None,
+) -> Iterator[Dict[str, Any]]:
     """
-    Crawl GitHub trending repositories for AI projects.
+    Yield AI-related GitHub trending repositories.
     
     Args:
         language: Filter by programming language
         max_repos: Maximum number of repos to fetch
+        state: Crawl state; only new repos or repos whose stars changed
+            are returned
         
-    Returns:
-        List of repository dictionaries
+    Yields:
+        Article dictionaries
     """
-    import requests
-    from bs4 import BeautifulSoup
+    from agent_recipes import html_extract
     
-    articles = []
+    count = 0
     
     try:
         url = "https://github.com/trending"
@@ -240,55 +677,76 @@ def crawl_github_trending(
         url += "?since=daily"
         
         headers = {"User-Agent": "PraisonAI News Crawler 1.0"}
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        response = _conditional_get(url, state, headers=headers, timeout=10)
+        if response is None:
+            return
         
-        soup = BeautifulSoup(response.text, "html.parser")
+        repos = html_extract.trending_repos(response.text, limit=max_repos * 2)
         
         # AI-related keywords
         ai_keywords = ["ai", "llm", "gpt", "transformer", "neural", "ml", "machine-learning", 
                        "deep-learning", "nlp", "vision", "agent", "rag", "embedding"]
         
-        for article in soup.select("article.Box-row")[:max_repos * 2]:
+        for repo in repos:
+            if count >= max_repos:
+                break
             try:
-                repo_link = article.select_one("h2 a")
-                if not repo_link:
-                    continue
-                    
-                repo_name = repo_link.get_text(strip=True).replace("\n", "").replace(" ", "")
-                repo_url = "https://github.com" + repo_link.get("href", "")
-                
-                description_elem = article.select_one("p")
-                description = description_elem.get_text(strip=True) if description_elem else ""
+                repo_name = repo["name"]
+                repo_url = "https://github.com" + repo["href"]
+                description = repo["description"]
                 
                 # Check if AI-related
                 text_to_check = (repo_name + " " + description).lower()
                 if not any(kw in text_to_check for kw in ai_keywords):
                     continue
                 
-                stars_elem = article.select_one("a[href*='/stargazers']")
-                stars = stars_elem.get_text(strip=True).replace(",", "") if stars_elem else "0"
-                
-                articles.append({
+                stars = repo["stars"]
+                article = {
                     "title": repo_name,
                     "url": repo_url,
                     "source": "github_trending",
                     "published": datetime.now(timezone.utc).isoformat(),
                     "content": description,
                     "score": int(stars) if stars.isdigit() else 0,
-                })
+                }
                 
-                if len(articles) >= max_repos:
-                    break
+                if state is not None and not state.is_new_or_changed(
+                    CrawlState.key_for(article), article["score"], endpoint=url
+                ):
+                    continue
+                
+                count += 1
+                yield article
                     
             except Exception as e:
                 logger.warning(f"Error parsing repo: {e}")
                 continue
+        else:
+            if state is not None:
+                state.endpoint_done(url)
                 
     except Exception as e:
         logger.error(f"Error crawling GitHub trending: {e}")
+
+
+def crawl_github_trending(
+    language: Optional[str] = None,
+    max_repos: int = 20,
+    state: Optional[CrawlState] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Crawl GitHub trending repositories for AI projects.
     
-    return articles
+    Args:
+        language: Filter by programming language
+        max_repos: Maximum number of repos to fetch
+        state: Crawl state; only new repos or repos whose stars changed
+            are returned, and the returned ones are committed to it
+        
+    Returns:
+        List of repository dictionaries
+    """
+    return _committed(state, iter_github_trending(language, max_repos, state))
 
 
 def search_web(
@@ -310,12 +768,12 @@ def search_web(
         logger.warning("TAVILY_API_KEY not set, skipping web search")
         return []
     
-    import requests
+    from agent_recipes import http_client
     
     articles = []
     
     try:
-        response = requests.post(
+        response = http_client.post(
             "https://api.tavily.com/search",
             json={
                 "api_key": api_key,
@@ -345,62 +803,250 @@ def search_web(
     return articles
 
 
+def _search_web_new(limit: int, state: Optional[CrawlState]) -> List[Dict[str, Any]]:
+    articles = search_web("AI news today", max_results=limit)
+    if state is None:
+        return articles
+    return [a for a in articles if state.is_new_or_changed(CrawlState.key_for(a), a.get("score", 0))]
+
+
+# Candidates per source; crawl_ai_news commits to the state only the
+# articles it returns
+SOURCE_CRAWLERS = {
+    "hackernews": lambda limit, hours, state: list(iter_hackernews(max_articles=limit, time_window_hours=hours, state=state)),
+    "reddit": lambda limit, hours, state: list(iter_reddit(max_articles=limit, time_window_hours=hours, state=state)),
+    "arxiv": lambda limit, hours, state: list(iter_arxiv(max_articles=limit, time_window_hours=hours, state=state)),
+    "github_trending": lambda limit, hours, state: list(iter_github_trending(max_repos=limit, state=state)),
+    "web_search": lambda limit, hours, state: _search_web_new(limit, state),
+}
+
+
+SOURCE_ITERATORS = {
+    "hackernews": lambda limit, hours, state: iter_hackernews(max_articles=limit, time_window_hours=hours, state=state),
+    "reddit": lambda limit, hours, state: iter_reddit(max_articles=limit, time_window_hours=hours, state=state),
+    "arxiv": lambda limit, hours, state: iter_arxiv(max_articles=limit, time_window_hours=hours, state=state),
+    "github_trending": lambda limit, hours, state: iter_github_trending(max_repos=limit, state=state),
+    "web_search": lambda limit, hours, state: iter(_search_web_new(limit, state)),
+}
+
+
+def _raw_score(article: Dict[str, Any]) -> float:
+    try:
+        return float(article.get("score") or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def normalize_scores(articles: List[Dict[str, Any]], method: Optional[str] = "zscore") -> List[float]:
+    """
+    Normalize the ``score`` of one source's articles onto a shared scale.
+    
+    HackerNews points, Reddit upvotes, GitHub stars and search relevance
+    are not comparable, so before merging sources each article is scored
+    relative to the other articles from the same source.
+    
+    Args:
+        articles: Articles from a single source
+        method: "zscore" (standard score within the source), "percentile"
+            (fraction of the source's articles scoring lower, ties counted
+            as half) or None/"raw" to keep the raw score
+        
+    Returns:
+        Normalized scores, in article order
+    """
+    from bisect import bisect_left, bisect_right
+    
+    scores = [_raw_score(a) for a in articles]
+    n = len(scores)
+    if not n or method in (None, "raw"):
+        return scores
+    if method == "zscore":
+        mean = sum(scores) / n
+        std = (sum((s - mean) ** 2 for s in scores) / n) ** 0.5
+        if not std:
+            return [0.0] * n
+        return [(s - mean) / std for s in scores]
+    if method == "percentile":
+        ordered = sorted(scores)
+        return [(bisect_left(ordered, s) + bisect_right(ordered, s)) / (2 * n) for s in scores]
+    raise ValueError(f"Unknown score normalization: {method}")
+
+
+def top_k_articles(
+    per_source: Dict[str, List[Dict[str, Any]]],
+    k: int,
+    normalization: Optional[str] = "zscore",
+) -> List[Dict[str, Any]]:
+    """
+    Select the k best articles across sources.
+    
+    Scores are normalized within each source, then a bounded heap keeps
+    the k best candidates, so selection is O(n log k) rather than a full
+    sort. Ties keep source order, then order within the source. Selected
+    articles get a ``normalized_score`` field.
+    
+    Args:
+        per_source: Articles keyed by source, in merge order
+        k: Number of articles to return
+        normalization: Method passed to ``normalize_scores``
+        
+    Returns:
+        Up to k articles, best first
+    """
+    import heapq
+    from operator import itemgetter
+    
+    def _candidates():
+        for articles in per_source.values():
+            yield from zip(normalize_scores(articles, normalization), articles)
+    
+    selected = heapq.nlargest(k, _candidates(), key=itemgetter(0))
+    for score, article in selected:
+        article["normalized_score"] = round(score, 4)
+    return [article for _, article in selected]
+
+
+def _timed_crawl(source: str, limit: int, time_window_hours: int, state: Optional[CrawlState] = None):
+    """Run one source crawler and return (articles, latency in seconds)."""
+    import time
+    
+    start = time.monotonic()
+    articles = SOURCE_CRAWLERS[source](limit, time_window_hours, state)
+    return articles, time.monotonic() - start
+
+
 def crawl_ai_news(
     sources: Optional[List[str]] = None,
     max_articles: int = 50,
     time_window_hours: int = 24,
     output_dir: Optional[str] = None,
+    source_timeout: float = 30.0,
+    deadline: float = 60.0,
+    state_path: Optional[str] = None,
+    score_normalization: Optional[str] = "zscore",
 ) -> Dict[str, Any]:
     """
     Main function to crawl AI news from all configured sources.
     
+    Sources are crawled concurrently. A source that exceeds
+    ``source_timeout``, or is still running at the global ``deadline``, is
+    reported in ``crawl_metadata["source_stats"]`` and left out of the
+    result instead of stalling the crawl.
+    
+    With ``state_path``, the crawl is incremental: endpoints are requested
+    conditionally and only items that are new, or whose score changed,
+    since the previous crawl with the same state file are returned. Only
+    the returned articles are recorded, so candidates cut by ranking or
+    lost to a timeout are offered again next time.
+    
+    Articles are ranked on scores normalized within their source (see
+    ``normalize_scores``) and the best ``max_articles`` are kept.
+    
     Args:
         sources: List of sources to crawl
         max_articles: Maximum total articles
         time_window_hours: Time window for articles
         output_dir: Optional directory to save results
+        source_timeout: Seconds each source may take
+        deadline: Seconds the whole crawl may take
+        state_path: JSON file holding incremental crawl state
+        score_normalization: "zscore", "percentile" or None for raw scores
         
     Returns:
         Dictionary with articles and metadata
     """
+    import time
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+    
     sources = sources or ["hackernews", "reddit", "arxiv", "github_trending"]
-    all_articles = []
-    sources_crawled = []
+    source_stats: Dict[str, Dict[str, Any]] = {}
     
     per_source_limit = max(5, max_articles // len(sources))
     
+    known = []
     for source in sources:
-        try:
-            if source == "hackernews":
-                articles = crawl_hackernews(max_articles=per_source_limit, time_window_hours=time_window_hours)
-            elif source == "reddit":
-                articles = crawl_reddit(max_articles=per_source_limit, time_window_hours=time_window_hours)
-            elif source == "arxiv":
-                articles = crawl_arxiv(max_articles=per_source_limit, time_window_hours=time_window_hours)
-            elif source == "github_trending":
-                articles = crawl_github_trending(max_repos=per_source_limit)
-            elif source == "web_search":
-                articles = search_web("AI news today", max_results=per_source_limit)
-            else:
-                logger.warning(f"Unknown source: {source}")
-                continue
-            
-            all_articles.extend(articles)
-            sources_crawled.append(source)
-            logger.info(f"Crawled {len(articles)} articles from {source}")
-            
-        except Exception as e:
-            logger.error(f"Error crawling {source}: {e}")
+        if source in SOURCE_CRAWLERS:
+            known.append(source)
+        else:
+            logger.warning(f"Unknown source: {source}")
+    
+    state = CrawlState(state_path) if state_path else None
     
-    # Sort by score and limit
-    all_articles.sort(key=lambda x: x.get("score", 0), reverse=True)
-    all_articles = all_articles[:max_articles]
+    start = time.monotonic()
+    crawl_deadline = start + deadline
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    
+    pool = ThreadPoolExecutor(max_workers=max(1, len(known)), thread_name_prefix="crawl")
+    try:
+        futures = {
+            pool.submit(_timed_crawl, source, per_source_limit, time_window_hours, state): source
+            for source in known
+        }
+        pending = set(futures)
+        while pending:
+            now = time.monotonic()
+            limit = min(crawl_deadline, start + source_timeout)
+            if now >= limit:
+                break
+            done, pending = wait(pending, timeout=limit - now, return_when=FIRST_COMPLETED)
+            for future in done:
+                source = futures[future]
+                try:
+                    articles, latency = future.result()
+                except Exception as e:
+                    logger.error(f"Error crawling {source}: {e}")
+                    source_stats[source] = {
+                        "status": "error",
+                        "latency_sec": round(time.monotonic() - start, 3),
+                        "count": 0,
+                        "error": str(e),
+                    }
+                    continue
+                results[source] = articles
+                source_stats[source] = {
+                    "status": "ok",
+                    "latency_sec": round(latency, 3),
+                    "count": len(articles),
+                }
+                logger.info(f"Crawled {len(articles)} articles from {source} in {latency:.2f}s")
+        
+        for future in pending:
+            source = futures[future]
+            logger.warning(f"Timed out crawling {source}; continuing without it")
+            source_stats[source] = {
+                "status": "timeout",
+                "latency_sec": round(time.monotonic() - start, 3),
+                "count": 0,
+            }
+    finally:
+        # Do not wait for sources that overran their timeout
+        pool.shutdown(wait=False, cancel_futures=True)
+    
+    # Merge in the configured source order
+    sources_crawled = [source for source in known if source in results]
+    
+    all_articles = top_k_articles(
+        {source: results[source] for source in sources_crawled},
+        max_articles,
+        normalization=score_normalization,
+    )
+    
+    if state is not None:
+        # Record only what is returned; sources still running after their
+        # timeout can no longer change the state
+        state.commit(all_articles)
+        state.close()
+        state.save()
     
     result = {
         "articles": all_articles,
         "crawl_metadata": {
             "total_fetched": len(all_articles),
             "sources_crawled": sources_crawled,
+            "source_stats": source_stats,
+            "crawl_duration_sec": round(time.monotonic() - start, 3),
+            "incremental": state is not None,
+            "score_normalization": score_normalization,
             "crawl_time": datetime.now(timezone.utc).isoformat(),
         }
     }
@@ -415,3 +1061,177 @@ def crawl_ai_news(
         logger.info(f"Saved results to {output_path}")
     
     return result
+
+
+def crawl_ai_news_stream(
+    sources: Optional[List[str]] = None,
+    max_articles: int = 50,
+    time_window_hours: int = 24,
+    source_timeout: float = 30.0,
+    deadline: float = 60.0,
+    state_path: Optional[str] = None,
+    stats: Optional[Dict[str, Any]] = None,
+    buffer_size: int = 32,
+    stop_event: Optional[threading.Event] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream AI news from all configured sources as articles arrive.
+    
+    Each source runs in its own thread and feeds a bounded queue, so a
+    consumer (dedupe, ranking, summarisation) can start on the first
+    articles while slower sources are still being crawled, and at most
+    ``buffer_size`` articles are held in memory. Articles are yielded in
+    arrival order, not sorted by score. Closing the generator stops the
+    producers at their next article.
+    
+    Args:
+        sources: List of sources to crawl
+        max_articles: Maximum total articles
+        time_window_hours: Time window for articles
+        source_timeout: Seconds each source may take
+        deadline: Seconds the whole crawl may take
+        state_path: JSON file holding incremental crawl state; only the
+            articles handed to the consumer are recorded
+        stats: Optional dict filled with ``source_stats`` and
+            ``crawl_duration_sec`` as in ``crawl_ai_news`` metadata
+        buffer_size: Maximum articles queued ahead of the consumer
+        stop_event: Setting this event from another thread ends the
+            stream within ~0.1s, even while it is waiting for articles
+        
+    Yields:
+        Article dictionaries
+    """
+    import queue
+    import time
+    
+    sources = sources or ["hackernews", "reddit", "arxiv", "github_trending"]
+    per_source_limit = max(5, max_articles // len(sources))
+    
+    known = []
+    for source in sources:
+        if source in SOURCE_ITERATORS:
+            known.append(source)
+        else:
+            logger.warning(f"Unknown source: {source}")
+    
+    state = CrawlState(state_path) if state_path else None
+    stats = stats if stats is not None else {}
+    source_stats: Dict[str, Dict[str, Any]] = {}
+    stats["source_stats"] = source_stats
+    
+    channel: "queue.Queue" = queue.Queue(maxsize=max(1, buffer_size))
+    stop = stop_event if stop_event is not None else threading.Event()
+    start = time.monotonic()
+    
+    def _put(message) -> bool:
+        while not stop.is_set():
+            try:
+                channel.put(message, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _produce(source: str) -> None:
+        count = 0
+        try:
+            for article in SOURCE_ITERATORS[source](per_source_limit, time_window_hours, state):
+                if not _put(("article", source, article)):
+                    return
+                count += 1
+        except Exception as e:
+            logger.error(f"Error crawling {source}: {e}")
+            _put(("done", source, {
+                "status": "error",
+                "latency_sec": round(time.monotonic() - start, 3),
+                "count": count,
+                "error": str(e),
+            }))
+            return
+        latency = time.monotonic() - start
+        logger.info(f"Crawled {count} articles from {source} in {latency:.2f}s")
+        _put(("done", source, {"status": "ok", "latency_sec": round(latency, 3), "count": count}))
+    
+    for source in known:
+        threading.Thread(target=_produce, args=(source,), name=f"crawl-{source}", daemon=True).start()
+    
+    remaining = set(known)
+    received = {source: 0 for source in known}
+    yielded = 0
+    try:
+        limit = start + min(source_timeout, deadline)
+        while remaining and yielded < max_articles and not stop.is_set():
+            now = time.monotonic()
+            if now >= limit:
+                break
+            try:
+                kind, source, payload = channel.get(timeout=min(0.1, limit - now))
+            except queue.Empty:
+                continue
+            if kind == "done":
+                remaining.discard(source)
+                source_stats[source] = payload
+                continue
+            if source not in remaining:
+                continue
+            received[source] += 1
+            yielded += 1
+            if state is not None:
+                state.commit([payload])
+            yield payload
+        
+        for source in remaining:
+            status = "timeout" if yielded < max_articles and not stop.is_set() else "stopped"
+            if status == "timeout":
+                logger.warning(f"Timed out crawling {source}; continuing without it")
+            source_stats[source] = {
+                "status": status,
+                "latency_sec": round(time.monotonic() - start, 3),
+                "count": received[source],
+            }
+    finally:
+        stop.set()
+        stats["crawl_duration_sec"] = round(time.monotonic() - start, 3)
+        if state is not None:
+            # Pick up endpoints that finished after their last article
+            state.commit([])
+            state.close()
+            state.save()
+
+
+async def crawl_ai_news_stream_async(**kwargs) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Async iterator variant of ``crawl_ai_news_stream``.
+    
+    Takes the same keyword arguments. Articles are pulled from the
+    streaming crawl in a worker thread so the event loop is never blocked
+    on the network. If the consumer stops early or is cancelled, the crawl
+    is stopped and the generator is closed once any in-flight ``next``
+    in the worker thread has returned.
+    """
+    import asyncio
+    
+    stop = kwargs.pop("stop_event", None) or threading.Event()
+    stream = crawl_ai_news_stream(stop_event=stop, **kwargs)
+    done = object()
+    # A cancelled to_thread call keeps running; the lock makes close()
+    # wait for it instead of hitting a generator that is still executing
+    lock = threading.Lock()
+    
+    def _next():
+        with lock:
+            return next(stream, done)
+    
+    def _close():
+        with lock:
+            stream.close()
+    
+    try:
+        while True:
+            article = await asyncio.to_thread(_next)
+            if article is done:
+                break
+            yield article
+    finally:
+        stop.set()
+        await asyncio.to_thread(_close)
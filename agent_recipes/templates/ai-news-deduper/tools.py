@@ -26,9 +26,9 @@ def get_embedding(text: str) -> List[float]:
     if not api_key:
         raise ValueError("OPENAI_API_KEY not set")
     
-    import requests
+    from agent_recipes import http_client
     
-    response = requests.post(
+    response = http_client.post(
         "https://api.openai.com/v1/embeddings",
         headers={
             "Authorization": f"Bearer {api_key}",
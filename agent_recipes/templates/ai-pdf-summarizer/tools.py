@@ -3,8 +3,10 @@ Tools for ai-pdf-summarizer recipe.
 Uses OCRAgent for PDF text extraction and analysis.
 """
 
-from praisonaiagents import OCRAgent
-from praisonaiagents.tools import read_file
+from agent_recipes.lazy import lazy_import
+
+OCRAgent = lazy_import("praisonaiagents", "OCRAgent")
+read_file = lazy_import("praisonaiagents.tools", "read_file")
 
 _ocr_agent = None
 
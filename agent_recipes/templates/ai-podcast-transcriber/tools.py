@@ -3,10 +3,14 @@ Tools for ai-podcast-transcriber recipe.
 Uses AudioAgent for high-quality podcast transcription.
 """
 
-from praisonaiagents import AudioAgent
-from praisonaiagents.tools import execute_command, write_file
 import os
 
+from agent_recipes.lazy import lazy_import
+
+AudioAgent = lazy_import("praisonaiagents", "AudioAgent")
+execute_command = lazy_import("praisonaiagents.tools", "execute_command")
+write_file = lazy_import("praisonaiagents.tools", "write_file")
+
 _audio_agent = None
 
 def _get_audio_agent():
@@ -3,10 +3,13 @@ Tools for ai-resume-parser recipe.
 Uses OCRAgent for resume text extraction and structured parsing.
 """
 
-from praisonaiagents import OCRAgent
-from praisonaiagents.tools import read_file
 import json
 
+from agent_recipes.lazy import lazy_import
+
+OCRAgent = lazy_import("praisonaiagents", "OCRAgent")
+read_file = lazy_import("praisonaiagents.tools", "read_file")
+
 _ocr_agent = None
 
 def _get_ocr_agent():
@@ -170,18 +170,12 @@ def _get_crawl_tool():
 def _fallback_crawl(url: str) -> Dict[str, Any]:
     """Fallback crawl using requests if praisonaiagents not available."""
     try:
-        import requests
-        from bs4 import BeautifulSoup
+        from agent_recipes import html_extract, http_client
         
-        resp = requests.get(url, timeout=30, headers={"User-Agent": "Mozilla/5.0"})
-        soup = BeautifulSoup(resp.text, "html.parser")
+        resp = http_client.get(url, timeout=30, headers={"User-Agent": "Mozilla/5.0"})
         
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        text = soup.get_text(separator="\n", strip=True)
-        title = soup.title.string if soup.title else ""
+        # Title and visible text, without script and style elements
+        title, text = html_extract.page_text(resp.text)
         
         return {"url": url, "content": text[:10000], "title": title, "success": True}
     except Exception as e:
@@ -591,8 +585,8 @@ def validate_url(url: str) -> Dict[str, Any]:
         Dict with url, valid (bool), status_code, error (if any)
     """
     try:
-        import requests
-        resp = requests.head(url, timeout=10, allow_redirects=True, 
+        from agent_recipes import http_client
+        resp = http_client.head(url, timeout=10, allow_redirects=True, 
                             headers={"User-Agent": "Mozilla/5.0"})
         return {
             "url": url,
@@ -3,7 +3,9 @@ Tools for ai-speech-to-text recipe.
 Uses AudioAgent for high-quality speech transcription.
 """
 
-from praisonaiagents import AudioAgent
+from agent_recipes.lazy import lazy_import
+
+AudioAgent = lazy_import("praisonaiagents", "AudioAgent")
 
 _audio_agent = None
 
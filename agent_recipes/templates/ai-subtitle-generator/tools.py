@@ -3,8 +3,10 @@ Tools for ai-subtitle-generator recipe.
 Uses AudioAgent for transcription with timestamps.
 """
 
-from praisonaiagents import AudioAgent
-from praisonaiagents.tools import execute_command
+from agent_recipes.lazy import lazy_import
+
+AudioAgent = lazy_import("praisonaiagents", "AudioAgent")
+execute_command = lazy_import("praisonaiagents.tools", "execute_command")
 
 _audio_agent = None
 
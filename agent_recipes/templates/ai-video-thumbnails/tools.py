@@ -3,10 +3,14 @@ Tools for ai-video-thumbnails recipe.
 Uses VisionAgent for frame analysis and ImageAgent for thumbnail generation.
 """
 
-from praisonaiagents import VisionAgent, ImageAgent
-from praisonaiagents.tools import execute_command
 import os
 
+from agent_recipes.lazy import lazy_import
+
+VisionAgent = lazy_import("praisonaiagents", "VisionAgent")
+ImageAgent = lazy_import("praisonaiagents", "ImageAgent")
+execute_command = lazy_import("praisonaiagents.tools", "execute_command")
+
 _vision_agent = None
 _image_agent = None
 
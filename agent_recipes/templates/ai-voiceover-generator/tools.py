@@ -3,8 +3,10 @@ Tools for ai-voiceover-generator recipe.
 Uses AudioAgent for text-to-speech voice generation.
 """
 
-from praisonaiagents import AudioAgent
-from praisonaiagents.tools import write_file
+from agent_recipes.lazy import lazy_import
+
+AudioAgent = lazy_import("praisonaiagents", "AudioAgent")
+write_file = lazy_import("praisonaiagents.tools", "write_file")
 
 _audio_agent = None
 
@@ -122,9 +122,9 @@ def crawl_url(url: str, extract_main_content: bool = True) -> Dict[str, Any]:
     except ImportError:
         # Fallback to jina reader
         try:
-            import requests
+            from agent_recipes import http_client
             jina_url = f"https://r.jina.ai/{url}"
-            resp = requests.get(jina_url, timeout=30)
+            resp = http_client.get(jina_url, timeout=30)
             return {
                 "url": url,
                 "title": "",
@@ -4,9 +4,14 @@ Tools for this recipe.
 Auto-generated by praisonai recipe create.
 """
 
-from praisonai_tools.tools import tavily_search, tavily_extract
-from praisonaiagents.tools import internet_search
-from praisonaiagents.tools import read_file, write_file, list_files
+from agent_recipes.lazy import lazy_import
+
+tavily_search = lazy_import("praisonai_tools.tools", "tavily_search")
+tavily_extract = lazy_import("praisonai_tools.tools", "tavily_extract")
+internet_search = lazy_import("praisonaiagents.tools", "internet_search")
+read_file = lazy_import("praisonaiagents.tools", "read_file")
+write_file = lazy_import("praisonaiagents.tools", "write_file")
+list_files = lazy_import("praisonaiagents.tools", "list_files")
 
 # Export tools for use in agents.yaml
 TOOLS = [internet_search, read_file, tavily_search, write_file] if 'internet_search, read_file, tavily_search, write_file' else []
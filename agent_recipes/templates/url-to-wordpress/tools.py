@@ -6,10 +6,12 @@ Uses native SDK tools that have auto-fallback providers:
 - search_web: Tavily → Exa → You.com → DuckDuckGo (auto-detects best available)
 """
 
+from agent_recipes.lazy import lazy_import
+
 # Import native tools with correct function path
 # NOTE: Must use full path since praisonaiagents.tools returns module for web_crawl
-from praisonaiagents.tools.web_crawl import web_crawl
-from praisonaiagents.tools import search_web
+web_crawl = lazy_import("praisonaiagents.tools.web_crawl", "web_crawl")
+search_web = lazy_import("praisonaiagents.tools", "search_web")
 
 
 # Export tools for use in agents.yaml
@@ -0,0 +1,107 @@
+"""
+Process-wide cache of loaded recipe ``tools.py`` modules.
+
+``run_recipe`` used to re-execute a recipe's tools.py on every call, which
+re-imported its dependencies and rebuilt module-level state (clients,
+singletons). Modules are now loaded once per process and reused until the
+file's mtime or size changes, or ``reload_tools()`` is called.
+"""
+
+import importlib.util
+import logging
+import os
+import sys
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LoadedTools:
+    """A loaded tools.py module and the tool registry built from it."""
+    module: ModuleType
+    registry: Dict[str, Callable[..., Any]] = field(default_factory=dict)
+    stamp: Tuple[int, int] = (0, 0)
+
+
+_cache: Dict[str, LoadedTools] = {}
+_lock = threading.Lock()
+
+
+def build_registry(module: ModuleType) -> Dict[str, Callable[..., Any]]:
+    """Build a tool registry from a module's TOOLS (dict or list) or get_all_tools()."""
+    tools = getattr(module, "TOOLS", None)
+    if isinstance(tools, dict):
+        return dict(tools)
+    if tools is None and hasattr(module, "get_all_tools"):
+        tools = module.get_all_tools()
+    # Lazy stand-ins (agent_recipes.lazy) carry __name__ without importing
+    return {tool.__name__: tool for tool in tools or []}
+
+
+def _stamp(path: Path) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_tools(tools_py: Union[str, Path], module_name: str) -> LoadedTools:
+    """
+    Load a recipe's tools.py, reusing the cached module when unchanged.
+
+    Args:
+        tools_py: Path to the tools.py file
+        module_name: Name to register the module under in sys.modules
+
+    Returns:
+        LoadedTools with the module and its tool registry
+    """
+    path = Path(tools_py).resolve()
+    key = str(path)
+    stamp = _stamp(path)
+    loaded = _cache.get(key)
+    if loaded is not None and loaded.stamp == stamp:
+        return loaded
+
+    with _lock:
+        loaded = _cache.get(key)
+        if loaded is not None and loaded.stamp == stamp:
+            return loaded
+        if loaded is not None:
+            logger.info(f"Reloading changed tools module: {path}")
+
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+        loaded = LoadedTools(module=module, registry=build_registry(module), stamp=stamp)
+        _cache[key] = loaded
+        return loaded
+
+
+def reload_tools(tools_py: Optional[Union[str, Path]] = None) -> None:
+    """
+    Drop cached tools modules so the next load re-executes them.
+
+    Intended for development, when tools.py changes within the same mtime
+    tick or its module state must be reset.
+
+    Args:
+        tools_py: Path of one tools.py to drop (default: all)
+    """
+    with _lock:
+        if tools_py is None:
+            keys = list(_cache)
+        else:
+            keys = [str(Path(tools_py).resolve())]
+        for key in keys:
+            loaded = _cache.pop(key, None)
+            if loaded is not None and sys.modules.get(loaded.module.__name__) is loaded.module:
+                del sys.modules[loaded.module.__name__]
@@ -0,0 +1,73 @@
+"""
+Unit tests for concurrent recipe fan-out.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+import agent_recipes
+from agent_recipes import call_recipe_async, call_recipes
+
+
+@pytest.fixture
+def fake_run_recipe(monkeypatch):
+    """Replace run_recipe with a sleeping fake that tracks concurrency."""
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def _run_recipe(recipe_name, input_data=None, variables=None, verbose=False):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        try:
+            if recipe_name == "broken":
+                raise RuntimeError("no such luck")
+            time.sleep(0.5 if recipe_name == "slow" else 0.1)
+            return {"output": f"{recipe_name}:{input_data}"}
+        finally:
+            with lock:
+                state["active"] -= 1
+
+    monkeypatch.setattr(agent_recipes, "run_recipe", _run_recipe)
+    return state
+
+
+class TestFanout:
+    """Tests for call_recipes and call_recipe_async."""
+
+    def test_results_in_order_with_errors(self, fake_run_recipe):
+        """Results keep input order and capture errors per call."""
+        results = call_recipes(["a", ("b", "x"), {"recipe_name": "broken"}, "c"], max_workers=4)
+        assert [r["recipe"] for r in results] == ["a", "b", "broken", "c"]
+        assert results[1]["output"] == "b:x"
+        assert results[2]["output"] is None
+        assert "no such luck" in results[2]["error"]
+        assert all(r["duration_sec"] >= 0 for r in results)
+
+    def test_bounded_concurrency(self, fake_run_recipe):
+        """No more than max_workers recipes run at once."""
+        start = time.monotonic()
+        call_recipes([f"r{i}" for i in range(6)], max_workers=3)
+        assert fake_run_recipe["peak"] == 3
+        assert time.monotonic() - start < 0.55
+
+    def test_timeout(self, fake_run_recipe):
+        """Calls still running at the timeout are reported as errors."""
+        results = call_recipes(["a", "slow"], max_workers=2, timeout=0.3)
+        assert results[0]["error"] is None
+        assert results[1]["error"].startswith("TimeoutError")
+
+    def test_async(self, fake_run_recipe):
+        """call_recipe_async runs recipes concurrently off the event loop."""
+        async def _main():
+            semaphore = asyncio.Semaphore(2)
+            return await asyncio.gather(
+                *(call_recipe_async(name, semaphore=semaphore) for name in ("a", "b", "c"))
+            )
+
+        results = asyncio.run(_main())
+        assert [r["output"] for r in results] == ["a:", "b:", "c:"]
+        assert fake_run_recipe["peak"] == 2
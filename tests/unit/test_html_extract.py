@@ -0,0 +1,103 @@
+"""
+Unit tests for the pluggable HTML extractor.
+
+Backends that are not installed are skipped. The GitHub trending fixture
+reproduces the page's markup (25 rows, scripts, navigation) and is also
+the per-page parse time benchmark.
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from agent_recipes import html_extract
+
+FIXTURE = Path(__file__).parent.parent / "fixtures" / "github_trending.html"
+
+BACKENDS = [
+    pytest.param(
+        name,
+        marks=pytest.mark.skipif(not backend.available(), reason=f"{name} not installed"),
+    )
+    for name, backend in html_extract.BACKENDS.items()
+]
+
+# Generous per-page budget; the bs4 html.parser path is the slowest backend
+PARSE_BUDGET_SEC = 1.0
+
+
+@pytest.fixture(scope="module")
+def trending_html():
+    return FIXTURE.read_text(encoding="utf-8")
+
+
+class TestExtractors:
+    """Tests for each extraction backend."""
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_trending_repos(self, backend, trending_html):
+        """Rows are extracted with cleaned name, href, description and stars."""
+        repos = html_extract.get_extractor(backend).trending_repos(trending_html)
+        assert len(repos) == 25
+        assert repos[0] == {
+            "name": "openai/whisper",
+            "href": "/openai/whisper",
+            "description": "Robust Speech Recognition via Large-Scale Weak Supervision",
+            "stars": "71234",
+        }
+        assert repos[7]["name"] == "MervinPraison/PraisonAI"
+        assert len(html_extract.get_extractor(backend).trending_repos(trending_html, limit=3)) == 3
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_backends_agree(self, backend, trending_html):
+        """Every backend returns the same rows as the bs4 path."""
+        if not html_extract.SoupExtractor.available():
+            pytest.skip("bs4 not installed")
+        expected = html_extract.get_extractor("bs4").trending_repos(trending_html)
+        assert html_extract.get_extractor(backend).trending_repos(trending_html) == expected
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_page_text(self, backend):
+        """Script and style text is dropped and text nodes are joined by lines."""
+        html = (
+            "<html><head><title>Docs</title><script>var x = 1;</script></head>"
+            "<body><h1> Intro </h1><style>p {}</style><p>First <b>bold</b></p>\n\n<div>  </div>End</body></html>"
+        )
+        title, text = html_extract.get_extractor(backend).page_text(html)
+        assert title == "Docs"
+        assert text == "Docs\nIntro\nFirst\nbold\nEnd"
+
+    def test_backend_selection(self, monkeypatch):
+        """The environment variable forces a backend and unknown names fail."""
+        with pytest.raises(ValueError):
+            html_extract.get_extractor("regex")
+
+        monkeypatch.setenv(html_extract.BACKEND_ENV, "regex")
+        with pytest.raises(ValueError):
+            html_extract.get_extractor()
+
+        monkeypatch.delenv(html_extract.BACKEND_ENV)
+        installed = html_extract.available_backends()
+        if not installed:
+            with pytest.raises(ImportError):
+                html_extract.get_extractor()
+        else:
+            assert html_extract.get_extractor().name == installed[0]
+
+
+class TestParseBenchmark:
+    """Per-page parse time of the GitHub trending fixture."""
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_trending_parse_time(self, backend, trending_html, record_property):
+        """Best-of-5 parse time is recorded (--junitxml with -o junit_family=legacy) and kept under budget."""
+        extractor = html_extract.get_extractor(backend)
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            extractor.trending_repos(trending_html)
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        record_property(f"{backend}_trending_parse_ms", round(best * 1000, 2))
+        assert best < PARSE_BUDGET_SEC
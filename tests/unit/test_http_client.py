@@ -0,0 +1,137 @@
+"""
+Unit tests for the shared HTTP client.
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from agent_recipes.http_client import DEFAULT_TIMEOUT, HTTPClient, HostLimiter
+
+
+class _RecordingSession:
+    """Session stand-in that records calls and concurrency per host."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def request(self, method, url, **kwargs):
+        with self._lock:
+            self.calls.append((method, url, kwargs))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return "ok"
+
+
+def _client_with(session, **kwargs):
+    client = HTTPClient(**kwargs)
+    client._session = session
+    client._pid = os.getpid()
+    return client
+
+
+class TestHTTPClient:
+    """Tests for HTTPClient and HostLimiter."""
+
+    def test_limiter_is_per_host(self):
+        """URLs on one host share a semaphore; other hosts get their own."""
+        limiter = HostLimiter(2)
+        a = limiter.semaphore("https://api.example.com/v1/a")
+        assert limiter.semaphore("https://API.example.com/b") is a
+        assert limiter.semaphore("https://other.example.com/") is not a
+
+    def test_default_timeout_and_methods(self):
+        """Requests get a default timeout unless the caller sets one."""
+        session = _RecordingSession(delay=0)
+        client = _client_with(session)
+        client.get("https://example.com/a")
+        client.post("https://example.com/b", json={"x": 1}, timeout=5)
+        client.head("https://example.com/c")
+        (m1, _, kw1), (m2, _, kw2), (m3, _, kw3) = session.calls
+        assert (m1, kw1["timeout"], kw1["allow_redirects"]) == ("GET", DEFAULT_TIMEOUT, True)
+        assert (m2, kw2["timeout"], kw2["json"]) == ("POST", 5, {"x": 1})
+        assert (m3, kw3["allow_redirects"]) == ("HEAD", False)
+
+    def test_per_host_concurrency_cap(self):
+        """No more than max_per_host requests to one host are in flight."""
+        session = _RecordingSession()
+        client = _client_with(session, max_per_host=2)
+        threads = [
+            threading.Thread(target=client.get, args=(f"https://example.com/{i}",))
+            for i in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert session.peak == 2
+
+    def test_real_session_is_pooled(self):
+        """The real session mounts a pooled adapter with retries."""
+        pytest.importorskip("requests")
+        client = HTTPClient(pool_size=4, retries=2)
+        adapter = client.session.get_adapter("https://example.com")
+        assert adapter.max_retries.total == 2
+        assert client.session is client.session
+        client.close()
+
+    def test_post_retries_are_opt_in(self):
+        """Only idempotent methods retry read timeouts unless retry=True."""
+        pytest.importorskip("requests")
+        client = HTTPClient(retries=3)
+        default = client.session.get_adapter("https://example.com").max_retries
+        assert "GET" in default.allowed_methods and "POST" not in default.allowed_methods
+        assert not default.is_retry("POST", 503)
+        assert default.is_retry("GET", 503)
+
+        retrying = client.retrying_session.get_adapter("https://example.com").max_retries
+        assert retrying.allowed_methods is None
+        assert retrying.is_retry("POST", 503)
+        client.close()
+
+    def test_retry_flag_selects_session(self):
+        """request(retry=True) goes through the retrying session."""
+        session, retrying = _RecordingSession(delay=0), _RecordingSession(delay=0)
+        client = _client_with(session)
+        client._retrying_session = retrying
+        client.post("https://example.com/a")
+        client.post("https://example.com/b", retry=True)
+        assert [c[1] for c in session.calls] == ["https://example.com/a"]
+        assert [c[1] for c in retrying.calls] == ["https://example.com/b"]
+        assert "retry" not in retrying.calls[0][2]
+
+    def test_streamed_response_holds_host_slot(self):
+        """A stream=True request keeps its slot until the response is closed."""
+
+        class _Response:
+            closes = 0
+
+            def close(self):
+                self.closes += 1
+
+        class _StreamingSession(_RecordingSession):
+            def request(self, method, url, **kwargs):
+                super().request(method, url, **kwargs)
+                return _Response()
+
+        client = _client_with(_StreamingSession(delay=0), max_per_host=1)
+        response = client.get("https://example.com/feed", stream=True)
+        semaphore = client.limiter.semaphore("https://example.com/")
+        assert not semaphore.acquire(blocking=False)
+
+        response.close()
+        response.close()  # closing twice releases the slot once
+        assert response.closes == 2
+        assert semaphore.acquire(blocking=False)
+        semaphore.release()
+        with pytest.raises(ValueError):
+            semaphore.release()
@@ -0,0 +1,139 @@
+"""
+Import-time regression tests.
+
+Run fresh interpreters with ``python -X importtime`` and fail if importing
+agent_recipes or loading a recipe's tools.py pulls in heavy dependencies
+or exceeds its startup budget.
+"""
+
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+TEMPLATES_DIR = Path(__file__).parent.parent.parent / "agent_recipes" / "templates"
+
+# Generous budgets: they catch eager imports of heavy packages (tens to
+# hundreds of ms), not noise between machines.
+PACKAGE_BUDGET_MS = 150
+TOOLS_BUDGET_MS = 150
+
+HEAVY_MODULES = ("asyncio", "yaml", "requests", "bs4", "praisonaiagents", "praisonai_tools", "rich")
+
+_IMPORTTIME_RE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def _importtime(code: str):
+    """Run code under -X importtime; return ({module: cumulative_us}, stdout)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    cumulative = {}
+    for match in _IMPORTTIME_RE.finditer(proc.stderr):
+        cumulative.setdefault(match.group(4), int(match.group(2)))
+    return cumulative, proc.stdout
+
+
+def _heavy_loaded(modules):
+    return sorted(
+        name for name in modules
+        if name.split(".")[0] in HEAVY_MODULES
+    )
+
+
+class TestImportTime:
+    """Startup cost of the package and recipe tools modules."""
+
+    def test_package_import_is_light(self):
+        """import agent_recipes stays within budget and imports no heavy packages."""
+        cumulative, _ = _importtime("import agent_recipes")
+        assert _heavy_loaded(cumulative) == []
+        assert cumulative["agent_recipes"] / 1000 < PACKAGE_BUDGET_MS
+
+    @pytest.mark.parametrize("template", ["ai-image-cataloger", "url-to-blog", "ai-video-thumbnails"])
+    def test_tools_module_is_lazy(self, template):
+        """Loading a tools.py defers praisonaiagents until a tool is used."""
+        tools_py = TEMPLATES_DIR / template / "tools.py"
+        code = (
+            "import json, sys, time\n"
+            "from agent_recipes.tools_cache import load_tools\n"
+            "start = time.perf_counter()\n"
+            f"loaded = load_tools({str(tools_py)!r}, 'lazy_probe_tools')\n"
+            "elapsed = (time.perf_counter() - start) * 1000\n"
+            "print(json.dumps({'ms': elapsed, 'tools': sorted(loaded.registry),"
+            " 'modules': sorted(sys.modules)}))\n"
+        )
+        _, stdout = _importtime(code)
+        report = json.loads(stdout)
+        assert report["tools"]
+        assert _heavy_loaded(report["modules"]) == []
+        assert report["ms"] < TOOLS_BUDGET_MS
+
+
+class TestLazyImport:
+    """Tests for agent_recipes.lazy."""
+
+    def test_resolves_on_first_use(self):
+        """The stand-in keeps its name and imports only when called."""
+        import inspect
+
+        from agent_recipes.lazy import lazy_import
+
+        dumps = lazy_import("json", "dumps")
+        assert dumps.__name__ == "dumps"
+        assert not dumps.resolved
+        assert dumps({"a": 1}) == '{"a": 1}'
+        assert dumps.resolved
+        assert "obj" in inspect.signature(dumps).parameters
+
+    def test_missing_module_fails_on_use(self):
+        """A missing optional dependency only fails when the tool is used."""
+        from agent_recipes.lazy import lazy_import
+
+        tool = lazy_import("agent_recipes_missing_dependency", "tool")
+        with pytest.raises(ImportError):
+            tool()
+
+    def test_introspection_matches_target(self, tmp_path, monkeypatch):
+        """Signature, docstring, name and type hints are those of the real tool."""
+        import inspect
+        import typing
+
+        from agent_recipes.lazy import lazy_import
+
+        (tmp_path / "lazy_probe_module.py").write_text(
+            "def summarize(url: str, max_words: int = 200) -> str:\n"
+            "    \"\"\"Summarize a web page.\n\n    Args:\n        url: Page URL\n    \"\"\"\n"
+            "    return url\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        import lazy_probe_module
+
+        tool = lazy_import("lazy_probe_module", "summarize")
+        real = lazy_probe_module.summarize
+        assert callable(tool)
+        assert tool.__name__ == real.__name__
+        assert inspect.signature(tool) == inspect.signature(real)
+        assert inspect.getdoc(tool) == inspect.getdoc(real)
+        assert typing.get_type_hints(tool) == typing.get_type_hints(real)
+
+    def test_template_tools_survive_agent_introspection(self):
+        """praisonaiagents builds the same tool schema for a stand-in as for the real tool."""
+        agents = pytest.importorskip("praisonaiagents")
+        from agent_recipes.lazy import resolve
+        from agent_recipes.tools_cache import load_tools
+
+        tools = load_tools(TEMPLATES_DIR / "url-to-blog" / "tools.py", "lazy_schema_tools").module.TOOLS
+        lazy_agent = agents.Agent(name="lazy", tools=list(tools))
+        real_agent = agents.Agent(name="real", tools=[resolve(tool) for tool in tools])
+        for tool in tools:
+            definition = lazy_agent._generate_tool_definition(tool.__name__)
+            assert definition
+            assert definition == real_agent._generate_tool_definition(tool.__name__)
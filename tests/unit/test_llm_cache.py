@@ -0,0 +1,144 @@
+"""
+Unit tests for the persistent LLM response cache.
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from agent_recipes.llm_cache import DEFAULT_LLM_CACHE_PATH, LLM_CACHE_ENV, LLMCache, cache_key
+from agent_recipes.llm_client import LLMClient, StubBackend, set_llm_client
+from agent_recipes.tools_cache import load_tools
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMCache(tmp_path / "llm.sqlite")
+    yield cache
+    cache.close()
+
+
+class TestLLMCache:
+    """Tests for LLMCache and its use by LLMClient."""
+
+    def test_key_covers_parameters(self):
+        """Model, prompt, temperature and max_tokens all change the key."""
+        base = cache_key("p", "m", 0.5, 100)
+        assert base == cache_key("p", "m", 0.5, 100)
+        assert len({
+            base,
+            cache_key("q", "m", 0.5, 100),
+            cache_key("p", "n", 0.5, 100),
+            cache_key("p", "m", 0.7, 100),
+            cache_key("p", "m", 0.5, 200),
+        }) == 5
+
+    def test_hits_misses_and_persistence(self, cache, tmp_path):
+        """Stored responses survive reopening and counters are tracked."""
+        assert cache.get("k") is None
+        cache.put("k", "answer", model="m")
+        assert cache.get("k") == "answer"
+        cache.close()
+
+        reopened = LLMCache(tmp_path / "llm.sqlite")
+        assert reopened.get("k") == "answer"
+        stats = reopened.stats()
+        assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 2, 1)
+        reopened.close()
+
+    def test_ttl(self, tmp_path):
+        """Expired entries are not returned."""
+        cache = LLMCache(tmp_path / "llm.sqlite", ttl_sec=0.05)
+        cache.put("k", "answer")
+        time.sleep(0.1)
+        assert cache.get("k") is None
+        cache.close()
+
+    def test_lru_size_eviction(self, tmp_path):
+        """The least recently used entries are evicted beyond max_bytes."""
+        cache = LLMCache(tmp_path / "llm.sqlite", max_bytes=25)
+        cache.put("a", "x" * 10)
+        time.sleep(0.01)
+        cache.put("b", "y" * 10)
+        time.sleep(0.01)
+        cache.get("a")
+        time.sleep(0.01)
+        cache.put("c", "z" * 10)
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+        assert cache.stats()["evictions"] == 1
+        cache.close()
+
+    def test_client_uses_cache_with_opt_out(self, cache):
+        """Repeated deterministic prompts are served from the cache unless cache=False."""
+        backend = StubBackend()
+        client = LLMClient(backend=backend, cache=cache)
+        assert client.complete("same", max_tokens=10, temperature=0) == client.complete("same", max_tokens=10, temperature=0)
+        assert len(backend.calls) == 1
+        client.complete("same", max_tokens=10, temperature=0, cache=False)
+        assert len(backend.calls) == 2
+        client.complete("same", max_tokens=20, temperature=0)
+        assert len(backend.calls) == 3
+        client.close()
+
+    def test_sampled_requests_bypass_cache_by_default(self, cache):
+        """Requests with temperature > 0 are only cached with cache=True."""
+        backend = StubBackend()
+        client = LLMClient(backend=backend, cache=cache)
+        client.complete("hook", temperature=0.9)
+        client.complete("hook", temperature=0.9)
+        assert len(backend.calls) == 2
+        client.complete("claim", temperature=0.3, cache=True)
+        client.complete("claim", temperature=0.3, cache=True)
+        assert len(backend.calls) == 3
+        client.close()
+
+    def test_cache_is_opt_in(self, monkeypatch, tmp_path):
+        """from_env returns no cache unless AGENT_RECIPES_LLM_CACHE enables it."""
+        monkeypatch.delenv(LLM_CACHE_ENV, raising=False)
+        assert LLMCache.from_env() is None
+        monkeypatch.setenv(LLM_CACHE_ENV, "off")
+        assert LLMCache.from_env() is None
+        monkeypatch.setenv(LLM_CACHE_ENV, "on")
+        assert LLMCache.from_env().path == DEFAULT_LLM_CACHE_PATH
+        monkeypatch.setenv(LLM_CACHE_ENV, str(tmp_path / "custom.sqlite"))
+        assert LLMCache.from_env().path == tmp_path / "custom.sqlite"
+
+    def test_reads_are_batched_and_size_is_tracked(self, cache):
+        """Hits are buffered until a flush and the running size matches the table."""
+        cache.put("a", "x" * 10)
+        cache.put("a", "x" * 4)
+        cache.put("b", "y" * 6)
+        for _ in range(3):
+            assert cache.get("a") == "xxxx"
+        conn = cache._connection()
+        assert conn.execute("SELECT value FROM counters WHERE name = 'hits'").fetchone() is None
+        assert conn.execute("SELECT SUM(size) FROM responses").fetchone()[0] == 10
+        stats = cache.stats()
+        assert (stats["hits"], stats["size_bytes"], stats["entries"]) == (3, 10, 2)
+        cache.clear()
+        assert cache.stats()["size_bytes"] == 0
+
+    def test_template_helpers_use_cache(self, cache):
+        """Enrichment and hashtag templates opt into the response cache."""
+        templates = Path(__file__).parent.parent.parent / "agent_recipes" / "templates"
+        backend = StubBackend()
+        client = LLMClient(backend=backend, cache=cache)
+        previous = set_llm_client(client)
+        try:
+            enricher = load_tools(templates / "ai-context-enricher" / "tools.py", "enricher_cache_tools").module
+            article = {"title": "New model", "content": "A lab released a model."}
+            first = enricher.add_background(dict(article))
+            second = enricher.add_background(dict(article))
+            assert second["background"] == first["background"]
+            assert len(backend.calls) == 1
+
+            hashtags = load_tools(templates / "ai-hashtag-optimizer" / "tools.py", "hashtag_cache_tools").module
+            hashtags.generate_hashtags("python")
+            hashtags.generate_hashtags("python")
+            assert len(backend.calls) == 2
+        finally:
+            set_llm_client(previous)
+            client.close()
@@ -0,0 +1,134 @@
+"""
+Unit tests for the shared LLM client.
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from agent_recipes.llm_client import (
+    LLMClient,
+    LLMError,
+    LLMRequest,
+    OpenAIBackend,
+    StubBackend,
+    TokenBucket,
+    set_llm_client,
+)
+from agent_recipes.tools_cache import load_tools
+
+TEMPLATES_DIR = Path(__file__).parent.parent.parent / "agent_recipes" / "templates"
+
+
+class _FlakyBackend(StubBackend):
+    """Stub that fails with a retryable error a number of times first."""
+
+    def __init__(self, failures):
+        super().__init__()
+        self.failures = failures
+
+    def complete(self, request):
+        if self.failures:
+            self.failures -= 1
+            raise LLMError("HTTP 429", status=429, retryable=True)
+        return super().complete(request)
+
+
+@pytest.fixture
+def stub_client():
+    client = LLMClient(backend=StubBackend(delay=0.1), max_concurrency=4)
+    previous = set_llm_client(client)
+    yield client
+    set_llm_client(previous)
+    client.close()
+
+
+class TestLLMClient:
+    """Tests for LLMClient and its helpers."""
+
+    def test_complete_with_stub(self, stub_client):
+        """The stub back-end answers without network access."""
+        assert stub_client.complete("hello", max_tokens=5) == "[stub gpt-4o-mini] hello"
+        assert stub_client.backend.calls[0] == LLMRequest("hello", max_tokens=5)
+
+    def test_identical_requests_are_coalesced(self, stub_client):
+        """Concurrent identical deterministic requests share a single back-end call."""
+        request = LLMRequest("same prompt", temperature=0)
+        first = stub_client.submit(request)
+        second = stub_client.submit(request)
+        assert first is second
+        assert first.result() == second.result()
+        assert len(stub_client.backend.calls) == 1
+
+    def test_sampled_requests_are_not_coalesced(self, stub_client):
+        """Sampled requests each get their own completion unless cache=True."""
+        request = LLMRequest("same prompt", temperature=0.9)
+        first = stub_client.submit(request)
+        second = stub_client.submit(request)
+        assert first is not second
+        assert first.result() == second.result()
+        assert len(stub_client.backend.calls) == 2
+        assert stub_client.submit(request, cache=True) is stub_client.submit(request, cache=True)
+
+    def test_error_response_is_closed(self):
+        """HTTP errors close the response, including streamed ones."""
+
+        class _Response:
+            status_code = 503
+            text = "overloaded"
+            closed = False
+
+            def close(self):
+                self.closed = True
+
+        class _HTTP:
+            def post(self, url, **kwargs):
+                self.response = _Response()
+                return self.response
+
+        backend = OpenAIBackend(api_key="test")
+        backend._http = _HTTP()
+        with pytest.raises(LLMError) as exc:
+            list(backend.stream(LLMRequest("hello")))
+        assert exc.value.retryable
+        assert backend._http.response.closed
+
+    def test_complete_many_runs_concurrently(self, stub_client):
+        """A batch of prompts runs on the pool and keeps prompt order."""
+        start = time.monotonic()
+        results = stub_client.complete_many([f"p{i}" for i in range(4)])
+        assert time.monotonic() - start < 0.35
+        assert [r.split()[-1] for r in results] == ["p0", "p1", "p2", "p3"]
+
+    def test_retries_transient_errors(self):
+        """Retryable errors are retried with backoff, then raised."""
+        client = LLMClient(backend=_FlakyBackend(failures=2), max_retries=2, backoff=0.01)
+        assert client.complete("x").endswith("x")
+
+        client = LLMClient(backend=_FlakyBackend(failures=5), max_retries=1, backoff=0.01)
+        with pytest.raises(LLMError):
+            client.complete("x")
+
+    def test_token_bucket(self):
+        """Requests beyond the burst wait for tokens to refill."""
+        bucket = TokenBucket(rate=20, capacity=2)
+        start = time.monotonic()
+        for _ in range(4):
+            bucket.acquire()
+        assert time.monotonic() - start >= 0.08
+
+    def test_stream(self, stub_client):
+        """Streaming yields chunks that join to the full completion."""
+        chunks = list(stub_client.stream("a b c"))
+        assert len(chunks) > 1
+        assert "".join(chunks) == "[stub gpt-4o-mini] a b c"
+
+    def test_template_uses_shared_client(self, stub_client):
+        """Template tools call through the shared client."""
+        stub_client.backend.responder = lambda request: "VERDICT: TRUE\nEXPLANATION: fine"
+        tools = load_tools(TEMPLATES_DIR / "ai-fact-checker" / "tools.py", "fact_checker_llm_tools")
+        result = tools.module.verify_claims([{"claim": "water is wet"}, {"claim": "sky is blue"}])
+        verdicts = [claim["verdict"] for claim in result["verified_claims"]]
+        assert verdicts == ["TRUE", "TRUE"]
+        assert {r.temperature for r in stub_client.backend.calls} == {0.3}
@@ -0,0 +1,568 @@
+"""
+Unit tests for the ai-news-crawler tools, run against a fake HTTP layer.
+"""
+
+import io
+import threading
+import time
+import typing
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from agent_recipes import http_client
+from agent_recipes.tools_cache import load_tools
+
+TOOLS_PY = Path(__file__).parent.parent.parent / "agent_recipes" / "templates" / "ai-news-crawler" / "tools.py"
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, payload=None, text="", status_code=200, headers=None, content=None):
+        self.payload = payload
+        self.text = text
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = content if content is not None else text.encode("utf-8")
+        self.raw = io.BytesIO(self.content)
+        self.closed = False
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def close(self):
+        self.closed = True
+
+
+class FakeWeb:
+    """Routes http_client calls to canned responses, with latency and stats."""
+
+    def __init__(self, routes, delay=0.0):
+        self.routes = routes
+        self.delay = delay
+        self.requests = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        with self._lock:
+            self.requests.append((url, kwargs))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            delay = self.delay(url) if callable(self.delay) else self.delay
+            time.sleep(delay)
+            for prefix, response in self.routes.items():
+                if url.startswith(prefix):
+                    return response(url, kwargs) if callable(response) else response
+            return FakeResponse(status_code=404)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    post = get
+
+
+@pytest.fixture
+def crawler():
+    return load_tools(TOOLS_PY, "ai_news_crawler_test_tools").module
+
+
+def hn_routes(count=50, ai_every=2):
+    now = int(time.time())
+
+    def _item(url, kwargs):
+        story_id = int(url.rsplit("/", 1)[1].split(".")[0])
+        title = f"New LLM release {story_id}" if story_id % ai_every == 0 else f"Gardening tips {story_id}"
+        return FakeResponse({"id": story_id, "type": "story", "title": title, "time": now - 60,
+                             "score": story_id, "by": "pg"})
+
+    return {
+        "https://hacker-news.firebaseio.com/v0/topstories.json": FakeResponse(list(range(1, count + 1))),
+        "https://hacker-news.firebaseio.com/v0/item/": _item,
+    }
+
+
+class TestCrawlHackerNews:
+    """Tests for crawl_hackernews."""
+
+    def test_concurrent_fetch_keeps_order_and_filters(self, crawler, monkeypatch):
+        """Concurrent mode returns the same stories, in order, as serial mode."""
+        web = FakeWeb(hn_routes(), delay=0.01)
+        monkeypatch.setattr(http_client, "get", web.get)
+
+        serial = crawler.crawl_hackernews(max_articles=5, concurrency=1)
+        concurrent = crawler.crawl_hackernews(max_articles=5, concurrency=8)
+        assert [a["title"] for a in concurrent] == [a["title"] for a in serial]
+        assert [a["score"] for a in concurrent] == [2, 4, 6, 8, 10]
+
+    def test_concurrency_cap_and_early_stop(self, crawler, monkeypatch):
+        """At most `concurrency` items are in flight and fetching stops early."""
+        web = FakeWeb(hn_routes(count=100), delay=0.02)
+        monkeypatch.setattr(http_client, "get", web.get)
+
+        start = time.monotonic()
+        articles = crawler.crawl_hackernews(max_articles=3, concurrency=4)
+        assert len(articles) == 3
+        assert web.peak <= 4
+        # 1 topstories request + the 6 items needed + at most a window of extras
+        assert len(web.requests) <= 1 + 6 + 4
+        assert time.monotonic() - start < 0.5
+
+
+def _fake_source(name, delay, score=1, error=None):
+    def _crawl(*args, **kwargs):
+        time.sleep(delay)
+        if error:
+            raise RuntimeError(error)
+        return [{"title": f"{name} story", "url": f"https://{name}.example/1", "source": name, "score": score}]
+    return _crawl
+
+
+class TestCrawlAINews:
+    """Tests for crawl_ai_news."""
+
+    def test_sources_run_concurrently(self, crawler, monkeypatch):
+        """Total time tracks the slowest source and latency is recorded."""
+        monkeypatch.setattr(crawler, "iter_hackernews", _fake_source("hn", 0.2, score=3))
+        monkeypatch.setattr(crawler, "iter_reddit", _fake_source("reddit", 0.2, score=2))
+        monkeypatch.setattr(crawler, "iter_arxiv", _fake_source("arxiv", 0.2, score=1))
+
+        start = time.monotonic()
+        result = crawler.crawl_ai_news(sources=["hackernews", "reddit", "arxiv"])
+        assert time.monotonic() - start < 0.45
+
+        metadata = result["crawl_metadata"]
+        assert metadata["sources_crawled"] == ["hackernews", "reddit", "arxiv"]
+        assert [a["source"] for a in result["articles"]] == ["hn", "reddit", "arxiv"]
+        assert all(s["status"] == "ok" and s["latency_sec"] >= 0.2 for s in metadata["source_stats"].values())
+
+    def test_slow_and_failing_sources_degrade(self, crawler, monkeypatch):
+        """Slow sources time out and failing ones are reported, not fatal."""
+        monkeypatch.setattr(crawler, "iter_hackernews", _fake_source("hn", 0.05))
+        monkeypatch.setattr(crawler, "iter_reddit", _fake_source("reddit", 2.0))
+        monkeypatch.setattr(crawler, "iter_arxiv", _fake_source("arxiv", 0.0, error="feed down"))
+
+        start = time.monotonic()
+        result = crawler.crawl_ai_news(sources=["hackernews", "reddit", "arxiv", "nope"], source_timeout=0.3)
+        assert time.monotonic() - start < 1.0
+
+        stats = result["crawl_metadata"]["source_stats"]
+        assert result["crawl_metadata"]["sources_crawled"] == ["hackernews"]
+        assert stats["reddit"]["status"] == "timeout"
+        assert stats["arxiv"]["status"] == "error"
+        assert "nope" not in stats
+
+
+class TestIncrementalCrawl:
+    """Tests for CrawlState and incremental crawling."""
+
+    def test_conditional_requests_and_new_items(self, crawler, monkeypatch, tmp_path):
+        """A second crawl sends validators and returns only new or changed items."""
+        now = int(time.time())
+        listing = {"posts": [("a", 10), ("b", 20)]}
+
+        def _reddit(url, kwargs):
+            if kwargs["headers"].get("If-None-Match") == listing.get("etag"):
+                return FakeResponse(status_code=304)
+            children = [
+                {"data": {"id": pid, "title": f"post {pid}", "url": f"https://x/{pid}",
+                          "created_utc": now - 60, "score": score}}
+                for pid, score in listing["posts"]
+            ]
+            return FakeResponse({"data": {"children": children}}, headers={"ETag": listing["etag"]})
+
+        web = FakeWeb({"https://www.reddit.com/r/": _reddit})
+        monkeypatch.setattr(http_client, "get", web.get)
+        state_path = str(tmp_path / "crawl_state.json")
+
+        def _crawl():
+            return crawler.crawl_reddit(subreddits=["MachineLearning"],
+                                        state=crawler.CrawlState(state_path))
+
+        def _crawl_and_save():
+            state = crawler.CrawlState(state_path)
+            posts = crawler.crawl_reddit(subreddits=["MachineLearning"], state=state)
+            state.save()
+            return [p["title"] for p in posts]
+
+        listing["etag"] = '"v1"'
+        assert _crawl_and_save() == ["post a", "post b"]
+
+        # Unchanged listing: the server answers 304 and nothing is materialized
+        assert _crawl_and_save() == []
+        assert web.requests[-1][1]["headers"]["If-None-Match"] == '"v1"'
+
+        # Changed listing: only the new post and the re-scored one come back
+        listing.update(etag='"v2"', posts=[("a", 10), ("b", 25), ("c", 5)])
+        assert _crawl_and_save() == ["post b", "post c"]
+        assert _crawl() == []
+
+    def test_save_expires_endpoints_and_writes_atomically(self, crawler, tmp_path):
+        """Stale endpoint validators are dropped and concurrent saves do not collide."""
+        state_path = tmp_path / "crawl_state.json"
+        state = crawler.CrawlState(str(state_path), max_age_hours=1)
+        state.endpoints = {
+            "https://old": {"etag": '"old"', "last_modified": "", "seen_at": time.time() - 7200},
+            "https://legacy": {"etag": '"legacy"', "last_modified": ""},
+            "https://new": {"etag": '"new"', "last_modified": "", "seen_at": time.time()},
+        }
+        threads = [threading.Thread(target=state.save) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert [p.name for p in tmp_path.iterdir()] == ["crawl_state.json"]
+        reloaded = crawler.CrawlState(str(state_path))
+        assert list(reloaded.endpoints) == ["https://new"]
+        assert reloaded.conditional_headers("https://new") == {"If-None-Match": '"new"'}
+
+    def test_crawl_ai_news_state_path(self, crawler, monkeypatch, tmp_path):
+        """crawl_ai_news persists state, skips off-topic stories and re-offers changed ones."""
+        scores = {}
+        routes = hn_routes(count=10)
+        item_route = routes["https://hacker-news.firebaseio.com/v0/item/"]
+
+        def _item(url, kwargs):
+            response = item_route(url, kwargs)
+            response.payload["score"] += scores.get(response.payload["id"], 0)
+            return response
+
+        routes["https://hacker-news.firebaseio.com/v0/item/"] = _item
+        web = FakeWeb(routes)
+        monkeypatch.setattr(http_client, "get", web.get)
+        state_path = str(tmp_path / "state.json")
+
+        def _item_requests():
+            return sorted(int(url.rsplit("/", 1)[1].split(".")[0]) for url, _ in web.requests if "/item/" in url)
+
+        first = crawler.crawl_ai_news(sources=["hackernews"], max_articles=5, state_path=state_path)
+        assert len(first["articles"]) == 5
+        assert first["crawl_metadata"]["incremental"] is True
+
+        # Off-topic stories are not refetched; returned ones are, to compare scores
+        web.requests.clear()
+        second = crawler.crawl_ai_news(sources=["hackernews"], max_articles=5, state_path=state_path)
+        assert second["articles"] == []
+        assert _item_requests() == [2, 4, 6, 8, 10]
+
+        scores[4] = 100
+        third = crawler.crawl_ai_news(sources=["hackernews"], max_articles=5, state_path=state_path)
+        assert [a["title"] for a in third["articles"]] == ["New LLM release 4"]
+
+    def test_only_returned_articles_are_recorded(self, crawler, monkeypatch, tmp_path):
+        """Candidates cut by top-k come back on the next crawl."""
+        monkeypatch.setattr(http_client, "get", FakeWeb(hn_routes(count=10)).get)
+        state_path = str(tmp_path / "state.json")
+
+        first = crawler.crawl_ai_news(sources=["hackernews"], max_articles=3, state_path=state_path)
+        second = crawler.crawl_ai_news(sources=["hackernews"], max_articles=3, state_path=state_path)
+        assert [a["title"] for a in first["articles"]] == [f"New LLM release {i}" for i in (10, 8, 6)]
+        assert [a["title"] for a in second["articles"]] == [f"New LLM release {i}" for i in (4, 2)]
+
+    def test_validators_wait_for_unreturned_candidates(self, crawler, monkeypatch, tmp_path):
+        """An endpoint whose candidates were not all returned is refetched unconditionally."""
+        now = int(time.time())
+
+        def _reddit(url, kwargs):
+            if kwargs["headers"].get("If-None-Match") == '"v1"':
+                return FakeResponse(status_code=304)
+            children = [
+                {"data": {"id": pid, "title": f"post {pid}", "url": f"https://x/{pid}",
+                          "created_utc": now - 60, "score": score}}
+                for pid, score in (("a", 30), ("b", 20), ("c", 10))
+            ]
+            return FakeResponse({"data": {"children": children}}, headers={"ETag": '"v1"'})
+
+        web = FakeWeb({"https://www.reddit.com/r/": _reddit})
+        monkeypatch.setattr(http_client, "get", web.get)
+        state_path = str(tmp_path / "state.json")
+
+        first = crawler.crawl_ai_news(sources=["reddit"], max_articles=2, state_path=state_path)
+        assert [a["title"] for a in first["articles"]] == ["post a", "post b"]
+
+        second = crawler.crawl_ai_news(sources=["reddit"], max_articles=2, state_path=state_path)
+        assert [a["title"] for a in second["articles"]] == ["post c"]
+        assert "If-None-Match" not in web.requests[-5][1]["headers"]
+
+        third = crawler.crawl_ai_news(sources=["reddit"], max_articles=2, state_path=state_path)
+        assert third["articles"] == []
+        assert web.requests[-1][1]["headers"]["If-None-Match"] == '"v1"'
+
+    def test_timed_out_sources_cannot_change_state(self, crawler, monkeypatch, tmp_path):
+        """A source still running after its timeout is fenced off from the state."""
+        seen = {}
+
+        def _late(max_articles, time_window_hours, state):
+            time.sleep(0.4)
+            state.ignore("reddit:late")
+            seen["state"] = state
+            yield {"title": "late", "url": "https://late", "source": "reddit", "score": 1}
+
+        monkeypatch.setitem(crawler.SOURCE_CRAWLERS, "reddit",
+                            lambda limit, hours, state: list(_late(limit, hours, state)))
+        state_path = str(tmp_path / "state.json")
+        crawler.crawl_ai_news(sources=["reddit"], source_timeout=0.1, state_path=state_path)
+        time.sleep(0.5)
+        assert "reddit:late" not in seen["state"].ignored
+        assert "reddit:late" not in crawler.CrawlState(state_path).ignored
+
+
+def _fake_iter(name, delays, score=1):
+    def _iter(*args, **kwargs):
+        for i, delay in enumerate(delays):
+            time.sleep(delay)
+            yield {"title": f"{name} story {i}", "url": f"https://{name}.example/{i}", "source": name, "score": score}
+    return _iter
+
+
+class TestCrawlStream:
+    """Tests for the streaming crawl API."""
+
+    def test_type_hints_resolve(self, crawler):
+        """Annotations resolve, so tool introspection can read the signature."""
+        hints = typing.get_type_hints(crawler.crawl_ai_news_stream)
+        assert hints["stop_event"] == typing.Optional[threading.Event]
+
+    def test_yields_before_slowest_source_finishes(self, crawler, monkeypatch):
+        """The first article arrives while a slow source is still running."""
+        monkeypatch.setattr(crawler, "iter_hackernews", _fake_iter("hn", [0.0, 0.0]))
+        monkeypatch.setattr(crawler, "iter_reddit", _fake_iter("reddit", [1.0]))
+
+        stats = {}
+        start = time.monotonic()
+        stream = crawler.crawl_ai_news_stream(sources=["hackernews", "reddit"], stats=stats)
+        first = next(stream)
+        assert first["source"] == "hn"
+        assert time.monotonic() - start < 0.5
+
+        rest = list(stream)
+        assert [a["source"] for a in rest] == ["hn", "reddit"]
+        assert stats["source_stats"]["reddit"] == {"status": "ok", "latency_sec": pytest.approx(1.0, abs=0.3), "count": 1}
+
+    def test_max_articles_and_timeout(self, crawler, monkeypatch):
+        """The stream stops at max_articles and drops sources past their timeout."""
+        monkeypatch.setattr(crawler, "iter_hackernews", _fake_iter("hn", [0.0] * 20))
+        monkeypatch.setattr(crawler, "iter_reddit", _fake_iter("reddit", [2.0]))
+
+        articles = list(crawler.crawl_ai_news_stream(sources=["hackernews", "reddit"], max_articles=3))
+        assert len(articles) == 3
+
+        stats = {}
+        start = time.monotonic()
+        articles = list(crawler.crawl_ai_news_stream(
+            sources=["hackernews", "reddit"], max_articles=50, source_timeout=0.3, stats=stats,
+        ))
+        assert time.monotonic() - start < 1.0
+        assert {a["source"] for a in articles} == {"hn"}
+        assert stats["source_stats"]["reddit"]["status"] == "timeout"
+        assert stats["source_stats"]["hackernews"]["count"] == 20
+
+    def test_list_wrappers_consume_iterators(self, crawler, monkeypatch):
+        """crawl_* functions return the items their iter_* generator yields."""
+        monkeypatch.setattr(http_client, "get", FakeWeb(hn_routes(count=10)).get)
+        assert crawler.crawl_hackernews(max_articles=3) == list(crawler.iter_hackernews(max_articles=3))
+
+    def test_async_stream(self, crawler, monkeypatch):
+        """The async variant yields the same articles."""
+        import asyncio
+
+        monkeypatch.setattr(crawler, "iter_hackernews", _fake_iter("hn", [0.0, 0.0]))
+        monkeypatch.setattr(crawler, "iter_reddit", _fake_iter("reddit", [0.05]))
+
+        async def _collect():
+            return [a async for a in crawler.crawl_ai_news_stream_async(sources=["hackernews", "reddit"])]
+
+        articles = asyncio.run(_collect())
+        assert sorted(a["source"] for a in articles) == ["hn", "hn", "reddit"]
+
+    def test_async_stream_cancelled_while_waiting(self, crawler, monkeypatch):
+        """Cancelling mid-next stops the crawl and closes the stream cleanly."""
+        import asyncio
+
+        monkeypatch.setattr(crawler, "iter_hackernews", _fake_iter("hn", [0.0, 5.0]))
+        stats = {}
+
+        async def _consume(seen):
+            async for article in crawler.crawl_ai_news_stream_async(sources=["hackernews"], stats=stats):
+                seen.append(article)
+
+        async def _main():
+            seen = []
+            task = asyncio.create_task(_consume(seen))
+            while not seen:
+                await asyncio.sleep(0.01)
+            # The worker thread is now blocked waiting for the second article
+            await asyncio.sleep(0.1)
+            start = time.monotonic()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return seen, time.monotonic() - start
+
+        seen, elapsed = asyncio.run(_main())
+        assert len(seen) == 1
+        assert elapsed < 1.0
+        assert stats["source_stats"]["hackernews"]["status"] == "stopped"
+
+
+class TestTopK:
+    """Tests for score normalization and top-k selection."""
+
+    def test_normalization_puts_sources_on_one_scale(self, crawler):
+        """A source with large raw scores does not crowd out the others."""
+        per_source = {
+            "github_trending": [{"url": f"gh{i}", "score": 10000 + i * 1000} for i in range(5)],
+            "hackernews": [{"url": f"hn{i}", "score": 10 + i * 50} for i in range(5)],
+        }
+        raw = crawler.top_k_articles(per_source, 4, normalization=None)
+        assert [a["url"] for a in raw] == ["gh4", "gh3", "gh2", "gh1"]
+
+        ranked = crawler.top_k_articles(per_source, 4)
+        assert [a["url"] for a in ranked] == ["gh4", "hn4", "gh3", "hn3"]
+        assert ranked[0]["normalized_score"] == pytest.approx(1.4142, abs=1e-4)
+
+    def test_normalize_scores(self, crawler):
+        """z-score, percentile and degenerate inputs."""
+        articles = [{"score": 1}, {"score": 2}, {"score": 2}, {"score": "n/a"}]
+        assert crawler.normalize_scores(articles, "percentile") == [0.375, 0.75, 0.75, 0.125]
+        assert crawler.normalize_scores([{"score": 5}, {"score": 5}]) == [0.0, 0.0]
+        assert crawler.normalize_scores([]) == []
+        with pytest.raises(ValueError):
+            crawler.normalize_scores(articles, "softmax")
+
+    def test_selection_cost_at_100k_candidates(self, crawler):
+        """Benchmark: heap selection of 50 from 100k beats a full sort."""
+        import heapq
+        import random
+        from operator import itemgetter
+
+        rng = random.Random(0)
+        per_source = {
+            source: [{"url": f"{source}{i}", "score": rng.random() * scale} for i in range(25_000)]
+            for source, scale in (("hackernews", 500), ("reddit", 5000), ("github_trending", 1e5), ("web_search", 1))
+        }
+
+        start = time.perf_counter()
+        top = crawler.top_k_articles(per_source, 50)
+        total = time.perf_counter() - start
+        assert len(top) == 50
+        assert total < 2.0
+
+        candidates = [
+            (score, article)
+            for articles in per_source.values()
+            for score, article in zip(crawler.normalize_scores(articles), articles)
+        ]
+
+        def _best(fn):
+            timings = []
+            for _ in range(3):
+                start = time.perf_counter()
+                fn()
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        heap_time = _best(lambda: heapq.nlargest(50, candidates, key=itemgetter(0)))
+        sort_time = _best(lambda: sorted(candidates, key=itemgetter(0), reverse=True)[:50])
+        assert heap_time < sort_time
+        assert [a["url"] for _, a in sorted(candidates, key=itemgetter(0), reverse=True)[:50]] == [a["url"] for a in top]
+
+
+def arxiv_feed(total, spacing_hours=1.0):
+    """Fake arXiv API serving `total` papers, newest first, one per spacing_hours."""
+    now = datetime.now(timezone.utc)
+    responses = []
+
+    def _query(url, kwargs):
+        query = parse_qs(urlparse(url).query)
+        start, size = int(query["start"][0]), int(query["max_results"][0])
+        entries = "".join(
+            f"<entry><id>http://arxiv.org/abs/{i}</id><title> Paper {i} </title>"
+            f"<summary>Abstract {i}</summary>"
+            f"<published>{(now - timedelta(hours=i * spacing_hours)).strftime('%Y-%m-%dT%H:%M:%SZ')}</published>"
+            f"<author><name>Author {i}</name></author></entry>"
+            for i in range(start, min(start + size, total))
+        )
+        response = FakeResponse(content=f'<feed xmlns="http://www.w3.org/2005/Atom">{entries}</feed>'.encode())
+        responses.append(response)
+        return response
+
+    _query.responses = responses
+    return {"http://export.arxiv.org/api/query": _query}
+
+
+class TestCrawlArxiv:
+    """Tests for the paged, streaming arXiv reader."""
+
+    def test_pages_until_max_articles(self, crawler, monkeypatch):
+        """Pages are requested with increasing start and streamed responses are closed."""
+        routes = arxiv_feed(total=100)
+        web = FakeWeb(routes)
+        monkeypatch.setattr(http_client, "get", web.get)
+
+        papers = crawler.crawl_arxiv(max_articles=7, time_window_hours=48, page_size=3, page_delay=0)
+        assert [p["title"] for p in papers] == [f"Paper {i}" for i in range(7)]
+        assert papers[0]["authors"] == ["Author 0"]
+
+        starts = [parse_qs(urlparse(url).query)["start"][0] for url, _ in web.requests]
+        assert starts == ["0", "3", "6"]
+        assert all(kwargs["stream"] for _, kwargs in web.requests)
+        assert all(r.closed for r in routes["http://export.arxiv.org/api/query"].responses)
+
+    def test_stops_at_time_window(self, crawler, monkeypatch):
+        """No page past the first out-of-window paper is downloaded."""
+        web = FakeWeb(arxiv_feed(total=1000))
+        monkeypatch.setattr(http_client, "get", web.get)
+
+        papers = crawler.crawl_arxiv(max_articles=500, time_window_hours=10.5, page_size=4, page_delay=0)
+        assert len(papers) == 11
+        assert len(web.requests) == 3
+
+    def test_short_feed_ends_paging(self, crawler, monkeypatch):
+        """A page with fewer entries than requested is the last one."""
+        web = FakeWeb(arxiv_feed(total=5))
+        monkeypatch.setattr(http_client, "get", web.get)
+
+        assert len(crawler.crawl_arxiv(max_articles=50, page_size=10, page_delay=0)) == 5
+        assert len(web.requests) == 1
+
+    def test_unused_responses_are_closed(self, crawler, monkeypatch):
+        """304 and error responses of a streamed request are closed, not leaked."""
+        not_modified = FakeResponse(status_code=304)
+        error = FakeResponse(status_code=503)
+
+        monkeypatch.setattr(http_client, "get", FakeWeb({"http://export.arxiv.org/api/query": not_modified}).get)
+        assert crawler.crawl_arxiv(page_delay=0) == []
+        assert not_modified.closed
+
+        monkeypatch.setattr(http_client, "get", FakeWeb({"http://export.arxiv.org/api/query": error}).get)
+        assert crawler.crawl_arxiv(page_delay=0) == []
+        assert error.closed
+
+
+class TestCrawlGitHubTrending:
+    """Tests for crawl_github_trending on the recorded trending page."""
+
+    def test_ai_repos_from_fixture(self, crawler, monkeypatch):
+        """AI-related rows are kept, with stars as score."""
+        from agent_recipes import html_extract
+
+        if not html_extract.available_backends():
+            pytest.skip("no HTML parser installed")
+        html = (Path(__file__).parent.parent / "fixtures" / "github_trending.html").read_text(encoding="utf-8")
+        monkeypatch.setattr(http_client, "get", FakeWeb({"https://github.com/trending": FakeResponse(text=html)}).get)
+
+        repos = crawler.crawl_github_trending(max_repos=3)
+        assert [r["title"] for r in repos] == ["openai/whisper", "langchain-ai/langgraph", "huggingface/transformers"]
+        assert repos[0]["url"] == "https://github.com/openai/whisper"
+        assert repos[0]["score"] == 71234
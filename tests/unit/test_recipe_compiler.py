@@ -0,0 +1,110 @@
+"""
+Unit tests for the compiled agents.yaml cache.
+"""
+
+import os
+
+import pytest
+
+from agent_recipes.recipe_compiler import RecipeCompiler, RecipeRequirementsError
+
+AGENTS_YAML = """\
+metadata:
+  name: demo
+  requires:
+    env:
+      - DEMO_API_KEY
+    variables:
+      - topic
+      - tone
+
+variables:
+  tone: neutral
+
+agents:
+  writer:
+    role: Writer
+    goal: Write about {{topic}}
+
+steps:
+  - agent: writer
+    action: "Write a {{tone}} post about {{ topic }} using {{previous_output}}"
+"""
+
+
+@pytest.fixture
+def agents_yaml(tmp_path):
+    path = tmp_path / "demo" / "agents.yaml"
+    path.parent.mkdir()
+    path.write_text(AGENTS_YAML)
+    return path
+
+
+class TestRecipeCompiler:
+    """Tests for RecipeCompiler and CompiledRecipe."""
+
+    def test_compiles_once(self, agents_yaml):
+        """The same file is parsed once and reused."""
+        compiler = RecipeCompiler()
+        first = compiler.compile(agents_yaml)
+        assert compiler.compile(agents_yaml) is first
+        assert first.name == "demo"
+        assert first.required_variables == ["topic", "tone"]
+        assert first.defaults == {"tone": "neutral"}
+
+    def test_requirements(self, agents_yaml):
+        """Declared env vars and variables are validated; defaults count."""
+        compiled = RecipeCompiler().compile(agents_yaml)
+        assert compiled.missing_requirements({}, env={}) == (["DEMO_API_KEY"], ["topic"])
+        compiled.validate({"topic": "t"}, env={"DEMO_API_KEY": "k"})
+        with pytest.raises(RecipeRequirementsError) as excinfo:
+            compiled.validate({}, env={"DEMO_API_KEY": "k"})
+        assert excinfo.value.missing_variables == ["topic"]
+
+    def test_disk_cache_and_invalidation(self, agents_yaml, tmp_path):
+        """Parsed YAML is stored by content hash and edits are picked up."""
+        cache_dir = tmp_path / "cache"
+        first = RecipeCompiler(cache_dir).compile(agents_yaml)
+        assert (cache_dir / f"{first.content_hash}.json").exists()
+
+        # A fresh compiler (new process) loads from the disk cache
+        again = RecipeCompiler(cache_dir).compile(agents_yaml)
+        assert again.content_hash == first.content_hash
+        assert again.data == first.data
+
+        compiler = RecipeCompiler(cache_dir)
+        compiler.compile(agents_yaml)
+        agents_yaml.write_text(AGENTS_YAML.replace("neutral", "playful"))
+        stat = os.stat(agents_yaml)
+        os.utime(agents_yaml, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        changed = compiler.compile(agents_yaml)
+        assert changed.content_hash != first.content_hash
+        assert changed.defaults == {"tone": "playful"}
+
+    def test_build_workflow_matches_file_parse(self, agents_yaml):
+        """The workflow built from cached data matches parsing the file."""
+        pytest.importorskip("praisonaiagents")
+        from praisonaiagents.workflows.yaml_parser import YAMLWorkflowParser
+
+        compiled = RecipeCompiler().compile(agents_yaml)
+        workflow = compiled.build_workflow()
+        expected = YAMLWorkflowParser().parse_file(str(agents_yaml))
+        assert workflow.name == expected.name
+        assert workflow.variables == expected.variables
+        assert len(workflow.steps) == len(expected.steps)
+        # Each build starts from a copy, so runs cannot leak into the cache
+        workflow.variables["topic"] = "changed"
+        assert "topic" not in compiled.data.get("variables", {})
+
+
+class TestRunRecipeRequirements:
+    """Tests for validating declared requirements before a run."""
+
+    def test_missing_requirements_fail_fast(self, monkeypatch):
+        from agent_recipes import _run_recipe_local
+
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        with pytest.raises(RecipeRequirementsError) as exc:
+            _run_recipe_local("ai-angle-generator", variables={})
+        assert exc.value.missing_env == ["OPENAI_API_KEY"]
+        assert exc.value.missing_variables == ["topic"]
@@ -0,0 +1,899 @@
+"""
+Unit tests for the shared recipe runtime.
+"""
+
+import hashlib
+import json
+
+import pytest
+
+from agent_recipes.recipe_runtime import core
+from agent_recipes.recipe_runtime.core import RecipeConfig, RecipeRunner
+from agent_recipes.recipe_runtime.hashing import HASH_CACHE_NAME, HASH_CACHE_TMP_NAME, HashCache, hash_file
+from agent_recipes.recipe_runtime.journal import RunJournal, compact_journal, read_journal
+
+
+class EchoRunner(RecipeRunner):
+    """Runner that copies its input into the output directory in two stages."""
+
+    def __init__(self, fail_in=None):
+        super().__init__("echo", version="1.2.3")
+        self.fail_in = fail_in
+
+    def _execute(self, config):
+        with self.stage("read"):
+            data = open(config.input_path, "rb").read()
+        with self.stage("write"):
+            if self.fail_in == "write":
+                raise RuntimeError("boom")
+            (self.output_dir / "copy.bin").write_bytes(data)
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    path = tmp_path / "input.bin"
+    path.write_bytes(b"payload")
+    return path
+
+
+class TestOutputHashing:
+    """Tests for output hashing and collection."""
+
+    def test_hash_file_matches_hashlib(self, tmp_path):
+        """hash_file should agree with hashlib on both read paths."""
+        data = b"x" * 5000
+        path = tmp_path / "a.bin"
+        path.write_bytes(data)
+        expected = hashlib.sha256(data).hexdigest()
+
+        assert hash_file(path) == expected
+        assert hash_file(path, mmap_threshold=1) == expected
+
+    def test_hash_empty_file(self, tmp_path):
+        """Empty files should hash without using mmap."""
+        path = tmp_path / "empty"
+        path.write_bytes(b"")
+        assert hash_file(path, mmap_threshold=0) == hashlib.sha256(b"").hexdigest()
+
+    def test_collect_outputs_skips_runtime_files(self, tmp_path):
+        """collect_outputs should ignore run.json, run.log and the hash cache files."""
+        (tmp_path / "out.txt").write_text("hello")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.txt").write_text("world")
+        (tmp_path / "run.json").write_text("{}")
+        (tmp_path / "run.log").write_text("")
+        # Left behind by a save interrupted before its rename
+        (tmp_path / HASH_CACHE_TMP_NAME).write_text("{")
+
+        outputs = core.collect_outputs(tmp_path, max_workers=4)
+
+        assert sorted(o.path for o in outputs) == ["out.txt", "sub/b.txt"]
+        assert (tmp_path / HASH_CACHE_NAME).exists()
+        by_name = {o.name: o for o in outputs}
+        assert by_name["out.txt"].sha256 == hashlib.sha256(b"hello").hexdigest()
+
+    def test_recollecting_skips_hash_cache(self, tmp_path):
+        """A second collection should not pick up the hash cache the first one saved."""
+        (tmp_path / "out.txt").write_text("hello")
+        core.collect_outputs(tmp_path)
+        assert (tmp_path / HASH_CACHE_NAME).exists()
+
+        assert [o.path for o in core.collect_outputs(tmp_path)] == ["out.txt"]
+
+    def test_collecting_does_not_change_directory_input_hash(self, tmp_path):
+        """A run directory used as input keeps its hash after outputs are collected."""
+        from agent_recipes.recipe_runtime.cache import hash_input
+
+        (tmp_path / "out.txt").write_text("hello")
+        before = hash_input(str(tmp_path))
+        core.collect_outputs(tmp_path)
+        assert (tmp_path / HASH_CACHE_NAME).exists()
+        assert hash_input(str(tmp_path)) == before
+
+    def test_unchanged_files_are_not_rehashed(self, tmp_path, monkeypatch):
+        """A second collection should be served from the hash cache."""
+        (tmp_path / "out.txt").write_text("hello")
+        core.collect_outputs(tmp_path)
+
+        from agent_recipes.recipe_runtime import hashing
+        calls = []
+        monkeypatch.setattr(hashing, "hash_file", lambda p: calls.append(p) or "x")
+
+        outputs = core.collect_outputs(tmp_path)
+        assert calls == []
+        assert outputs[0].sha256 == hashlib.sha256(b"hello").hexdigest()
+
+    def test_changed_file_is_rehashed(self, tmp_path):
+        """Cache entries should be invalidated by size/mtime changes."""
+        path = tmp_path / "out.txt"
+        path.write_text("hello")
+        core.collect_outputs(tmp_path)
+        path.write_text("hello again")
+
+        outputs = core.collect_outputs(tmp_path)
+        assert outputs[0].sha256 == hashlib.sha256(b"hello again").hexdigest()
+
+    def test_cache_prunes_deleted_files(self, tmp_path):
+        """Entries for deleted files should be dropped."""
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "b.txt").write_text("b")
+        core.collect_outputs(tmp_path)
+        (tmp_path / "b.txt").unlink()
+        core.collect_outputs(tmp_path)
+
+        data = json.loads((tmp_path / HASH_CACHE_NAME).read_text())
+        assert list(data["entries"]) == ["a.txt"]
+        assert len(HashCache(tmp_path)) == 1
+
+
+class TestRunJournal:
+    """Tests for the run.jsonl journal."""
+
+    def test_run_writes_journal_and_compacted_run_json(self, tmp_path, input_file):
+        """run.json should be compacted from the streamed journal."""
+        out = tmp_path / "out"
+        result = EchoRunner().run(RecipeConfig("echo", str(input_file), output_dir=str(out)))
+
+        events = [e["event"] for e in read_journal(out)]
+        assert events[0] == "run_start"
+        assert events[-1] == "run_end"
+        assert events.count("stage_end") == 2
+
+        run_json = json.loads((out / "run.json").read_text())
+        assert run_json["status"] == "success"
+        assert run_json["version"] == "1.2.3"
+        assert [o["path"] for o in run_json["outputs"]] == ["copy.bin"]
+        assert set(run_json["metrics"]["stages"]) == {"read", "write"}
+        assert result.to_dict() == run_json
+
+    def test_failed_stage_is_recorded(self, tmp_path, input_file):
+        """A failing stage should be journaled as failed."""
+        out = tmp_path / "out"
+        with pytest.raises(RuntimeError):
+            EchoRunner(fail_in="write").run(RecipeConfig("echo", str(input_file), output_dir=str(out)))
+
+        run_json = json.loads((out / "run.json").read_text())
+        assert run_json["status"] == "failed"
+        assert run_json["metrics"]["stages"]["write"]["status"] == "failed"
+        assert run_json["metrics"]["stages"]["write"]["error"] == "boom"
+
+    def test_recover_interrupted_run(self, tmp_path):
+        """A journal without run_end should recover as interrupted."""
+        with RunJournal(tmp_path) as journal:
+            journal.record("run_start", recipe="echo", version="1", input="x", config={})
+            journal.record("stage_start", stage="render")
+        with open(tmp_path / "run.jsonl", "a") as f:
+            f.write('{"event": "stage_e')  # truncated write from a killed process
+
+        result = core.recover_run(tmp_path)
+
+        assert result.status == "interrupted"
+        assert result.metrics["stages"]["render"]["status"] == "interrupted"
+        assert json.loads((tmp_path / "run.json").read_text())["recipe"] == "echo"
+        assert compact_journal(tmp_path)["status"] == "interrupted"
+
+
+class TestBatchExecution:
+    """Tests for RecipeRunner.run_many."""
+
+    def test_run_many_isolates_items(self, tmp_path):
+        """Each item should get its own output dir, log and run.json."""
+        inputs = []
+        for i in range(5):
+            path = tmp_path / f"in{i}.bin"
+            path.write_bytes(f"data-{i}".encode())
+            inputs.append(path)
+        configs = [RecipeConfig("echo", str(p)) for p in inputs]
+
+        batch = EchoRunner().run_many(configs, max_workers=3, base_dir=tmp_path / "outputs")
+
+        assert [r.input_path for r in batch.results] == [str(p) for p in inputs]
+        assert batch.succeeded == 5
+        dirs = {r.output_dir for r in batch.results}
+        assert len(dirs) == 5
+        for i, result in enumerate(batch.results):
+            out = tmp_path / "outputs" / "echo"
+            assert result.output_dir.startswith(str(out))
+            copy_path = f"{result.output_dir}/copy.bin"
+            assert open(copy_path, "rb").read() == f"data-{i}".encode()
+
+        manifest = json.loads((tmp_path / "outputs" / "echo").glob("*/batch.json").__next__().read_text())
+        assert manifest["total"] == 5
+        assert manifest["failed"] == 0
+        assert [item["index"] for item in manifest["items"]] == list(range(5))
+
+    def test_run_many_captures_failures(self, tmp_path, input_file):
+        """A failing item should be reported, not raised."""
+        configs = [
+            RecipeConfig("echo", str(input_file)),
+            RecipeConfig("echo", str(tmp_path / "missing.bin")),
+        ]
+        batch = EchoRunner().run_many(configs, max_workers=2, base_dir=tmp_path / "outputs")
+
+        assert [r.status for r in batch.results] == ["success", "failed"]
+        assert "Input not found" in batch.results[1].error
+        assert batch.to_dict()["failed"] == 1
+
+    def test_run_many_records_items_that_cannot_run(self, tmp_path, input_file):
+        """An item whose future raises is recorded as failed and batch.json is written."""
+        runner = EchoRunner()
+        runner.fail_in = lambda: None  # cannot be pickled for the process pool
+        configs = [RecipeConfig("echo", str(input_file)) for _ in range(2)]
+        batch = runner.run_many(configs, max_workers=1, executor="process", base_dir=tmp_path / "outputs")
+
+        assert [r.status for r in batch.results] == ["failed", "failed"]
+        assert all(r.error for r in batch.results)
+        manifest = json.loads((tmp_path / "outputs" / "echo").glob("*/batch.json").__next__().read_text())
+        assert manifest["failed"] == 2
+        assert [item["index"] for item in manifest["items"]] == [0, 1]
+
+    def test_run_many_rejects_unknown_executor(self, tmp_path):
+        """Only thread and process executors are supported."""
+        with pytest.raises(ValueError):
+            EchoRunner().run_many([], executor="fiber", base_dir=tmp_path)
+
+
+class TestResultCache:
+    """Tests for the content-addressed result cache."""
+
+    def test_cache_hit_links_previous_outputs(self, tmp_path, input_file):
+        """A second identical run should be served from the cache."""
+        from agent_recipes.recipe_runtime.cache import ResultCache
+
+        cache = ResultCache(tmp_path / "cache")
+        first = EchoRunner()
+        first.cache = cache
+        first.run(RecipeConfig("echo", str(input_file), output_dir=str(tmp_path / "a")))
+
+        second = EchoRunner(fail_in="write")  # would fail if executed
+        second.cache = cache
+        result = second.run(RecipeConfig("echo", str(input_file), output_dir=str(tmp_path / "b")))
+
+        assert result.status == "cached"
+        assert result.metrics["cache"]["hit"] is True
+        assert (tmp_path / "b" / "copy.bin").read_bytes() == b"payload"
+        assert json.loads((tmp_path / "b" / "run.json").read_text())["status"] == "cached"
+
+    def test_entry_with_missing_files_is_a_miss(self, tmp_path, input_file):
+        """Lost cache files should re-run the recipe and repair the entry."""
+        from agent_recipes.recipe_runtime.cache import ResultCache
+
+        cache = ResultCache(tmp_path / "cache")
+        first = EchoRunner()
+        first.cache = cache
+        first.run(RecipeConfig("echo", str(input_file), output_dir=str(tmp_path / "a")))
+        key = first.result.metrics["cache"]["key"]
+        entry = cache.lookup(key)
+        (entry.files_dir / "copy.bin").unlink()
+        assert cache.lookup(key) is None
+
+        second = EchoRunner()
+        second.cache = cache
+        result = second.run(RecipeConfig("echo", str(input_file), output_dir=str(tmp_path / "b")))
+        assert result.status == "success"
+        assert (cache.lookup(key).files_dir / "copy.bin").read_bytes() == b"payload"
+
+    def test_failed_materialize_executes(self, tmp_path, input_file, monkeypatch):
+        """Files vanishing between lookup and materialize fall back to running."""
+        from agent_recipes.recipe_runtime.cache import ResultCache
+
+        cache = ResultCache(tmp_path / "cache")
+        first = EchoRunner()
+        first.cache = cache
+        first.run(RecipeConfig("echo", str(input_file), output_dir=str(tmp_path / "a")))
+        entry = cache.lookup(first.result.metrics["cache"]["key"])
+
+        # A complete entry is left in place rather than replaced
+        stored = cache.store(entry.key, tmp_path / "a", ["copy.bin"], recipe="echo", version="1.2.3")
+        assert stored.created_at == entry.created_at
+
+        lookup = cache.lookup
+
+        def racing_lookup(key):
+            found = lookup(key)
+            (found.files_dir / "copy.bin").unlink()
+            return found
+
+        monkeypatch.setattr(cache, "lookup", racing_lookup)
+        second = EchoRunner()
+        second.cache = cache
+        result = second.run(RecipeConfig("echo", str(input_file), output_dir=str(tmp_path / "b")))
+        assert result.status == "success"
+        assert (tmp_path / "b" / "copy.bin").read_bytes() == b"payload"
+
+    def test_changed_input_misses(self, tmp_path, input_file):
+        """Changing the input content should change the key."""
+        from agent_recipes.recipe_runtime.cache import ResultCache
+
+        cache = ResultCache(tmp_path / "cache")
+        config = {"recipe_name": "echo", "output_dir": "x"}
+        key1 = cache.key_for("echo", "1", str(input_file), config)
+        assert key1 == cache.key_for("echo", "1", str(input_file), {**config, "output_dir": "y"})
+        input_file.write_bytes(b"other")
+        assert key1 != cache.key_for("echo", "1", str(input_file), config)
+
+    def test_prune_by_size_evicts_least_recently_used(self, tmp_path):
+        """Size-based pruning should evict the oldest entries first."""
+        from agent_recipes.recipe_runtime.cache import ResultCache
+
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "f.bin").write_bytes(b"x" * 100)
+        cache = ResultCache(tmp_path / "cache")
+        cache.store("aa" + "0" * 62, src, ["f.bin"], recipe="echo", version="1")
+        cache.store("bb" + "0" * 62, src, ["f.bin"], recipe="echo", version="1")
+        cache.lookup("aa" + "0" * 62)  # refresh
+
+        evicted = cache.prune(max_bytes=150)
+
+        assert [e.key for e in evicted] == ["bb" + "0" * 62]
+        assert [e.key for e in cache.entries()] == ["aa" + "0" * 62]
+
+    def test_cli_prune_and_list(self, tmp_path, capsys):
+        """The cache CLI should list and prune entries."""
+        from agent_recipes.recipe_runtime.cache import ResultCache
+        from agent_recipes.recipe_runtime.cli import main, parse_age, parse_size
+
+        assert parse_size("10G") == 10 * 1024 ** 3
+        assert parse_age("7d") == 7 * 86400
+
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "f.bin").write_bytes(b"x")
+        ResultCache(tmp_path / "cache").store("cc" + "0" * 62, src, ["f.bin"], recipe="echo", version="1")
+
+        main(["cache", "--dir", str(tmp_path / "cache"), "list", "--json"])
+        assert json.loads(capsys.readouterr().out)[0]["recipe"] == "echo"
+
+        main(["cache", "--dir", str(tmp_path / "cache"), "prune", "--max-size", "0"])
+        assert "Evicted 1 entries" in capsys.readouterr().out
+
+
+class TestStageMetrics:
+    """Tests for per-stage instrumentation."""
+
+    def test_stage_metrics_in_run_json(self, tmp_path, input_file):
+        """Each stage should report timing and resource metrics."""
+        out = tmp_path / "out"
+        EchoRunner().run(RecipeConfig("echo", str(input_file), output_dir=str(out)))
+
+        stages = json.loads((out / "run.json").read_text())["metrics"]["stages"]
+        for key in ("duration_sec", "cpu_sec", "peak_rss_mb", "subprocesses", "calls"):
+            assert key in stages["write"]
+        assert stages["write"]["calls"] == 1
+
+    def test_measure_counts_subprocesses(self):
+        """measure() should count subprocesses started in the block."""
+        import subprocess
+        import sys
+        from agent_recipes.recipe_runtime.metrics import measure
+
+        with measure() as m:
+            subprocess.run([sys.executable, "-c", "pass"], check=True)
+        assert m["subprocesses"] == 1
+        assert m["duration_sec"] >= 0
+
+    def test_subprocess_count_is_scoped(self):
+        """Only the measuring thread's subprocesses are counted; Popen is untouched."""
+        import subprocess
+        import sys
+        import threading
+        from agent_recipes.recipe_runtime.metrics import measure
+
+        popen = subprocess.Popen
+        started = threading.Event()
+        release = threading.Event()
+
+        def other():
+            started.set()
+            release.wait(5)
+            subprocess.run([sys.executable, "-c", "pass"], check=True)
+
+        thread = threading.Thread(target=other)
+        thread.start()
+        started.wait(5)
+        with measure() as outer:
+            with measure() as inner:
+                subprocess.run([sys.executable, "-c", "pass"], check=True)
+            release.set()
+            thread.join()
+        assert inner["subprocesses"] == 1
+        assert outer["subprocesses"] == 1
+        assert subprocess.Popen is popen
+        # Nested blocks do not count as overlapping
+        assert "overlapped" not in outer and "cpu_sec" in outer
+
+    def test_overlapping_blocks_drop_process_wide_metrics(self):
+        """Blocks running concurrently on two threads are flagged, not misreported."""
+        import threading
+        from agent_recipes.recipe_runtime.metrics import PROCESS_WIDE_METRICS, measure
+
+        entered = threading.Event()
+        release = threading.Event()
+        results = {}
+
+        def other():
+            with measure() as m:
+                entered.set()
+                release.wait(5)
+            results["other"] = m
+
+        thread = threading.Thread(target=other)
+        thread.start()
+        entered.wait(5)
+        with measure() as mine:
+            release.set()
+            thread.join()
+        for m in (mine, results["other"]):
+            assert m["overlapped"] is True
+            assert "duration_sec" in m and "subprocesses" in m
+            assert not any(key in m for key in PROCESS_WIDE_METRICS)
+
+    def test_repeated_stages_are_aggregated(self, tmp_path, input_file):
+        """A stage decorated with recipe_stage and called twice is summed."""
+        from agent_recipes.recipe_runtime.metrics import recipe_stage
+
+        class LoopRunner(RecipeRunner):
+            @recipe_stage("chunk")
+            def process_chunk(self, i):
+                (self.output_dir / f"chunk{i}.txt").write_text(str(i))
+
+            def _execute(self, config):
+                for i in range(3):
+                    self.process_chunk(i)
+
+        out = tmp_path / "out"
+        LoopRunner("loop").run(RecipeConfig("loop", str(input_file), output_dir=str(out)))
+
+        chunk = json.loads((out / "run.json").read_text())["metrics"]["stages"]["chunk"]
+        assert chunk["calls"] == 3
+        assert chunk["status"] == "success"
+
+
+class TestRunLogging:
+    """Tests for run-scoped logging."""
+
+    def test_handlers_do_not_accumulate(self, tmp_path, input_file):
+        """Each run should remove its handler when it ends."""
+        import logging
+
+        root = logging.getLogger()
+        before = list(root.handlers)
+        for i in range(3):
+            EchoRunner().run(RecipeConfig("echo", str(input_file), output_dir=str(tmp_path / f"o{i}")))
+        assert root.handlers == before
+
+    def test_later_runs_do_not_write_to_earlier_logs(self, tmp_path, input_file):
+        """Log lines of one run must not appear in another run's run.log."""
+        import logging
+
+        level = logging.getLogger().level
+        EchoRunner().run(RecipeConfig("echo", str(input_file), output_dir=str(tmp_path / "first"), verbose=True))
+        size = (tmp_path / "first" / "run.log").stat().st_size
+        EchoRunner().run(RecipeConfig("echo", str(input_file), output_dir=str(tmp_path / "second"), verbose=True))
+
+        assert (tmp_path / "first" / "run.log").stat().st_size == size
+        assert "Starting recipe: echo" in (tmp_path / "second" / "run.log").read_text()
+        assert logging.getLogger().level == level
+
+    def test_queue_backend_flushes_on_stop(self, tmp_path):
+        """The queue listener should write every record before stop returns."""
+        import logging
+
+        from agent_recipes.recipe_runtime.core import RunLogging
+
+        with RunLogging(tmp_path, verbose=True, use_queue=True) as log_path:
+            for i in range(50):
+                logging.getLogger("queued").info(f"line {i}")
+        assert (log_path.read_text()).count("line ") == 50
+
+
+class TestAsyncRecipeRunner:
+    """Tests for AsyncRecipeRunner."""
+
+    @staticmethod
+    def _make_runner(fail=False):
+        import asyncio
+
+        from agent_recipes.recipe_runtime.async_runner import AsyncRecipeRunner
+
+        class SleepRunner(AsyncRecipeRunner):
+            async def _execute(self, config):
+                import logging
+                logging.getLogger("sleep").info(f"processing {config.input_path}")
+                with self.stage("wait"):
+                    await asyncio.sleep(0.05)
+                if fail:
+                    raise RuntimeError("async boom")
+                (self.output_dir / "done.txt").write_text(config.input_path)
+
+        return SleepRunner("sleep")
+
+    def test_async_run_matches_result_contract(self, tmp_path, input_file):
+        """An async run should produce the same run.json shape."""
+        import asyncio
+
+        out = tmp_path / "out"
+        result = asyncio.run(self._make_runner().run(RecipeConfig("sleep", str(input_file), output_dir=str(out))))
+
+        run_json = json.loads((out / "run.json").read_text())
+        assert result.status == "success"
+        assert result.to_dict() == run_json
+        assert [o["path"] for o in run_json["outputs"]] == ["done.txt"]
+        assert "wait" in run_json["metrics"]["stages"]
+
+    def test_async_failure_is_recorded(self, tmp_path, input_file):
+        """Failures should be raised and written to run.json."""
+        import asyncio
+
+        out = tmp_path / "out"
+        with pytest.raises(RuntimeError):
+            asyncio.run(self._make_runner(fail=True).run(RecipeConfig("sleep", str(input_file), output_dir=str(out))))
+        assert json.loads((out / "run.json").read_text())["status"] == "failed"
+
+    def test_async_run_many_shares_loop_with_separate_logs(self, tmp_path):
+        """Concurrent runs on one loop should overlap and keep their own logs."""
+        import asyncio
+        import time
+
+        inputs = []
+        for i in range(10):
+            path = tmp_path / f"in{i}.txt"
+            path.write_text(str(i))
+            inputs.append(path)
+
+        start = time.time()
+        batch = asyncio.run(self._make_runner().run_many(
+            [RecipeConfig("sleep", str(p), verbose=True) for p in inputs],
+            max_concurrency=10,
+            base_dir=tmp_path / "outputs",
+        ))
+        assert time.time() - start < 0.05 * 10
+        assert batch.succeeded == 10
+
+        for path, result in zip(inputs, batch.results):
+            log = open(f"{result.output_dir}/run.log").read()
+            assert f"processing {path}" in log
+            assert log.count("processing ") == 1
+
+    def test_async_admission_does_not_starve_executor(self, tmp_path):
+        """Queued runs wait on the loop, so one admitted run still gets executor threads."""
+        import asyncio
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from agent_recipes.recipe_runtime.limits import AdmissionController
+
+        inputs = []
+        for i in range(8):
+            path = tmp_path / f"in{i}.txt"
+            path.write_text(str(i))
+            inputs.append(path)
+
+        runner = self._make_runner()
+        runner.admission = AdmissionController(max_concurrent_runs=1, poll_interval_sec=0.01)
+
+        async def _batch():
+            asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(2))
+            return await runner.run_many(
+                [RecipeConfig("sleep", str(p)) for p in inputs],
+                base_dir=tmp_path / "outputs",
+            )
+
+        outcome = {}
+        thread = threading.Thread(target=lambda: outcome.update(batch=asyncio.run(_batch())), daemon=True)
+        thread.start()
+        thread.join(30)
+        assert not thread.is_alive(), "batch deadlocked waiting for admission"
+        assert outcome["batch"].succeeded == 8
+        assert runner.admission.active == 0 and runner.admission.waiting == 0
+
+    def test_async_run_stage_checkpoints_coroutines(self, tmp_path, input_file):
+        """run_stage awaits async stages, checkpoints them and finishes off the loop."""
+        import asyncio
+        import threading
+
+        from agent_recipes.recipe_runtime.async_runner import AsyncRecipeRunner
+
+        calls = []
+        finish_threads = []
+
+        class StagedRunner(AsyncRecipeRunner):
+            async def fetch(self, path):
+                calls.append("fetch")
+                await asyncio.sleep(0)
+                (self.output_dir / "page.txt").write_text(path)
+                return {"pages": 1}
+
+            def summarize(self, fetched):
+                calls.append("summarize")
+                return fetched["pages"] + 1
+
+            async def _execute(self, config):
+                fetched = await self.run_stage(
+                    "fetch", self.fetch, config.input_path, artifacts=["page.txt"],
+                )
+                assert await self.run_stage("summarize", self.summarize, fetched) == 2
+
+            def _close_run(self):
+                finish_threads.append(threading.current_thread())
+                super()._close_run()
+
+        out = tmp_path / "out"
+        result = asyncio.run(StagedRunner("staged").run(RecipeConfig("staged", str(input_file), output_dir=str(out))))
+        assert calls == ["fetch", "summarize"]
+        assert result.metrics["stages"]["fetch"]["status"] == "success"
+        assert finish_threads[0] is not threading.main_thread()
+
+        calls.clear()
+        asyncio.run(StagedRunner("staged").run(RecipeConfig("staged", str(input_file), resume=str(out))))
+        assert calls == []
+
+    def test_sync_run_stage_rejects_coroutines(self, tmp_path, input_file):
+        """The synchronous runner refuses async stages instead of skipping them."""
+        class BadRunner(RecipeRunner):
+            async def fetch(self):
+                pass
+
+            def _execute(self, config):
+                self.run_stage("fetch", self.fetch)
+
+        with pytest.raises(TypeError, match="AsyncRecipeRunner"):
+            BadRunner("bad").run(RecipeConfig("bad", str(input_file), output_dir=str(tmp_path / "out")))
+
+
+class TestCheckpoints:
+    """Tests for resumable stage checkpoints."""
+
+    @staticmethod
+    def _make_runner(calls, fail_render=False):
+        class TwoStageRunner(RecipeRunner):
+            def transcribe(self, path):
+                calls.append("transcribe")
+                (self.output_dir / "transcript.txt").write_text(open(path).read().upper())
+                return {"words": 1}
+
+            def render(self, transcript):
+                calls.append("render")
+                if fail_render:
+                    raise RuntimeError("render crashed")
+                (self.output_dir / "video.txt").write_text(f"{transcript['words']} words")
+
+            def _execute(self, config):
+                transcript = self.run_stage(
+                    "transcribe", self.transcribe, config.input_path,
+                    artifacts=["transcript.txt"],
+                )
+                self.run_stage("render", self.render, transcript, artifacts=["video.txt"])
+
+        return TwoStageRunner("two-stage")
+
+    def test_resume_skips_completed_stages(self, tmp_path):
+        """Resuming a failed run should only re-run the failed stage."""
+        input_path = tmp_path / "in.txt"
+        input_path.write_text("hello")
+        out = tmp_path / "out"
+
+        calls = []
+        with pytest.raises(RuntimeError):
+            self._make_runner(calls, fail_render=True).run(
+                RecipeConfig("two-stage", str(input_path), output_dir=str(out))
+            )
+        assert calls == ["transcribe", "render"]
+
+        calls.clear()
+        result = self._make_runner(calls).run(
+            RecipeConfig("two-stage", str(input_path), resume=str(out))
+        )
+
+        assert calls == ["render"]
+        assert result.status == "success"
+        assert (out / "video.txt").read_text() == "1 words"
+        assert result.metrics["stages"]["transcribe"]["status"] == "skipped"
+        assert result.metrics["stages"]["render"]["status"] == "success"
+        assert sorted(o.path for o in result.outputs) == ["transcript.txt", "video.txt"]
+
+    def test_resumed_journal_reports_latest_attempt(self, tmp_path):
+        """Outputs, metrics and stages of earlier attempts are not carried over."""
+        input_path = tmp_path / "in.txt"
+        input_path.write_text("hello")
+        out = tmp_path / "out"
+
+        with pytest.raises(RuntimeError):
+            self._make_runner([], fail_render=True).run(
+                RecipeConfig("two-stage", str(input_path), output_dir=str(out))
+            )
+        (out / "transcript.txt").unlink()
+        self._make_runner([]).run(RecipeConfig("two-stage", str(input_path), resume=str(out)))
+
+        run = compact_journal(out)
+        assert run["status"] == "success"
+        assert run["metrics"]["stages"]["render"]["calls"] == 1
+        assert run["metrics"]["stages"]["transcribe"]["calls"] == 1
+        assert run["metrics"]["duration_sec"] >= 0
+        assert "error" not in run["metrics"]["stages"]["render"]
+
+    def test_changed_input_reruns_everything(self, tmp_path):
+        """A different input should invalidate every checkpoint."""
+        input_path = tmp_path / "in.txt"
+        input_path.write_text("hello")
+        out = tmp_path / "out"
+
+        self._make_runner([]).run(RecipeConfig("two-stage", str(input_path), output_dir=str(out)))
+        input_path.write_text("changed")
+
+        calls = []
+        self._make_runner(calls).run(RecipeConfig("two-stage", str(input_path), resume=str(out)))
+        assert calls == ["transcribe", "render"]
+        assert (out / "transcript.txt").read_text() == "CHANGED"
+
+    def test_modified_artifact_reruns_stage(self, tmp_path):
+        """A tampered artifact should invalidate its stage."""
+        input_path = tmp_path / "in.txt"
+        input_path.write_text("hello")
+        out = tmp_path / "out"
+
+        self._make_runner([]).run(RecipeConfig("two-stage", str(input_path), output_dir=str(out)))
+        (out / "video.txt").write_text("corrupted!")
+
+        calls = []
+        self._make_runner(calls).run(RecipeConfig("two-stage", str(input_path), resume=str(out)))
+        assert calls == ["render"]
+
+    def test_resume_missing_directory(self, tmp_path, input_file):
+        """Resuming a directory that does not exist should fail clearly."""
+        with pytest.raises(FileNotFoundError):
+            EchoRunner().run(RecipeConfig("echo", str(input_file), resume=str(tmp_path / "nope")))
+
+
+class TestResourceLimits:
+    """Tests for resource limits and admission control."""
+
+    def test_wall_time_limit_aborts_run(self, tmp_path, input_file):
+        """A run past max_wall_sec should fail at its next limit check."""
+        import time
+
+        from agent_recipes.recipe_runtime.limits import ResourceLimitExceeded, ResourceLimits
+
+        class SlowRunner(RecipeRunner):
+            def _execute(self, config):
+                with self.stage("spin"):
+                    deadline = time.time() + 5
+                    while time.time() < deadline:
+                        self.check_limits()
+
+        out = tmp_path / "out"
+        runner = SlowRunner("slow", limits=ResourceLimits(max_wall_sec=0.2, check_interval_sec=0.05))
+        start = time.time()
+        with pytest.raises(ResourceLimitExceeded) as exc_info:
+            runner.run(RecipeConfig("slow", str(input_file), output_dir=str(out)))
+
+        assert time.time() - start < 2
+        assert exc_info.value.limit == "wall_sec"
+        run_json = json.loads((out / "run.json").read_text())
+        assert run_json["status"] == "failed"
+        assert "wall_sec" in run_json["error"]
+
+    def test_violation_is_raised_when_stage_ends(self, tmp_path, input_file):
+        """A stage that never checks limits fails as soon as it returns."""
+        import time
+
+        from agent_recipes.recipe_runtime.limits import ResourceLimitExceeded, ResourceLimits
+
+        class BlockingRunner(RecipeRunner):
+            def _execute(self, config):
+                with self.stage("block"):
+                    time.sleep(0.4)
+                (self.output_dir / "late.txt").write_text("never")
+
+        out = tmp_path / "out"
+        runner = BlockingRunner("block", limits=ResourceLimits(max_wall_sec=0.1, check_interval_sec=0.02))
+        with pytest.raises(ResourceLimitExceeded):
+            runner.run(RecipeConfig("block", str(input_file), output_dir=str(out)))
+        assert not (out / "late.txt").exists()
+        assert runner.result.metrics["stages"]["block"]["status"] == "failed"
+
+    def test_run_isolated_hard_kills_stuck_run(self, tmp_path, input_file):
+        """run_isolated ends a run blocked past its limit and records the failure."""
+        import time
+
+        from agent_recipes.recipe_runtime.limits import ResourceLimitExceeded, ResourceLimits
+
+        class StuckRunner(RecipeRunner):
+            def _execute(self, config):
+                with self.stage("stuck"):
+                    time.sleep(30)
+
+        out = tmp_path / "out"
+        runner = StuckRunner("stuck", limits=ResourceLimits(max_wall_sec=0.2, check_interval_sec=0.05))
+        start = time.time()
+        with pytest.raises(ResourceLimitExceeded) as exc_info:
+            runner.run_isolated(RecipeConfig("stuck", str(input_file), output_dir=str(out)), kill_grace_sec=0.2)
+
+        assert time.time() - start < 5
+        assert exc_info.value.limit == "wall_sec"
+        run_json = json.loads((out / "run.json").read_text())
+        assert run_json["status"] == "failed"
+        assert "wall_sec" in run_json["error"]
+        assert run_json["metrics"]["stages"]["stuck"]["status"] == "interrupted"
+
+    def test_run_isolated_returns_child_result(self, tmp_path, input_file):
+        """A well-behaved isolated run returns the child's result."""
+        out = tmp_path / "out"
+        runner = EchoRunner()
+        result = runner.run_isolated(RecipeConfig("echo", str(input_file), output_dir=str(out)))
+        assert result.status == "success"
+        assert runner.result.to_dict() == json.loads((out / "run.json").read_text())
+
+    def test_output_bytes_limit_kills_subprocess(self, tmp_path, input_file):
+        """Exceeding max_output_bytes should kill the running subprocess."""
+        import sys
+
+        from agent_recipes.recipe_runtime.limits import ResourceLimitExceeded, ResourceLimits
+
+        class WriterRunner(RecipeRunner):
+            def _execute(self, config):
+                script = (
+                    "import time\n"
+                    f"f = open({str(self.output_dir / 'big.bin')!r}, 'wb')\n"
+                    "while True:\n"
+                    "    f.write(b'x' * 65536); f.flush(); time.sleep(0.01)\n"
+                )
+                self.run_subprocess([sys.executable, "-c", script], timeout=10)
+
+        limits = ResourceLimits(max_output_bytes=256 * 1024, check_interval_sec=0.05)
+        with pytest.raises(ResourceLimitExceeded) as exc_info:
+            WriterRunner("writer", limits=limits).run(
+                RecipeConfig("writer", str(input_file), output_dir=str(tmp_path / "out"))
+            )
+        assert exc_info.value.limit == "output_bytes"
+
+    def test_max_subprocesses_bounds_concurrency(self, tmp_path, input_file):
+        """run_subprocess should never run more than max_subprocesses at once."""
+        import sys
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        from agent_recipes.recipe_runtime.limits import ResourceLimits
+
+        class ParallelRunner(RecipeRunner):
+            def _execute(self, config):
+                cmd = [sys.executable, "-c", "import time; time.sleep(0.3)"]
+                with ThreadPoolExecutor(4) as pool:
+                    list(pool.map(lambda _: self.run_subprocess(cmd, check=True), range(4)))
+
+        start = time.time()
+        ParallelRunner("par", limits=ResourceLimits(max_subprocesses=2)).run(
+            RecipeConfig("par", str(input_file), output_dir=str(tmp_path / "out"))
+        )
+        # Four 0.3s processes through two slots take at least two rounds
+        assert time.time() - start >= 0.6
+
+    def test_admission_controller_queues_runs(self):
+        """Runs beyond max_concurrent_runs should wait for a free slot."""
+        import threading
+
+        from agent_recipes.recipe_runtime.limits import AdmissionController, AdmissionTimeout
+
+        controller = AdmissionController(max_concurrent_runs=1, poll_interval_sec=0.01)
+        controller.acquire()
+        with pytest.raises(AdmissionTimeout):
+            controller.acquire(timeout=0.05)
+
+        threading.Timer(0.1, controller.release).start()
+        waited = controller.acquire(timeout=2)
+        assert waited >= 0.05
+        assert controller.active == 1
+        controller.release()
+        assert controller.active == 0 and controller.waiting == 0
+
+    def test_runner_reports_admission_wait(self, tmp_path, input_file):
+        """Admitted runs should record their queue time."""
+        from agent_recipes.recipe_runtime.limits import AdmissionController
+
+        runner = EchoRunner()
+        runner.admission = AdmissionController(max_concurrent_runs=1)
+        result = runner.run(RecipeConfig("echo", str(input_file), output_dir=str(tmp_path / "out")))
+
+        assert "admission_wait_sec" in result.metrics
+        assert runner.admission.active == 0
@@ -0,0 +1,143 @@
+"""
+Unit tests for the warm recipe server.
+"""
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+import pytest
+
+import agent_recipes
+from agent_recipes.server import (
+    INVALID_PARAMS,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    SERVER_ERROR,
+    SOCKET_ENV,
+    RecipeClient,
+    RecipeServer,
+    RecipeServerError,
+)
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to ~100 characters, so avoid tmp_path
+    directory = tempfile.mkdtemp(prefix="ar-")
+    yield os.path.join(directory, "server.sock")
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def running_server(socket_path):
+    server = RecipeServer(workers=2)
+    server.methods["run_recipe"] = lambda recipe_name, **kwargs: {"output": f"remote:{recipe_name}"}
+    thread = threading.Thread(target=server.serve_unix, args=(socket_path,), daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not os.path.exists(socket_path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    yield server
+    RecipeClient(socket_path).call("shutdown")
+    thread.join(timeout=5)
+
+
+class TestRecipeServer:
+    """Tests for RecipeServer and RecipeClient."""
+
+    def test_handle_errors(self):
+        """Malformed requests and unknown methods return JSON-RPC errors."""
+        server = RecipeServer()
+        assert server.handle("{not json")["error"]["code"] == PARSE_ERROR
+        response = server.handle(json.dumps({"jsonrpc": "2.0", "id": 7, "method": "nope"}))
+        assert response["id"] == 7
+        assert response["error"]["code"] == METHOD_NOT_FOUND
+
+    def test_invalid_params_vs_recipe_type_error(self):
+        """Only argument binding failures are INVALID_PARAMS."""
+        server = RecipeServer()
+
+        def _broken(recipe_name, **kwargs):
+            return None + 1
+
+        server.methods["run_recipe"] = _broken
+        bad = server.handle(json.dumps({"jsonrpc": "2.0", "id": 1, "method": "ping", "params": {"x": 1}}))
+        assert bad["error"]["code"] == INVALID_PARAMS
+        failed = server.handle(json.dumps(
+            {"jsonrpc": "2.0", "id": 2, "method": "run_recipe", "params": {"recipe_name": "demo"}}
+        ))
+        assert failed["error"]["code"] == SERVER_ERROR
+        assert failed["error"]["message"].startswith("TypeError")
+
+    def test_stdio_round_trip(self):
+        """Requests read from stdin are answered on stdout by id."""
+        server = RecipeServer(workers=2)
+        stdin = io.StringIO(
+            json.dumps({"jsonrpc": "2.0", "id": 1, "method": "ping"}) + "\n"
+            + json.dumps({"jsonrpc": "2.0", "id": 2, "method": "list_templates"}) + "\n"
+        )
+        stdout = io.StringIO()
+        server.serve_stdio(stdin, stdout)
+        responses = {r["id"]: r for r in map(json.loads, stdout.getvalue().splitlines())}
+        assert responses[1]["result"] == "pong"
+        assert responses[2]["result"] == agent_recipes.list_templates()
+
+    def test_stdio_prints_go_to_stderr(self, capsys):
+        """Output printed by a recipe does not reach the response stream."""
+        server = RecipeServer(workers=1)
+
+        def _noisy(recipe_name, **kwargs):
+            print("progress: 50%")
+            return {"output": recipe_name}
+
+        server.methods["run_recipe"] = _noisy
+        stdin = io.StringIO(json.dumps(
+            {"jsonrpc": "2.0", "id": 1, "method": "call_recipe", "params": {"recipe_name": "demo"}}
+        ) + "\n")
+        stdout = io.StringIO()
+        server.serve_stdio(stdin, stdout)
+        assert [json.loads(line)["result"] for line in stdout.getvalue().splitlines()] == ["demo"]
+        assert "progress: 50%" in capsys.readouterr().err
+
+    def test_unix_socket_client(self, running_server, socket_path):
+        """A client reuses one connection for several calls."""
+        client = RecipeClient(socket_path)
+        assert client.call("ping") == "pong"
+        assert client.call_recipe("demo") == "remote:demo"
+        with pytest.raises(RecipeServerError):
+            client.call("missing")
+        client.close()
+
+    def test_run_recipe_dispatches_to_server(self, running_server, socket_path, monkeypatch):
+        """run_recipe uses the server named by AGENT_RECIPES_SOCKET."""
+        monkeypatch.setenv(SOCKET_ENV, socket_path)
+        assert agent_recipes.run_recipe("demo") == {"output": "remote:demo"}
+        assert agent_recipes.call_recipe("demo") == "remote:demo"
+
+    def test_concurrent_calls_do_not_serialize(self, running_server, socket_path):
+        """Calls from several threads on one client run concurrently."""
+        def _slow(recipe_name, **kwargs):
+            time.sleep(0.3)
+            return {"output": recipe_name}
+
+        running_server.methods["run_recipe"] = _slow
+        client = RecipeClient(socket_path)
+        results = []
+        threads = [
+            threading.Thread(target=lambda n=n: results.append(client.call_recipe(f"r{n}")))
+            for n in range(2)
+        ]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert time.monotonic() - start < 0.55
+        assert sorted(results) == ["r0", "r1"]
+        assert len(client._idle) == 2
+        client.close()
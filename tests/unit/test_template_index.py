@@ -0,0 +1,104 @@
+"""
+Unit tests for the template index.
+"""
+
+import os
+
+import pytest
+
+import agent_recipes
+from agent_recipes.template_index import TemplateIndex
+
+
+def _make_template(root, name, tools=False, requires=None):
+    path = root / name
+    path.mkdir()
+    lines = ["metadata:", f"  name: {name}"]
+    if requires:
+        lines += ["  requires:", "    env:"] + [f"      - {env}" for env in requires]
+    (path / "agents.yaml").write_text("\n".join(lines) + "\n")
+    if tools:
+        (path / "tools.py").write_text("TOOLS = {}\n")
+    return path
+
+
+@pytest.fixture
+def templates_dir(tmp_path):
+    root = tmp_path / "templates"
+    root.mkdir()
+    _make_template(root, "alpha", tools=True, requires=["OPENAI_API_KEY"])
+    _make_template(root, "beta")
+    (root / "__pycache__").mkdir()
+    (root / ".hidden").mkdir()
+    return root
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    path = tmp_path / "manifest.yaml"
+    path.write_text(
+        "templates:\n"
+        "  beta:\n"
+        "    name: Beta\n"
+        "    version: 2.0.0\n"
+        "    tags: [video, audio]\n"
+        "    requires:\n"
+        "      packages: [ffmpeg]\n"
+        "  missing:\n"
+        "    name: Missing\n"
+    )
+    return path
+
+
+class TestTemplateIndex:
+    """Tests for TemplateIndex."""
+
+    def test_indexes_templates_and_manifest(self, templates_dir, manifest):
+        """Templates on disk are indexed and enriched from the manifest."""
+        index = TemplateIndex(templates_dir, manifest_path=manifest)
+        assert index.names() == ["alpha", "beta"]
+        assert "missing" not in index
+
+        alpha = index.get("alpha")
+        assert alpha.path == templates_dir / "alpha"
+        assert alpha.has_tools and alpha.has_agents_yaml
+        assert alpha.requires == {"env": ["OPENAI_API_KEY"]}
+
+        beta = index.get("beta")
+        assert not beta.has_tools
+        assert beta.version == "2.0.0"
+        assert beta.requires == {"packages": ["ffmpeg"]}
+        assert index.by_tag("video") == ["beta"]
+
+    def test_lookups_do_not_touch_filesystem(self, templates_dir, manifest, monkeypatch):
+        """Lookups within the check interval are served from memory."""
+        index = TemplateIndex(templates_dir, manifest_path=manifest, check_interval=60)
+        index.names()
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("filesystem accessed")
+
+        monkeypatch.setattr(os, "stat", _fail)
+        monkeypatch.setattr(os, "scandir", _fail)
+        for _ in range(100):
+            assert index.get("alpha").has_tools
+
+    def test_rebuilds_when_directory_changes(self, templates_dir, manifest):
+        """Adding a template changes the directory mtime and rebuilds the index."""
+        index = TemplateIndex(templates_dir, manifest_path=manifest, check_interval=0)
+        assert "gamma" not in index
+
+        _make_template(templates_dir, "gamma")
+        stat = os.stat(templates_dir)
+        os.utime(templates_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert "gamma" in index
+
+    def test_package_helpers(self):
+        """list_templates and get_template_path use the bundled index."""
+        names = agent_recipes.list_templates()
+        assert names == sorted(names)
+        assert "__pycache__" not in names
+        if names:
+            assert agent_recipes.get_template_path(names[0]).is_dir()
+        with pytest.raises(ValueError):
+            agent_recipes.get_template_path("no-such-template")
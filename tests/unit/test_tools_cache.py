@@ -0,0 +1,54 @@
+"""
+Unit tests for the recipe tools.py module cache.
+"""
+
+import os
+import sys
+
+import pytest
+
+from agent_recipes.tools_cache import load_tools, reload_tools
+
+
+@pytest.fixture
+def tools_py(tmp_path):
+    path = tmp_path / "tools.py"
+    path.write_text(
+        "LOADS = []\n"
+        "LOADS.append(1)\n"
+        "def greet():\n"
+        "    return 'hi'\n"
+        "TOOLS = {'greet': greet}\n"
+    )
+    yield path
+    reload_tools(path)
+
+
+class TestToolsCache:
+    """Tests for load_tools and reload_tools."""
+
+    def test_module_loaded_once(self, tools_py):
+        """Repeated loads reuse the module and its registry."""
+        first = load_tools(tools_py, "cache_test_tools")
+        second = load_tools(tools_py, "cache_test_tools")
+        assert second.module is first.module
+        assert second.registry["greet"]() == "hi"
+        assert sys.modules["cache_test_tools"] is first.module
+
+    def test_changed_file_is_reloaded(self, tools_py):
+        """A new mtime or size invalidates the cached module."""
+        first = load_tools(tools_py, "cache_test_tools")
+        tools_py.write_text("def get_all_tools():\n    def other():\n        pass\n    return [other]\n")
+        stat = os.stat(tools_py)
+        os.utime(tools_py, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = load_tools(tools_py, "cache_test_tools")
+        assert second.module is not first.module
+        assert list(second.registry) == ["other"]
+
+    def test_reload_hook(self, tools_py):
+        """reload_tools forces the module to be executed again."""
+        first = load_tools(tools_py, "cache_test_tools")
+        reload_tools(tools_py)
+        assert "cache_test_tools" not in sys.modules
+        second = load_tools(tools_py, "cache_test_tools")
+        assert second.module is not first.module